@@ -0,0 +1,187 @@
+"""
+run matpak benchmarks suite: multiplication kernels, file importers and memory usage.
+
+each case is timed (best of --repeat runs) and run once more under tracemalloc to measure its peak memory.
+results are written as JSON, and could be compared against a saved baseline; the run fails if any case is
+slower than baseline by more than --threshold.
+
+from root dir:
+    PYTHONPATH=src python benchmarks/run.py --sizes 32 64 --output bench.json
+    PYTHONPATH=src python benchmarks/run.py --sizes 32 64 --baseline bench.json --threshold 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from decimal import Decimal
+
+import matpak
+from matpak import Matrix, SparseMatrix, Vector
+
+
+# generated sparse inputs keep this share of elements nonzero
+SPARSE_DENSITY = 0.05
+
+
+def rand_el(dtype: str):
+    if dtype == "decimal":
+        return Decimal(random.randint(-9999, 9999)) / 100
+    return random.randint(-9999, 9999) / 100
+
+
+def rand_rows(rows: int, cols: int, dtype: str, sparse: bool) -> list:
+    if not sparse:
+        return [[rand_el(dtype) for _ in range(cols)] for _ in range(rows)]
+
+    zero = Decimal(0) if dtype == "decimal" else 0.0
+    return [[rand_el(dtype) if random.random() < SPARSE_DENSITY else zero for _ in range(cols)] for _ in range(rows)]
+
+
+def write_text(path: str, rows: list, sep: str = ','):
+    with open(path, "w") as f:
+        f.write('\n'.join(sep.join(format(el, 'f') for el in row) for row in rows))
+
+
+def cases(n: int, dtype: str, kind: str, tmp_dir: str):
+    """
+    yield (name, ops, fn) benchmark cases of size n; ops is the count of scalar operations (or parsed elements)
+    done by fn, used to report ops/sec.
+    """
+    sparse = kind == "sparse"
+    lhs = Matrix(n, n, rand_rows(n, n, dtype, sparse), dtype)
+    rhs = Matrix(n, n, rand_rows(n, n, dtype, False), dtype)
+    vec = Vector(n, [rand_el(dtype) for _ in range(n)], dtype)
+    row = Matrix(1, n, [[rand_el(dtype) for _ in range(n)]], dtype)
+
+    yield "mat.multiply", 2 * n ** 3, lambda: lhs.multiply(rhs)
+    yield "mat.multiply_transposed", 2 * n ** 3, lambda: lhs.multiply(rhs.T)
+    yield "mat.multiply_strassen", 2 * n ** 3, lambda: lhs.multiply_strassen(rhs)
+    yield "mat.multiply_col_major", 2 * n ** 3, lambda: lhs.multiply_col_major(rhs)
+    yield "mat.multiply_vec", 2 * n ** 2, lambda: lhs.multiply(vec)
+    yield "vec.multiply", n ** 2, lambda: vec.multiply(row)
+
+    if sparse:
+        sp = SparseMatrix.from_dense(lhs)
+        yield "sparse.multiply", 2 * sp.nnz * n, lambda: sp.multiply(rhs)
+
+    mat_file = os.path.join(tmp_dir, f"mat_{n}_{dtype}_{kind}.txt")
+    vec_file = os.path.join(tmp_dir, f"vec_{n}_{dtype}.txt")
+    write_text(mat_file, lhs.tolist())
+    write_text(vec_file, [[el] for el in vec.tolist()])
+
+    yield "imp_mat_file", n * n, lambda: matpak.imp_mat_file(mat_file, dtype=dtype)
+    yield "imp_vec_file", n, lambda: matpak.imp_vec_file(vec_file, dtype=dtype)
+
+
+def measure(fn, repeat: int) -> tuple[float, int]:
+    wall = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        wall = min(wall, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return wall, peak
+
+
+def run(args) -> list[dict]:
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n in args.sizes:
+            for dtype in args.dtypes:
+                for kind in args.inputs:
+                    for name, ops, fn in cases(n, dtype, kind, tmp_dir):
+                        if args.filter and args.filter not in name:
+                            continue
+
+                        wall, peak = measure(fn, args.repeat)
+                        results.append({
+                            "name": name, "size": n, "dtype": dtype, "input": kind,
+                            "wall": wall, "ops_per_sec": ops / wall if wall > 0 else 0.0, "peak_bytes": peak,
+                        })
+                        print(f"{name:<24} {n:>6} {dtype:>8} {kind:>7} {wall:>10.4f}s "
+                              f"{results[-1]['ops_per_sec']:>14.0f} ops/s {peak / 1024:>10.1f} KiB")
+
+    return results
+
+
+def key(result: dict) -> tuple:
+    return result["name"], result["size"], result["dtype"], result["input"]
+
+
+def compare(results: list[dict], baseline_file: str, threshold: float) -> list[str]:
+    """
+    compare results against baseline results file.
+
+    :return: list of regression messages; empty if no case is slower than baseline by more than threshold.
+    """
+    with open(baseline_file) as f:
+        baseline = {key(r): r for r in json.load(f)["results"]}
+
+    regressions = []
+    for r in results:
+        base = baseline.get(key(r))
+        if base is None or base["wall"] <= 0:
+            continue
+
+        ratio = r["wall"] / base["wall"]
+        if ratio > 1 + threshold:
+            regressions.append(f"{r['name']} size={r['size']} dtype={r['dtype']} input={r['input']}: "
+                               f"{base['wall']:.4f}s -> {r['wall']:.4f}s ({ratio:.2f}x)")
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[32, 64, 128])
+    parser.add_argument("--dtypes", nargs="+", choices=["decimal", "float64"], default=["decimal", "float64"])
+    parser.add_argument("--inputs", nargs="+", choices=["dense", "sparse"], default=["dense", "sparse"])
+    parser.add_argument("--filter", help="only run cases whose name contains this text")
+    parser.add_argument("--backend", choices=["pure", "numpy", "auto"], default="pure")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare results against this JSON results file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown ratio over baseline")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    matpak.set_backend(args.backend)
+
+    results = run(args)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "meta": {
+                    "python": platform.python_version(), "platform": platform.platform(),
+                    "backend": args.backend, "repeat": args.repeat, "timestamp": time.time(),
+                },
+                "results": results,
+            }, f, indent=2)
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.threshold)
+        for msg in regressions:
+            print(f"REGRESSION {msg}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
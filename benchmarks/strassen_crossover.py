@@ -0,0 +1,49 @@
+"""
+compare classical and Strassen multiplication of square matrices to find out where the crossover pays off.
+
+from root dir:
+    PYTHONPATH=src python benchmarks/strassen_crossover.py --sizes 64 128 256 --crossovers 16 32 64
+"""
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from matpak import Matrix
+
+
+def rand_mat(n: int, dtype: str) -> Matrix:
+    if dtype == "decimal":
+        return Matrix(n, n, [[Decimal(random.randint(-999, 999)) / 8 for _ in range(n)] for _ in range(n)])
+    return Matrix(n, n, [[random.uniform(-1.0, 1.0) for _ in range(n)] for _ in range(n)], dtype="float64")
+
+
+def timeit(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 128, 256])
+    parser.add_argument("--crossovers", type=int, nargs="+", default=[16, 32, 64, 128])
+    parser.add_argument("--dtype", choices=["decimal", "float"], default="decimal")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'crossover':>10} {'classical(s)':>13} {'strassen(s)':>12} {'speedup':>8}")
+    for n in args.sizes:
+        lhs, rhs = rand_mat(n, args.dtype), rand_mat(n, args.dtype)
+        classical = timeit(lambda: lhs.multiply(rhs), args.repeat)
+
+        for crossover in args.crossovers:
+            strassen = timeit(lambda: lhs.multiply_strassen(rhs, crossover=crossover), args.repeat)
+            print(f"{n:>6} {crossover:>10} {classical:>13.3f} {strassen:>12.3f} {classical / strassen:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
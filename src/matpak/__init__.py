@@ -1,13 +1,53 @@
-from .io import imp_mat_file, imp_vec_file
+from .io import (imp_mat_file, imp_vec_file, iter_mat_rows, imp_sparse_mat_file, exp_mat_file, exp_vec_file,
+                 exp_mat_product_file, MatrixWriter)
+from .aio import aimp_mat_file, aimp_vec_file, aimp_mat_files, amultiply
+from .binio import save_mat_bin, load_mat_bin, save_vec_bin, load_vec_bin
 from .mat import Matrix
+from .transposed import TransposedMatrix
 from .vec import Vector
+from .sparse import SparseMatrix
+from .lazy import LazyProduct
+from .cache import ImportCache, ProductCache, set_product_cache, get_product_cache, use_product_cache
+from .frozen import FrozenMatrix
+from .pool import BufferPool
+from .parallel import parallel_multiply
+from .fused import gemm, gemv
+from .ooc import DiskMatrix, ooc_multiply
+from .linalg import LUFactorization, CholeskyFactorization
+from .backend import set_backend, get_backend, use_backend
+from .config import set_precision, use_precision, get_decimal_context
+from .instrument import (set_instrumentation, get_instrumentation, use_instrumentation, add_hook, remove_hook,
+                         stats, reset_stats)
 
 from .types import *
 
 __all__ = [
     # utility funcs
-    "imp_mat_file", "imp_vec_file",
+    "imp_mat_file", "imp_vec_file", "iter_mat_rows", "imp_sparse_mat_file",
+    "exp_mat_file", "exp_vec_file", "exp_mat_product_file",
+    "save_mat_bin", "load_mat_bin", "save_vec_bin", "load_vec_bin",
+
+    # async funcs
+    "aimp_mat_file", "aimp_vec_file", "aimp_mat_files", "amultiply",
+
+    # computation funcs
+    "parallel_multiply", "ooc_multiply", "gemm", "gemv",
+
+    # backend funcs
+    "set_backend", "get_backend", "use_backend",
+
+    # config funcs
+    "set_precision", "use_precision", "get_decimal_context",
+
+    # cache funcs
+    "set_product_cache", "get_product_cache", "use_product_cache",
+
+    # instrumentation funcs
+    "set_instrumentation", "get_instrumentation", "use_instrumentation", "add_hook", "remove_hook",
+    "stats", "reset_stats",
 
     # classes
-    "Matrix", "Vector",
+    "Matrix", "TransposedMatrix", "FrozenMatrix", "Vector", "SparseMatrix", "LazyProduct", "ImportCache",
+    "ProductCache", "BufferPool",
+    "MatrixWriter", "DiskMatrix", "LUFactorization", "CholeskyFactorization",
 ]
@@ -0,0 +1,180 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from functools import partial
+from typing import Iterable
+
+from .errors import MultiplicationDimensionMismatched
+from .io import imp_mat_file, imp_vec_file
+from .mat import Matrix
+from .transposed import TransposedMatrix
+from .types import dtype_t
+from .vec import Vector
+from . import config, fixed, instrument, kernels
+
+
+# asyncio counterparts of blocking matpak APIs. blocking work runs in an executor: the one passed to each call,
+# else the one set by set_executor(), else the event loop default (thread pool) executor. process pool executors
+# are supported too, since Matrix and Vector are picklable. matpak decimal context of the caller (see
+# matpak.use_precision()) is carried into executor workers.
+
+DEFAULT_BLOCK_ROWS = 32
+
+_executor: Executor | None = None
+
+
+def set_executor(executor: Executor | None):
+    """
+    set executor that blocking reads and kernels of async APIs run in.
+
+    :param executor: concurrent.futures executor; or None to use event loop default executor.
+    """
+    global _executor
+    _executor = executor
+
+
+def get_executor() -> Executor | None:
+    """
+    get executor that blocking reads and kernels of async APIs run in.
+
+    :return: executor; or None if event loop default executor is used.
+    """
+    return _executor
+
+
+async def _run(executor: Executor | None, fn, *args, **kwargs):
+    call = partial(config.call_in, config.configured(), fn, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor or _executor, call)
+
+
+async def aimp_mat_file(file: str, sep: str = ',', dtype: dtype_t = "decimal", executor: Executor | None = None) -> Matrix:
+    """
+    async version of imp_mat_file(); file is read and parsed in executor.
+
+    :param file: path to matrix file.
+    :param sep: file's elements separator char; by default, it is comma ','.
+    :param dtype: elements storage type of matrix; "decimal" by default.
+    :param executor: executor to read file in; by default, the configured one.
+
+    :return: Matrix
+    """
+    return await _run(executor, imp_mat_file, file, sep, dtype)
+
+
+async def aimp_vec_file(file: str, dtype: dtype_t = "decimal", executor: Executor | None = None) -> Vector:
+    """
+    async version of imp_vec_file(); file is read and parsed in executor.
+
+    :param file: path to vector file.
+    :param dtype: elements storage type of vector; "decimal" by default.
+    :param executor: executor to read file in; by default, the configured one.
+
+    :return: Vector
+    """
+    return await _run(executor, imp_vec_file, file, dtype)
+
+
+async def aimp_mat_files(files: Iterable[str], sep: str = ',', dtype: dtype_t = "decimal", limit: int = 8,
+                         executor: Executor | None = None) -> list[Matrix]:
+    """
+    import many matrix files concurrently, with at most 'limit' files being read at the same time.
+
+    if any import fails, its exception is raised after all imports are done.
+
+    :param files: paths to matrix files.
+    :param sep: files' elements separator char; by default, it is comma ','.
+    :param dtype: elements storage type of matrices; "decimal" by default.
+    :param limit: max count of concurrent imports.
+    :param executor: executor to read files in; by default, the configured one.
+
+    :return: list of Matrix objects in order of files.
+    """
+    if limit <= 0:
+        raise ValueError(f"concurrency limit {limit} should be positive")
+
+    sem = asyncio.Semaphore(limit)
+
+    async def imp(file: str) -> Matrix:
+        async with sem:
+            return await aimp_mat_file(file, sep, dtype, executor)
+
+    results = await asyncio.gather(*(imp(file) for file in files), return_exceptions=True)
+
+    for res in results:
+        if isinstance(res, BaseException):
+            raise res
+
+    return results
+
+
+async def amultiply(lhs: Matrix, rhs: "Matrix | TransposedMatrix | Vector", executor: Executor | None = None,
+                    block_rows: int = DEFAULT_BLOCK_ROWS) -> "Matrix | Vector":
+    """
+    async version of Matrix.multiply().
+
+    if an executor is passed or configured, the whole product is computed by lhs.multiply(rhs) in it.
+    otherwise, product is computed in event loop thread block by block, yielding to event loop after every
+    block_rows result rows, so other tasks keep running during long products. rows are computed by the
+    strategy that lhs.multiply(rhs) takes (see Matrix.plan_multiply()), so results are the same; numpy products
+    are computed at once, as they are not split into row blocks.
+
+    :param lhs: left hand side Matrix.
+    :param rhs: right hand side, could be Matrix, TransposedMatrix or Vector but dimensions of rhs should be valid for multiplication.
+    :param executor: executor to compute product in; by default, the configured one.
+    :param block_rows: result rows count computed between two yields in cooperative mode.
+    :return: Matrix or Vector based on rhs type.
+    """
+    if executor is not None or _executor is not None:
+        return await _run(executor, lhs.multiply, rhs)
+
+    if block_rows <= 0:
+        raise ValueError(f"block rows {block_rows} should be positive")
+
+    if lhs.shape[1] != rhs.shape[0]:
+        raise MultiplicationDimensionMismatched(lhs.shape, rhs.shape)
+
+    # other operands (e.g, sparse matrices) are left to Matrix.multiply(), as well as numpy products
+    strategy = lhs.plan_multiply(rhs) if isinstance(rhs, (Matrix, TransposedMatrix, Vector)) else None
+    if strategy in (None, "numpy"):
+        return lhs.multiply(rhs)
+
+    rows = lhs.shape[0]
+    start_time = time.perf_counter()
+
+    if strategy != "vec":
+        if strategy == "dot_rows":
+            dtype, lhs_raw, cols = lhs._operands(rhs.T)
+        elif strategy == "dot_cached":
+            dtype, lhs_raw, cols = lhs.dtype, lhs.raw, rhs._transposed().raw
+        else:
+            dtype, lhs_raw, rhs_raw = lhs._operands(rhs)
+            cols = kernels.transpose(rhs_raw)
+
+        res = Matrix(rows, rhs.shape[1], dtype=dtype)
+
+        for start in range(0, rows, block_rows):
+            with config.scope():
+                kernels.mul_dot_cols(lhs_raw[start:start + block_rows], cols, res.raw[start:start + block_rows])
+            await asyncio.sleep(0)
+    else:
+        dtype, lhs_raw, rhs_raw = lhs._operands(rhs)
+        res = Vector(rows, dtype=dtype)
+
+        for start in range(0, rows, block_rows):
+            out = [None] * len(lhs_raw[start:start + block_rows])
+            with config.scope():
+                kernels.mul_vec(lhs_raw[start:start + block_rows], rhs_raw, out)
+            kernels._store(res.raw, out, start, start + len(out))
+            await asyncio.sleep(0)
+
+    if dtype == "fixed":
+        scale = max(lhs.scale, rhs.scale)
+        fixed.rescale(res.raw if isinstance(res, Matrix) else [res.raw], lhs.scale + rhs.scale, scale)
+        res._changed(scale)
+
+    if instrument.enabled:
+        instrument.record("multiply", op="amultiply", lhs_shape=lhs.shape, rhs_shape=rhs.shape, dtype=dtype,
+                          algorithm=strategy,
+                          elapsed=time.perf_counter() - start_time, flops=2 * rows * lhs.shape[1] * rhs.shape[1])
+
+    return res
@@ -0,0 +1,113 @@
+import os
+import secrets
+
+
+# exported files are written to a temp file next to their path, which replaces the path atomically once all of
+# it is written and synced to disk, so readers never see a partial file and a failed write leaves it untouched.
+# the directory is synced after the rename too, so the replaced file survives a crash.
+
+
+def create_temp(file: str) -> tuple[int, str]:
+    """
+    create a new temp file next to file for reading and writing. it is created with 0666 mode like open() does,
+    so process umask is applied by the kernel and file gets the default mode once temp file replaces it.
+
+    :param file: path that temp file would replace.
+    :return: a tuple of file descriptor and temp file path.
+    """
+    directory, name = os.path.split(os.path.abspath(file))
+    flags = os.O_RDWR | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+    while True:
+        tmp_path = os.path.join(directory, f"{name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def sync_dir(path: str):
+    """
+    flush directory entries of path to disk, so renames in it are durable; it is a no-op on platforms that
+    could not open directories (e.g, windows).
+
+    :param path: path to directory.
+    """
+    if os.name != "posix":
+        return
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class AtomicFile:
+    def __init__(self, file: str, mode: str = "w+b", **kwargs):
+        """
+        open a temp file next to file, which replaces file on commit(). as a context manager, the temp file object
+        is returned on enter, and it is committed on a successful exit or removed otherwise.
+
+        :param file: path to file; it is overwritten on commit() if exists.
+        :param mode: mode of temp file object, see open(); it could be read and written in both modes.
+        :param kwargs: other arguments of open(), e.g, encoding and newline of a text file.
+        """
+        self.file = file
+        fd, self.tmp_path = create_temp(file)
+
+        try:
+            self.f = os.fdopen(fd, mode, **kwargs)
+        except BaseException:
+            os.close(fd)
+            os.remove(self.tmp_path)
+            raise
+
+    def __enter__(self):
+        return self.f
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    @property
+    def closed(self) -> bool:
+        """
+        check whether temp file is committed or aborted.
+
+        :return: bool
+        """
+        return self.f.closed
+
+    def commit(self):
+        """
+        flush temp file to disk and atomically replace file by it, then sync the directory so the rename is
+        durable; temp file is removed if it fails.
+        """
+
+        if self.f.closed:
+            return
+
+        try:
+            self.f.flush()
+            os.fsync(self.f.fileno())
+            self.f.close()
+            os.replace(self.tmp_path, self.file)
+        except BaseException:
+            self.abort()
+            raise
+
+        sync_dir(os.path.dirname(self.tmp_path))
+
+    def abort(self):
+        """
+        close and remove temp file; file is left untouched.
+        """
+        self.f.close()
+
+        try:
+            os.remove(self.tmp_path)
+        except FileNotFoundError:
+            pass
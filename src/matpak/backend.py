@@ -0,0 +1,86 @@
+from contextlib import contextmanager
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# registry of computation backends; value tells whether backend is usable in current installation.
+# "pure" always works, "numpy" is only available if NumPy is installed and "auto" picks numpy when it is available.
+BACKENDS: dict[str, bool] = {
+    "pure": True,
+    "numpy": np is not None,
+}
+
+_backend = "auto"
+
+
+def set_backend(name: str):
+    """
+    select computation backend globally.
+
+    :param name: "pure", "numpy" or "auto".
+    """
+    global _backend
+
+    if name != "auto" and name not in BACKENDS:
+        raise ValueError(f"unknown backend '{name}', it should be one of {['auto', *BACKENDS]}")
+
+    if name != "auto" and not BACKENDS[name]:
+        raise ImportError(f"backend '{name}' is not available in current installation")
+
+    _backend = name
+
+
+def get_backend() -> str:
+    """
+    get selected computation backend.
+
+    :return: "pure", "numpy" or "auto".
+    """
+    return _backend
+
+
+def active_backend() -> str:
+    """
+    get backend that computations run on; "auto" is resolved to "numpy" if NumPy is installed, else "pure".
+
+    :return: "pure" or "numpy".
+    """
+    if _backend == "auto":
+        return "numpy" if BACKENDS["numpy"] else "pure"
+
+    return _backend
+
+
+@contextmanager
+def use_backend(name: str):
+    """
+    select computation backend in a with block and restore previous one on exit.
+
+    :param name: "pure", "numpy" or "auto".
+    """
+    prev = _backend
+    set_backend(name)
+
+    try:
+        yield
+    finally:
+        set_backend(prev)
+
+
+def numpy_enabled(*operands) -> bool:
+    """
+    check whether operands should be computed by numpy kernels; that is when numpy backend is active and all
+    operands are float64.
+
+    :param operands: Matrix or Vector objects.
+    :return: bool
+    """
+    return active_backend() == "numpy" and all(op.dtype == "float64" for op in operands)
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for this operation, install it with 'pip install numpy'")
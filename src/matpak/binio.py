@@ -0,0 +1,230 @@
+import mmap
+import struct
+import sys
+from array import array
+from decimal import Decimal
+
+from .atomic import AtomicFile
+from .errors import MatrixFileInvalid, VectorFileInvalid
+from .mat import Matrix
+from .vec import Vector
+from . import instrument
+
+
+# binary file layout:
+#   header (32 bytes, little-endian fields):
+#       magic      4s  b"MPAK"
+#       version    B   format version
+#       kind       B   0 for matrix, 1 for vector
+#       dtype      B   0 for float64, 1 for decimal, 2 for fixed
+#       endianness c   b'<' or b'>'; byte order of float64 payload
+#       scale      q   scale of fixed elements; 0 for other dtypes (it was a reserved zero field before fixed dtype)
+#       rows       Q
+#       cols       Q   1 for vectors
+#   payload:
+#       float64: rows*cols C doubles in row-major order, 8 bytes aligned.
+#       decimal: rows*cols elements in row-major order as ASCII text, separated by '\n'.
+#       fixed: rows*cols raw ints (element * 10**scale) in row-major order as ASCII text, separated by '\n'.
+
+BIN_MAGIC = b"MPAK"
+BIN_VERSION = 1
+
+_HEADER = struct.Struct("<4sBBBcqQQ")
+
+_KIND_MAT = 0
+_KIND_VEC = 1
+
+_DTYPE_CODES = {"float64": 0, "decimal": 1, "fixed": 2}
+_DTYPE_NAMES = {code: name for name, code in _DTYPE_CODES.items()}
+
+_NATIVE_ENDIAN = b'<' if sys.byteorder == "little" else b'>'
+
+# payload offset of every binary file
+HEADER_SIZE = _HEADER.size
+
+
+def _write(file: str, kind: int, dtype: str, scale: int | None, rows: int, cols: int, elements,
+           buf: memoryview | None):
+    with AtomicFile(file) as f:
+        f.write(_HEADER.pack(BIN_MAGIC, BIN_VERSION, kind, _DTYPE_CODES[dtype], _NATIVE_ENDIAN, scale or 0, rows, cols))
+
+        if buf is not None:
+            f.write(buf)
+        else:
+            f.write('\n'.join(map(str, elements)).encode("ascii"))
+
+
+def _read_header(f, file: str, kind: int, err: type) -> tuple[str, bytes, int, int, int]:
+    """
+    read and validate header of a matpak binary file.
+
+    :return: a tuple of dtype, payload byte order, scale, rows count and cols count.
+    """
+    header = f.read(_HEADER.size)
+
+    if len(header) != _HEADER.size:
+        raise err(file, "is too short to be a matpak binary file")
+
+    magic, version, file_kind, dtype_code, endian, scale, rows, cols = _HEADER.unpack(header)
+
+    if (magic != BIN_MAGIC or version != BIN_VERSION or dtype_code not in _DTYPE_NAMES or endian not in (b'<', b'>')
+            or scale < 0):
+        raise err(file, "is not a matpak binary file or its version is not supported")
+
+    if file_kind != kind:
+        raise err(file, f"contains a {'matrix' if file_kind == _KIND_MAT else 'vector'}")
+
+    return _DTYPE_NAMES[dtype_code], endian, scale, rows, cols
+
+
+def read_mat_header(f, file: str) -> tuple[str, bool, int, int, int]:
+    """
+    read and validate header of a matpak binary matrix file, which is opened in binary mode; file position is
+    left at the start of payload.
+
+    if there is any issue, an exception would be raised. beside standard exceptions, there are following
+    custom exceptions that would be raised in special scenarios:
+        1- file is not a matpak binary matrix file or it is truncated: MatrixFileInvalid
+
+    :param f: binary file object positioned at its start.
+    :param file: path to file, reported in exceptions.
+    :return: a tuple of dtype, whether float64 payload is in native byte order, scale, rows count and cols count.
+    """
+    dtype, endian, scale, rows, cols = _read_header(f, file, _KIND_MAT, MatrixFileInvalid)
+    return dtype, endian == _NATIVE_ENDIAN, scale, rows, cols
+
+
+def write_mat_header(f, rows: int, cols: int, dtype: str = "float64", scale: int = 0):
+    """
+    write header of a matpak binary matrix file, whose float64 payload is in native byte order, to a binary
+    file object; payload should be written right after it (at HEADER_SIZE offset).
+
+    :param f: binary file object.
+    :param rows: matrix rows count.
+    :param cols: matrix cols count.
+    :param dtype: elements storage type of payload.
+    :param scale: digits count after decimal point of fixed elements; 0 for other dtypes.
+    """
+    f.write(_HEADER.pack(BIN_MAGIC, BIN_VERSION, _KIND_MAT, _DTYPE_CODES[dtype], _NATIVE_ENDIAN, scale, rows, cols))
+
+
+def _read(file: str, kind: int, err: type, use_mmap: bool) -> tuple[str, int, int, int, memoryview | array | list]:
+    with open(file, "rb") as f:
+        dtype, endian, scale, rows, cols = _read_header(f, file, kind, err)
+        size = rows * cols
+
+        if dtype != "float64":
+            try:
+                payload = f.read().decode("ascii").split('\n')
+                if len(payload) != size:
+                    raise err(file, f"contains {len(payload)} elements but header declares {size}")
+                return dtype, scale, rows, cols, list(map(int if dtype == "fixed" else Decimal, payload))
+            except (ValueError, ArithmeticError):
+                raise err(file, "payload contains an element that could not be parsed") from None
+
+        nbytes = 8 * size
+
+        # map file lazily (copy-on-write, so elements could be set without changing the file); pages are read
+        # on first access, so loading time does not depend on matrix size.
+        if use_mmap and endian == _NATIVE_ENDIAN:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            if len(mm) < _HEADER.size + nbytes:
+                raise err(file, f"payload is truncated, {size} elements are expected")
+            return dtype, scale, rows, cols, memoryview(mm)[_HEADER.size:_HEADER.size + nbytes]
+
+        payload = array('d')
+        payload.frombytes(f.read(nbytes))
+        if len(payload) != size:
+            raise err(file, f"payload is truncated, {size} elements are expected")
+
+        if endian != _NATIVE_ENDIAN:
+            payload.byteswap()
+
+        return dtype, scale, rows, cols, payload
+
+
+def save_mat_bin(mat: Matrix, file: str):
+    """
+    Export matrix to a matpak binary file. float64 matrices are written as raw C doubles of native byte order,
+    decimal matrices as exact text of their elements and fixed matrices as text of their raw ints with their scale.
+
+    :param mat: matrix to be exported.
+    :param file: path to binary file; it is replaced atomically if exists.
+    """
+    rows, cols = mat.shape
+    _write(file, _KIND_MAT, mat.dtype, mat.scale, rows, cols, (el for row in mat.raw for el in row), mat.buffer)
+
+
+@instrument.imports
+def load_mat_bin(file: str, use_mmap: bool = True) -> Matrix:
+    """
+    Import matrix from a matpak binary file.
+
+    float64 matrices are backed by a copy-on-write memory map of the file, so nothing is copied or parsed
+    on load. if mmap is not used or payload byte order is not native, elements are read into memory instead.
+
+    if there is any issue, an exception would be raised. beside standard exceptions, there are following
+    custom exceptions that would be raised in special scenarios:
+        1- file is not a matpak binary matrix file or it is truncated: MatrixFileInvalid
+
+    :param file: path to binary file.
+    :param use_mmap: map float64 payload instead of reading it.
+
+    :return: Matrix
+    """
+    dtype, scale, rows, cols, payload = _read(file, _KIND_MAT, MatrixFileInvalid, use_mmap)
+
+    if dtype == "decimal":
+        return Matrix.from_flat(rows, cols, payload)
+
+    if dtype == "fixed":
+        return instrument.allocated(
+            Matrix.from_fixed(rows, cols, [payload[i:i + cols] for i in range(0, rows * cols, cols)], scale))
+
+    mat = Matrix.from_buffer(rows, cols, payload)
+
+    # a mapped payload is not allocated
+    return instrument.allocated(mat) if isinstance(payload, array) else mat
+
+
+def save_vec_bin(vec: Vector, file: str):
+    """
+    Export vector to a matpak binary file. float64 vectors are written as raw C doubles of native byte order,
+    decimal vectors as exact text of their elements and fixed vectors as text of their raw ints with their scale.
+
+    :param vec: vector to be exported.
+    :param file: path to binary file; it is replaced atomically if exists.
+    """
+    buf = memoryview(vec.raw) if vec.dtype == "float64" else None
+    _write(file, _KIND_VEC, vec.dtype, vec.scale, vec.shape[0], 1, vec.raw, buf)
+
+
+@instrument.imports
+def load_vec_bin(file: str, use_mmap: bool = True) -> Vector:
+    """
+    Import vector from a matpak binary file.
+
+    float64 vectors are backed by a copy-on-write memory map of the file, so nothing is copied or parsed
+    on load. if mmap is not used or payload byte order is not native, elements are read into memory instead.
+
+    if there is any issue, an exception would be raised. beside standard exceptions, there are following
+    custom exceptions that would be raised in special scenarios:
+        1- file is not a matpak binary vector file or it is truncated: VectorFileInvalid
+
+    :param file: path to binary file.
+    :param use_mmap: map float64 payload instead of reading it.
+
+    :return: Vector
+    """
+    dtype, scale, rows, _, payload = _read(file, _KIND_VEC, VectorFileInvalid, use_mmap)
+
+    if dtype == "decimal":
+        return Vector(rows, payload)
+
+    if dtype == "fixed":
+        return instrument.allocated(Vector.from_fixed(rows, payload, scale))
+
+    vec = Vector.from_buffer(rows, payload)
+
+    # a mapped payload is not allocated
+    return instrument.allocated(vec) if isinstance(payload, array) else vec
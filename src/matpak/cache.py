@@ -0,0 +1,339 @@
+import hashlib
+import os
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from .errors import MatrixFileInvalid, VectorFileInvalid
+from .binio import save_mat_bin, load_mat_bin, save_vec_bin, load_vec_bin
+from .io import imp_mat_file, imp_vec_file
+from .mat import Matrix
+from .types import dtype_t
+from .vec import Vector
+from . import config
+
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+DEFAULT_PRODUCT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def _nbytes(obj: "Matrix | Vector") -> int:
+    """
+    estimate memory held by elements of a matrix or vector.
+    """
+    rows, cols = obj.shape
+
+    if obj.dtype == "float64":
+        return 8 * rows * cols
+
+    sample = obj.raw[0][0] if isinstance(obj, Matrix) else obj.raw[0]
+    return rows * cols * (sys.getsizeof(sample) + 8) + rows * sys.getsizeof([])
+
+
+def _copy(obj: "Matrix | Vector") -> "Matrix | Vector":
+    rows, cols = obj.shape
+
+    if obj.dtype == "float64":
+        buf = array('d')
+        buf.frombytes((obj.buffer if isinstance(obj, Matrix) else memoryview(obj.raw)).cast('B'))
+        return Matrix.from_buffer(rows, cols, buf) if isinstance(obj, Matrix) else Vector.from_buffer(rows, buf)
+
+    if obj.dtype == "fixed":
+        if isinstance(obj, Matrix):
+            return Matrix.from_fixed(rows, cols, [list(row) for row in obj.raw], obj.scale)
+        return Vector.from_fixed(rows, list(obj.raw), obj.scale)
+
+    if isinstance(obj, Matrix):
+        return Matrix(rows, cols, [list(row) for row in obj.raw])
+
+    return Vector(rows, list(obj.raw))
+
+
+def _context_key(dtype: dtype_t) -> tuple:
+    # decimal elements are rounded to matpak precision on import, so entries are kept per precision and rounding
+    ctx = config.configured() if dtype == "decimal" else None
+    return () if ctx is None else (ctx.prec, ctx.rounding)
+
+
+class ImportCache:
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES, disk_dir: str | None = None, hash_content: bool = False):
+        """
+        initialize a cache of parsed matrix and vector files.
+
+        entries are keyed by file path, its modification time and size (or by a sha256 hash of its content if
+        hash_content is set) and import arguments, so an entry is invalidated automatically once its file changes.
+
+        there are two tiers:
+            - memory: an LRU of parsed objects holding at most max_bytes of elements; least recently used entries
+              are evicted first.
+            - disk (optional): parsed objects stored as matpak binary files in disk_dir, which are shared between
+              processes and loaded by memory mapping instead of parsing text again.
+
+        every import returns a private copy, so callers could modify results without corrupting the cache.
+
+        :param max_bytes: memory budget of memory tier.
+        :param disk_dir: directory of disk tier; or None to disable disk tier.
+        :param hash_content: key entries by content hash instead of modification time and size.
+        """
+
+        if max_bytes < 0:
+            raise ValueError(f"cache max bytes {max_bytes} should not be negative")
+
+        self.__max_bytes = max_bytes
+        self.__disk_dir = disk_dir
+        self.__hash_content = hash_content
+
+        self.__entries: OrderedDict[tuple, tuple["Matrix | Vector", int]] = OrderedDict()
+        self.__path_keys: dict[tuple, tuple] = {}
+        self.__bytes = 0
+        self.__lock = threading.Lock()
+
+        self.__stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+        if disk_dir is not None:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        get cache counters: memory hits, disk hits, misses, evictions, invalidations, entries count and bytes held
+        by memory tier.
+
+        :return: dict of counters.
+        """
+        with self.__lock:
+            return {**self.__stats, "entries": len(self.__entries), "bytes": self.__bytes}
+
+    def clear(self):
+        """
+        drop all memory tier entries; disk tier files are kept.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__path_keys.clear()
+            self.__bytes = 0
+
+    def __key(self, kind: str, file: str, args: tuple) -> tuple:
+        path = os.path.abspath(file)
+
+        if self.__hash_content:
+            with open(path, "rb") as f:
+                return kind, path, hashlib.file_digest(f, "sha256").hexdigest(), args
+
+        st = os.stat(path)
+        return kind, path, st.st_mtime_ns, st.st_size, args
+
+    def __disk_path(self, key: tuple) -> str:
+        return os.path.join(self.__disk_dir, hashlib.sha256(repr(key).encode()).hexdigest() + ".mpak")
+
+    def __put(self, key: tuple, obj: "Matrix | Vector"):
+        size = _nbytes(obj)
+
+        with self.__lock:
+            # a new key for a known path means its file has changed; drop stale entry
+            path_key = key[:2] + (key[-1],)
+            stale = self.__path_keys.get(path_key)
+            if stale is not None and stale != key and stale in self.__entries:
+                self.__bytes -= self.__entries.pop(stale)[1]
+                self.__stats["invalidations"] += 1
+
+            if size > self.__max_bytes:
+                return
+
+            if key in self.__entries:
+                self.__bytes -= self.__entries.pop(key)[1]
+
+            self.__entries[key] = obj, size
+            self.__path_keys[path_key] = key
+            self.__bytes += size
+
+            while self.__bytes > self.__max_bytes:
+                _, (_, evicted) = self.__entries.popitem(last=False)
+                self.__bytes -= evicted
+                self.__stats["evictions"] += 1
+
+    def __get(self, kind: str, file: str, args: tuple, ctx_key: tuple, load, save, imp):
+        key = self.__key(kind, file, args + ctx_key)
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+                self.__stats["hits"] += 1
+                return _copy(entry[0])
+
+        obj = None
+        disk_path = self.__disk_path(key) if self.__disk_dir is not None else None
+
+        if disk_path is not None and os.path.exists(disk_path):
+            try:
+                obj = load(disk_path)
+                with self.__lock:
+                    self.__stats["disk_hits"] += 1
+            except (OSError, MatrixFileInvalid, VectorFileInvalid):
+                obj = None
+
+        if obj is None:
+            obj = imp(file, *args)
+            with self.__lock:
+                self.__stats["misses"] += 1
+
+            if disk_path is not None:
+                # binary files are written atomically (see matpak.atomic), so concurrent readers never see a
+                # partial file and a failed save leaves no temp file behind
+                save(obj, disk_path)
+
+        self.__put(key, obj)
+        return _copy(obj)
+
+    def imp_mat_file(self, file: str, sep: str = ',', dtype: dtype_t = "decimal") -> Matrix:
+        """
+        cached version of matpak.imp_mat_file().
+
+        :param file: path to matrix file.
+        :param sep: file's elements separator char; by default, it is comma ','.
+        :param dtype: elements storage type of matrix; "decimal" by default.
+
+        :return: Matrix
+        """
+        return self.__get("mat", file, (sep, dtype), _context_key(dtype), load_mat_bin, save_mat_bin, imp_mat_file)
+
+    def imp_vec_file(self, file: str, dtype: dtype_t = "decimal") -> Vector:
+        """
+        cached version of matpak.imp_vec_file().
+
+        :param file: path to vector file.
+        :param dtype: elements storage type of vector; "decimal" by default.
+
+        :return: Vector
+        """
+        return self.__get("vec", file, (dtype,), _context_key(dtype), load_vec_bin, save_vec_bin, imp_vec_file)
+
+
+class ProductCache:
+    def __init__(self, max_bytes: int = DEFAULT_PRODUCT_CACHE_BYTES):
+        """
+        initialize an LRU cache of products of frozen matrices (see matpak.FrozenMatrix); install it by
+        matpak.set_product_cache() to use it.
+
+        entries are keyed by operands, which are compared by content, and by decimal context of matpak (or by
+        backend for float64 operands), so a product computed under another precision is never returned. results
+        are frozen too, so they are returned as they are, without copying, and could be shared between threads.
+        least recently used entries are evicted first once results hold more than max_bytes of elements; keys
+        keep operands alive until their entry is evicted.
+
+        :param max_bytes: memory budget of cached results.
+        """
+
+        if max_bytes < 0:
+            raise ValueError(f"cache max bytes {max_bytes} should not be negative")
+
+        self.__max_bytes = max_bytes
+        self.__entries: OrderedDict[tuple, tuple[Matrix, int]] = OrderedDict()
+        self.__bytes = 0
+        self.__lock = threading.Lock()
+
+        self.__stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        get cache counters: hits, misses, evictions, entries count and bytes held by results.
+
+        :return: dict of counters.
+        """
+        with self.__lock:
+            return {**self.__stats, "entries": len(self.__entries), "bytes": self.__bytes}
+
+    def clear(self):
+        """
+        drop all entries.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+
+    def get(self, key: tuple) -> Matrix | None:
+        """
+        get cached product of key; see matpak.FrozenMatrix.multiply().
+
+        :param key: product key.
+        :return: FrozenMatrix; or None if key is not cached.
+        """
+        # operands hash their content once; it is done before taking the lock
+        hash(key)
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__stats["misses"] += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.__stats["hits"] += 1
+            return entry[0]
+
+    def put(self, key: tuple, res: Matrix):
+        """
+        cache product of key.
+
+        :param key: product key.
+        :param res: FrozenMatrix product.
+        """
+        size = _nbytes(res)
+        hash(key)
+
+        with self.__lock:
+            if size > self.__max_bytes:
+                return
+
+            if key in self.__entries:
+                self.__bytes -= self.__entries.pop(key)[1]
+
+            self.__entries[key] = res, size
+            self.__bytes += size
+
+            while self.__bytes > self.__max_bytes:
+                _, (_, evicted) = self.__entries.popitem(last=False)
+                self.__bytes -= evicted
+                self.__stats["evictions"] += 1
+
+
+# products of frozen matrices are looked up in this cache; None (default) disables caching
+_product_cache: ProductCache | None = None
+
+
+def set_product_cache(cache: ProductCache | None):
+    """
+    install a product cache for multiplications of frozen matrices, or disable caching.
+
+    :param cache: ProductCache; or None to disable caching.
+    """
+    global _product_cache
+    _product_cache = cache
+
+
+def get_product_cache() -> ProductCache | None:
+    """
+    get installed product cache.
+
+    :return: ProductCache; or None if caching is disabled.
+    """
+    return _product_cache
+
+
+@contextmanager
+def use_product_cache(cache: ProductCache | None):
+    """
+    install a product cache in a with block and restore previous one on exit.
+
+    :param cache: ProductCache; or None to disable caching.
+    """
+    prev = _product_cache
+    set_product_cache(cache)
+
+    try:
+        yield cache
+    finally:
+        set_product_cache(prev)
@@ -0,0 +1,129 @@
+import functools
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from decimal import (Context, getcontext, localcontext, ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR,
+                     ROUND_HALF_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP)
+from typing import Iterator
+
+ROUNDINGS: tuple[str, ...] = (ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_EVEN,
+                              ROUND_HALF_UP, ROUND_UP)
+
+# matpak decimal context: the one set by use_precision() in current thread or task if any, else the one set by
+# set_precision(). if neither is set, operations run in the current decimal context as they are.
+_default: Context | None = None
+_local: ContextVar[Context | None] = ContextVar("matpak_decimal_context", default=None)
+
+
+def _make(prec: int | None, rounding: str | None) -> Context | None:
+    if prec is None and rounding is None:
+        return None
+
+    if prec is not None and prec <= 0:
+        raise ValueError(f"precision {prec} should be positive")
+
+    if rounding is not None and rounding not in ROUNDINGS:
+        raise ValueError(f"unknown rounding '{rounding}', it should be one of {list(ROUNDINGS)}")
+
+    ctx = get_decimal_context().copy()
+    if prec is not None:
+        ctx.prec = prec
+    if rounding is not None:
+        ctx.rounding = rounding
+
+    return ctx
+
+
+def set_precision(prec: int | None = None, rounding: str | None = None):
+    """
+    set precision (significant digits) and rounding of Decimal arithmetic done by matpak: matrix and vector
+    operations, and decimal importers, which round elements to precision once it is set. rounding is also
+    used when fixed elements are rounded to their scale.
+
+    call with no arguments to reset; then the current decimal context is used as it is.
+
+    :param prec: significant digits of Decimal results; or None to keep current one.
+    :param rounding: one of decimal module rounding modes, e.g, decimal.ROUND_HALF_EVEN; or None to keep current one.
+    """
+    global _default
+    _default = _make(prec, rounding)
+
+
+def get_decimal_context() -> Context:
+    """
+    get decimal context that matpak operations run in.
+
+    :return: decimal.Context
+    """
+    return _local.get() or _default or getcontext()
+
+
+def configured() -> Context | None:
+    """
+    get decimal context set by set_precision() or use_precision().
+
+    :return: decimal.Context; or None if nothing is set.
+    """
+    return _local.get() or _default
+
+
+@contextmanager
+def use_precision(prec: int | None = None, rounding: str | None = None) -> Iterator[Context]:
+    """
+    use precision and rounding for matpak operations in a with block; see set_precision(). the setting is
+    local to current thread (or asyncio task) and it is restored on exit.
+
+    :param prec: significant digits of Decimal results; or None to keep current one.
+    :param rounding: one of decimal module rounding modes; or None to keep current one.
+    :return: context manager of the decimal context in use.
+    """
+    token = _local.set(_make(prec, rounding) or _local.get())
+    try:
+        yield get_decimal_context()
+    finally:
+        _local.reset(token)
+
+
+def scope():
+    """
+    enter configured decimal context for the duration of an operation; it is a no-op if nothing is configured.
+
+    :return: context manager.
+    """
+    ctx = configured()
+    return localcontext(ctx) if ctx is not None else nullcontext()
+
+
+def in_context(fn):
+    """
+    decorate an operation to run in configured decimal context.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        ctx = configured()
+        if ctx is None:
+            return fn(*args, **kwargs)
+
+        with localcontext(ctx):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def call_in(ctx: Context | None, fn, *args, **kwargs):
+    """
+    call fn with ctx as matpak decimal context of the call; it is used to carry the caller's setting into executor
+    workers, which do not inherit context variables. ctx is picklable, so process pool workers are supported too.
+
+    :param ctx: decimal context, usually configured() of the caller; or None to keep worker's own setting.
+    :param fn: function to call.
+    :return: fn result.
+    """
+    if ctx is None:
+        return fn(*args, **kwargs)
+
+    token = _local.set(ctx)
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _local.reset(token)
@@ -14,4 +14,10 @@ class VectorDimensionInvalid(Exception):
 
 class MultiplicationDimensionMismatched(Exception):
     def __init__(self, lhs_shape: tuple[int, int], rhs_shape: tuple[int, int]):
-        super().__init__(f"could not multiply {lhs_shape[0]}x{lhs_shape[1]} shaped matrix by {rhs_shape[0]}x{rhs_shape[1]} shaped one")
\ No newline at end of file
+        super().__init__(f"could not multiply {lhs_shape[0]}x{lhs_shape[1]} shaped matrix by {rhs_shape[0]}x{rhs_shape[1]} shaped one")
+
+class MatrixSingular(Exception):
+    pass
+
+class MatrixNotPositiveDefinite(Exception):
+    pass
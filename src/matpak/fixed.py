@@ -0,0 +1,197 @@
+from decimal import (Decimal, localcontext, MAX_EMAX, MAX_PREC, MIN_EMIN, ROUND_05UP, ROUND_CEILING, ROUND_DOWN,
+                     ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_UP, ROUND_UP)
+from typing import Iterable
+
+from . import config
+
+
+# "fixed" elements are python ints holding value * 10**scale, where scale is shared by all elements of a
+# matrix or vector. products are accumulated exactly as ints at the sum of operands scales, and rounded once
+# to the result scale by integer division, with the rounding mode of matpak decimal context.
+
+
+def to_decimal(val) -> Decimal:
+    """
+    convert a scalar to Decimal exactly; floats are converted through their shortest repr.
+
+    :param val: int, float, str or Decimal scalar.
+    :return: Decimal
+    """
+    if isinstance(val, Decimal):
+        return val
+    if isinstance(val, float):
+        return Decimal(repr(val))
+    return Decimal(val)
+
+
+def scale_of(val) -> int:
+    """
+    get digits count after decimal point of a scalar.
+
+    :param val: int, float, str or Decimal scalar.
+    :return: int
+    """
+    d = to_decimal(val)
+
+    if not d.is_finite():
+        raise ValueError(f"non-finite value {d} could not be stored as fixed")
+
+    return max(0, -d.as_tuple().exponent)
+
+
+def infer_scale(values: Iterable) -> int:
+    """
+    get smallest scale that holds all values exactly.
+
+    :param values: scalars.
+    :return: int
+    """
+    return max(map(scale_of, values), default=0)
+
+
+def to_fixed_rows(rows: Iterable[Iterable], scale: int) -> list[list[int]]:
+    """
+    convert rows of scalars to lists of fixed elements of scale; values with more digits are rounded with
+    matpak rounding.
+
+    :param rows: rows of int, float, str or Decimal scalars.
+    :param scale: digits count after decimal point.
+    :return: lists of fixed elements.
+    """
+    if scale < 0:
+        raise ValueError(f"fixed scale {scale} should not be negative")
+
+    rounding = config.get_decimal_context().rounding
+    factor = 10 ** scale
+
+    def conv(val) -> int:
+        if type(val) is int:
+            return val * factor
+
+        d = to_decimal(val)
+        if not d.is_finite():
+            raise ValueError(f"non-finite value {d} could not be stored as fixed")
+
+        return int(d.scaleb(scale).to_integral_value(rounding=rounding))
+
+    # scaleb() rounds to context precision, so it runs without a precision limit
+    with localcontext(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN):
+        return [list(map(conv, row)) for row in rows]
+
+
+def to_fixed(val, scale: int) -> int:
+    """
+    convert a scalar to a fixed element of scale; see to_fixed_rows().
+
+    :param val: int, float, str or Decimal scalar.
+    :param scale: digits count after decimal point.
+    :return: int
+    """
+    return to_fixed_rows([[val]], scale)[0][0]
+
+
+def from_fixed(el: int, scale: int) -> Decimal:
+    """
+    convert a fixed element of scale to an exact Decimal.
+
+    :param el: fixed element.
+    :param scale: digits count after decimal point.
+    :return: Decimal
+    """
+    return Decimal(f"{el}E-{scale}")
+
+
+def round_div(n: int, d: int, rounding: str) -> int:
+    """
+    divide n by positive d and round quotient to an int with a decimal module rounding mode.
+    """
+    q, r = divmod(n, d)
+
+    if r == 0 or rounding == ROUND_FLOOR:
+        return q
+
+    # q is rounded towards negative infinity; 'away' is the other neighbour when it is farther from zero
+    away = n > 0
+
+    if rounding == ROUND_CEILING:
+        return q + 1
+    if rounding == ROUND_DOWN:
+        return q + (not away)
+    if rounding == ROUND_UP:
+        return q + away
+    if rounding == ROUND_05UP:
+        t = q + (not away)
+        return t if t % 5 else (q + away)
+
+    twice = 2 * r
+    if twice != d:
+        return q + (twice > d)
+
+    if rounding == ROUND_HALF_UP:
+        return q + away
+    if rounding == ROUND_HALF_DOWN:
+        return q + (not away)
+
+    return q + (q % 2)
+
+
+def rescale(rows: list[list[int]], src: int, dst: int):
+    """
+    change scale of fixed elements in place; elements are rounded with matpak rounding when scale decreases.
+
+    :param rows: lists of fixed elements.
+    :param src: current scale.
+    :param dst: new scale.
+    """
+    if dst >= src:
+        if dst > src:
+            factor = 10 ** (dst - src)
+            for row in rows:
+                row[:] = [el * factor for el in row]
+        return
+
+    d = 10 ** (src - dst)
+    rounding = config.get_decimal_context().rounding
+
+    for row in rows:
+        row[:] = [round_div(el, d, rounding) for el in row]
+
+
+def axpy(alpha, x: list[list[int]], x_scale: int, y: list[list[int]], y_scale: int):
+    """
+    y = y + alpha * x, elementwise in place; scaled x is rounded once to scale of y.
+
+    :param alpha: scalar of x; or None to add x as is.
+    :param x: lists of fixed elements.
+    :param x_scale: scale of x.
+    :param y: lists of fixed elements with same shape as x, which are updated.
+    :param y_scale: scale of y.
+    """
+    if alpha is None:
+        prod, src = [list(row) for row in x], x_scale
+    else:
+        alpha_scale = scale_of(alpha)
+        a = to_fixed(alpha, alpha_scale)
+        prod, src = [[a * el for el in row] for row in x], alpha_scale + x_scale
+
+    rescale(prod, src, y_scale)
+
+    for p_row, y_row in zip(prod, y):
+        y_row[:] = [b + a for a, b in zip(p_row, y_row)]
+
+
+def scale(alpha, rows: list[list[int]], rows_scale: int):
+    """
+    rows = alpha * rows, elementwise in place; products are rounded to scale of rows.
+
+    :param alpha: scalar.
+    :param rows: lists of fixed elements, which are updated.
+    :param rows_scale: scale of rows.
+    """
+    alpha_scale = scale_of(alpha)
+    a = to_fixed(alpha, alpha_scale)
+
+    for row in rows:
+        row[:] = [a * el for el in row]
+
+    rescale(rows, rows_scale + alpha_scale, rows_scale)
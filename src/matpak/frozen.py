@@ -0,0 +1,227 @@
+from array import array
+
+from .mat import Matrix
+from .types import lst_dec_2d_t, dtype_t
+from . import cache, config, kernels
+
+
+class FrozenMatrix(Matrix):
+    # content hash, computed on first use
+    __slots__ = ("__hash",)
+
+    def __init__(self, rows: int, cols: int, init_mat: lst_dec_2d_t | None = None, dtype: dtype_t = "decimal",
+                 scale: int | None = None):
+        """
+        initialize an immutable rows*cols matrix; see Matrix for arguments. use Matrix.freeze() to get an
+        immutable copy of an existing matrix.
+
+        elements are copied to tuple rows (decimal and fixed) or to a read-only buffer (float64), so they could not
+        be changed through raw rows either; set() and in-place methods raise TypeError. as nothing changes after
+        initialization, a frozen matrix could be shared between threads without locking, and it is hashable by its
+        content: two frozen matrices are equal if they have the same shape, dtype, scale and elements (float64
+        elements are compared bitwise, decimal elements by their exact representation).
+
+        products of two frozen matrices are frozen too, and they are looked up in the installed product cache
+        (see matpak.set_product_cache()) before they are computed.
+        """
+        super().__init__(rows, cols, init_mat, dtype, scale)
+        self._seal()
+
+    def __reduce__(self):
+        return FrozenMatrix, (*self.shape, self.tolist(), self.dtype, self.scale)
+
+    @classmethod
+    def from_buffer(cls, rows: int, cols: int, buf) -> "FrozenMatrix":
+        """
+        create a frozen float64 matrix from a buffer of rows*cols C doubles in row-major order. unlike
+        Matrix.from_buffer(), buffer is copied, so elements could not be changed through it.
+
+        :param rows: matrix rows count.
+        :param cols: matrix cols count.
+        :param buf: any object supporting buffer protocol, e.g, array('d'), bytearray or mmap.
+        :return: FrozenMatrix
+        """
+        copy = array('d')
+        copy.frombytes(memoryview(buf).cast('B'))
+        return super().from_buffer(rows, cols, copy)._seal()
+
+    @classmethod
+    def from_fixed(cls, rows: int, cols: int, raw: list[list[int]], scale: int) -> "FrozenMatrix":
+        """
+        create a frozen fixed matrix from rows of python ints holding element * 10**scale. rows are copied.
+
+        :param rows: matrix rows count.
+        :param cols: matrix cols count.
+        :param raw: rows*cols 2D list of ints.
+        :param scale: digits count after decimal point.
+        :return: FrozenMatrix
+        """
+        return super().from_fixed(rows, cols, raw, scale)._seal()
+
+    @classmethod
+    def from_rows(cls, init_mat: lst_dec_2d_t, dtype: dtype_t = "decimal", scale: int | None = None,
+                  validate: bool = True) -> "FrozenMatrix":
+        """
+        create a frozen matrix from a 2D list of elements; see Matrix.from_rows(). rows are copied.
+        """
+        return super().from_rows(init_mat, dtype, scale, validate)._seal()
+
+    @classmethod
+    def from_flat(cls, rows: int, cols: int, values, dtype: dtype_t = "decimal",
+                  scale: int | None = None) -> "FrozenMatrix":
+        """
+        create a frozen matrix from rows*cols elements in row-major order; see Matrix.from_flat().
+        """
+        return super().from_flat(rows, cols, values, dtype, scale)._seal()
+
+    @classmethod
+    def zeros(cls, rows: int, cols: int, dtype: dtype_t = "decimal", scale: int | None = None) -> "FrozenMatrix":
+        """
+        create a frozen zero matrix; see Matrix.zeros().
+        """
+        return super().zeros(rows, cols, dtype, scale)._seal()
+
+    @classmethod
+    def identity(cls, n: int, dtype: dtype_t = "decimal", scale: int | None = None) -> "FrozenMatrix":
+        """
+        create a frozen n*n identity matrix; see Matrix.identity().
+        """
+        return super().identity(n, dtype, scale)._seal()
+
+    @classmethod
+    def _adopt(cls, mat: Matrix) -> "FrozenMatrix":
+        # freeze a new matrix that is not referenced anywhere else, without copying its buffer
+        return super()._adopt(mat)._seal()
+
+    def freeze(self) -> "FrozenMatrix":
+        """
+        get matrix itself, as it is already immutable.
+
+        :return: FrozenMatrix
+        """
+        return self
+
+    def thaw(self) -> Matrix:
+        """
+        get a mutable copy of matrix.
+
+        :return: Matrix
+        """
+        return self.astype(self.dtype)
+
+    def _seal(self) -> "FrozenMatrix":
+        self.__hash = None
+        return super()._seal()
+
+    def __content(self):
+        return self.buffer.cast('B') if self.dtype == "float64" else self.raw
+
+    def __hash__(self) -> int:
+        h = self.__hash
+        if h is None:
+            # buffer views are only hashable if their exporter is, so float64 elements are hashed as bytes
+            content = self.buffer.tobytes() if self.dtype == "float64" else self.raw
+            # a race computes the same value twice, so no lock is needed
+            h = self.__hash = hash((self.shape, self.dtype, self.scale, content))
+        return h
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
+        if not isinstance(other, FrozenMatrix):
+            return NotImplemented
+
+        if (self.shape, self.dtype, self.scale) != (other.shape, other.dtype, other.scale):
+            return False
+
+        if hash(self) != hash(other):
+            return False
+
+        if self.dtype != "decimal":
+            return self.__content() == other.__content()
+
+        # equal Decimals could differ in exponent, e.g, 1.0 and 1, which gives products of different exponents
+        return all(a.compare_total(b) == 0
+                   for row, other_row in zip(self.raw, other.raw) for a, b in zip(row, other_row))
+
+    def __frozen(self, *args, **kwargs):
+        raise TypeError("frozen matrix could not be changed; get a mutable copy by thaw()")
+
+    set = imul_ = add_ = axpy = scale_ = __frozen
+
+    def __rebind(op):
+        # augmented assignment binds a new frozen matrix, as it does for other immutable types
+        def inplace(self, other):
+            res = op(self, other)
+            return FrozenMatrix._adopt(res) if isinstance(res, Matrix) and not isinstance(res, FrozenMatrix) else res
+        return inplace
+
+    __iadd__, __isub__, __imul__, __imatmul__ = map(__rebind, (Matrix.__add__, Matrix.__sub__, Matrix.__mul__,
+                                                             Matrix.__matmul__))
+    del __rebind
+
+    def _changed(self, scale: int | None = None):
+        self.__frozen()
+
+    def _transposed(self, build: bool = True) -> "Matrix | None":
+        # cached transpose is handed out by T views and read by products, so it is sealed once it is built
+        t = super()._transposed(build=False)
+        if t is None and build:
+            t = super()._transposed()._seal()
+        return t
+
+    def lu(self, overwrite: bool = False) -> "LUFactorization":
+        if overwrite:
+            self.__frozen()
+        return super().lu()
+
+    def cholesky(self, overwrite: bool = False) -> "CholeskyFactorization":
+        if overwrite:
+            self.__frozen()
+        return super().cholesky()
+
+    def __product_key(self, rhs: "FrozenMatrix", algorithm: str) -> tuple:
+        if "float64" in (self.dtype, rhs.dtype):
+            # float64 products are not rounded by decimal context, but they could differ in last bits between
+            # numpy, dot (compensated sum()) and other kernels; all dot strategies sum the same way
+            strategy = self.plan_multiply(rhs, algorithm)
+            return self, rhs, "dot" if strategy.startswith("dot") else strategy
+
+        ctx = config.get_decimal_context()
+        return self, rhs, ctx.prec, ctx.rounding
+
+    def multiply(self, rhs: "Matrix | TransposedMatrix | Vector", algorithm: str = "auto",
+                 block_size: int = kernels.DEFAULT_BLOCK_SIZE,
+                 out: "Matrix | Vector | None" = None) -> "Matrix | Vector":
+        """
+        multiply matrix by rhs; see Matrix.multiply(). if rhs is a frozen matrix and no out is given, result is
+        frozen, and it is taken from the installed product cache (see matpak.set_product_cache()) when the same
+        operands were multiplied before under the same precision. decimal and fixed products are exactly the same
+        for all algorithms; float64 ones are keyed by their strategy too (see Matrix.plan_multiply()), as numpy,
+        dot and other kernels could differ in last bits.
+
+        :param rhs: right hand side, could be Matrix, TransposedMatrix or Vector but dimensions of rhs should be valid for multiplication.
+        :param algorithm: multiplication kernel name; "auto" by default.
+        :param block_size: tile edge size of "blocked" algorithm.
+        :param out: Matrix or Vector that the result is stored in instead of allocating a new one.
+        :return: Matrix or Vector based on rhs type; FrozenMatrix if rhs is a FrozenMatrix.
+        """
+
+        if out is not None or not isinstance(rhs, FrozenMatrix):
+            return super().multiply(rhs, algorithm, block_size, out)
+
+        product_cache = cache.get_product_cache()
+        key = None if product_cache is None else self.__product_key(rhs, algorithm)
+
+        if key is not None:
+            res = product_cache.get(key)
+            if res is not None:
+                return res
+
+        res = FrozenMatrix._adopt(super().multiply(rhs, algorithm, block_size))
+
+        if key is not None:
+            product_cache.put(key, res)
+
+        return res
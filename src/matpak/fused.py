@@ -0,0 +1,172 @@
+from .errors import MatrixDimensionInvalid, MultiplicationDimensionMismatched, VectorDimensionInvalid
+from .mat import Matrix
+from .transposed import TransposedMatrix
+from .types import common_dtype
+from .vec import Vector
+from . import backend, config, fixed, kernels
+
+
+# fused products update their result operand in place, like BLAS routines do: a compound expression such as
+# alpha * A @ B + beta * C is computed in a single pass over rows of C, without a product matrix or any other
+# temporary. result keeps its dtype, so operands are converted to it when they are of a narrower dtype (see
+# matpak.types.common_dtype()).
+
+
+def _scalar(val, dtype: str):
+    # kernels skip multiplying by a scalar of None
+    return None if val == 1 else kernels.as_scalar(val, dtype)
+
+
+def _coerce(op, dtype: str):
+    if op.dtype == dtype:
+        return op
+
+    if common_dtype(op.dtype, dtype) == dtype:
+        return op.astype(dtype)
+
+    raise ValueError(f"could not store a product of {op.dtype} elements in a {dtype} result in place; "
+                     f"convert it by astype() first")
+
+
+def _fixed(alpha, prod_scale: int, beta, res_scale: int) -> tuple[int | None, int | None, int]:
+    # kernels sum alpha * product and beta * result exactly as ints of their common scale, which is rounded once
+    # to scale of result afterwards; so scalars are converted to ints of that scale
+    alpha_scale, beta_scale = fixed.scale_of(alpha), fixed.scale_of(beta)
+    scale = max(alpha_scale + prod_scale, beta_scale + res_scale)
+
+    a = fixed.to_fixed(alpha, alpha_scale) * 10 ** (scale - alpha_scale - prod_scale)
+    b = 0 if beta == 0 else fixed.to_fixed(beta, beta_scale) * 10 ** (scale - beta_scale - res_scale)
+
+    return None if a == 1 else a, None if b == 1 else b, scale
+
+
+@config.in_context
+def gemm(alpha, a: "Matrix | TransposedMatrix", b: "Matrix | TransposedMatrix", beta, c: Matrix) -> Matrix:
+    """
+    general matrix multiply-add in place: c = alpha * a * b + beta * c. every row of a is dotted with cols of b
+    and combined with its row of c at once, so no product matrix is allocated. cols of b are read from rows of
+    its base matrix if b is a transposed view, or from its cached transpose when it is available.
+
+    numpy backend computes float64 operands by numpy.matmul. fixed results are accumulated exactly as ints and
+    rounded once to scale of c.
+
+    if there is any issue, an exception would be raised. beside standard exceptions, there are following
+    custom exceptions that would be raised in special scenarios:
+        1- cols count of a and rows count of b are not equal: MultiplicationDimensionMismatched
+        2- shape of c does not match the product: MatrixDimensionInvalid
+
+    :param alpha: scalar of product.
+    :param a: left hand side n*m matrix.
+    :param b: right hand side m*p matrix.
+    :param beta: scalar of c; 0 to overwrite c, so its previous values are ignored.
+    :param c: n*p matrix, which is updated; it should not be one of operands.
+    :return: c
+    """
+    n, m = a.shape
+    p = b.shape[1]
+
+    if m != b.shape[0]:
+        raise MultiplicationDimensionMismatched(a.shape, b.shape)
+
+    if c.shape != (n, p):
+        raise MatrixDimensionInvalid(f"could not add {n}x{p} product to {c.shape[0]}x{c.shape[1]} matrix")
+
+    # a transposed view shares storage with its base matrix
+    if any(c is op or (isinstance(op, TransposedMatrix) and c is op.T) for op in (a, b)):
+        raise ValueError("c should not be an operand of the product")
+
+    dtype = c.dtype
+
+    if backend.numpy_enabled(a, b, c):
+        arr = c.to_numpy()
+        c._changed()
+
+        prod = backend.np.matmul(a.to_numpy(), b.to_numpy())
+        prod *= float(alpha)
+
+        if beta == 0:
+            arr[...] = prod
+        else:
+            arr *= float(beta)
+            arr += prod
+
+        return c
+
+    a_raw = _coerce(a, dtype).raw
+
+    if isinstance(b, TransposedMatrix):
+        cols = _coerce(b.T, dtype).raw
+    else:
+        b = _coerce(b, dtype)
+        t = b._transposed(build=False)
+        cols = t.raw if t is not None else kernels.transpose(b.raw)
+
+    c._changed()
+
+    if dtype == "fixed":
+        alpha, beta, scale = _fixed(alpha, a.scale + b.scale, beta, c.scale)
+        kernels.gemm_cols(alpha, a_raw, cols, beta, c.raw)
+        fixed.rescale(c.raw, scale, c.scale)
+        return c
+
+    kernels.gemm_cols(_scalar(alpha, dtype), a_raw, cols, _scalar(beta, dtype), c.raw)
+
+    return c
+
+
+@config.in_context
+def gemv(alpha, a: "Matrix | TransposedMatrix", x: Vector, beta, y: Vector) -> Vector:
+    """
+    general matrix-vector multiply-add in place: y = alpha * a * x + beta * y, fused in one pass over rows of a.
+    all dots are computed before y is stored, so y could be x itself when a is square.
+
+    numpy backend computes float64 operands by numpy.matmul. fixed results are accumulated exactly as ints and
+    rounded once to scale of y.
+
+    if there is any issue, an exception would be raised. beside standard exceptions, there are following
+    custom exceptions that would be raised in special scenarios:
+        1- cols count of a and rows count of x are not equal: MultiplicationDimensionMismatched
+        2- rows count of y does not match the product: VectorDimensionInvalid
+
+    :param alpha: scalar of product.
+    :param a: n*m matrix.
+    :param x: vector with m rows.
+    :param beta: scalar of y; 0 to overwrite y, so its previous values are ignored.
+    :param y: vector with n rows, which is updated.
+    :return: y
+    """
+    n, m = a.shape
+
+    if m != x.shape[0]:
+        raise MultiplicationDimensionMismatched(a.shape, x.shape)
+
+    if y.shape[0] != n:
+        raise VectorDimensionInvalid(f"could not add product with {n} rows to vector with {y.shape[0]} rows")
+
+    dtype = y.dtype
+
+    if backend.numpy_enabled(a, x, y):
+        arr = y.to_numpy()
+
+        prod = backend.np.matmul(a.to_numpy(), x.to_numpy())
+        prod *= float(alpha)
+
+        if beta == 0:
+            arr[...] = prod
+        else:
+            arr *= float(beta)
+            arr += prod
+
+        return y
+
+    a_raw, x_raw = _coerce(a, dtype).raw, _coerce(x, dtype).raw
+
+    if dtype == "fixed":
+        alpha, beta, scale = _fixed(alpha, a.scale + x.scale, beta, y.scale)
+        kernels.gemv(alpha, a_raw, x_raw, beta, y.raw)
+        fixed.rescale([y.raw], scale, y.scale)
+        return y
+
+    kernels.gemv(_scalar(alpha, dtype), a_raw, x_raw, _scalar(beta, dtype), y.raw)
+
+    return y
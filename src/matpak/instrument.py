@@ -0,0 +1,265 @@
+import functools
+import inspect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable
+
+# instrumentation events and the fields passed to hooks with each of them:
+#   - "multiply": op, lhs_shape, rhs_shape, dtype, algorithm, elapsed (seconds) and flops (2*n*m*p).
+#   - "import": op, file, bytes (file size), rows and elapsed (seconds).
+#   - "alloc": kind ("Matrix" or "Vector"), shape, dtype and elements count of a newly allocated storage.
+#
+# everything is a no-op while instrumentation is disabled: instrumented operations only check one module flag
+# before calling through. only the outermost operation is recorded, so an operation running other instrumented
+# operations (e.g, TransposedMatrix.multiply() running Matrix.multiply()) is counted once.
+EVENTS: tuple[str, ...] = ("multiply", "import", "alloc")
+
+# instrumented operations read this flag directly; use set_instrumentation() to change it.
+# it could be enabled at startup by MATPAK_INSTRUMENT=1 environment variable.
+enabled: bool = os.environ.get("MATPAK_INSTRUMENT", "") not in ("", "0")
+
+_hooks: dict[str, list[Callable[[str, dict], None]]] = {event: [] for event in EVENTS}
+_lock = threading.Lock()
+_depth = threading.local()
+
+
+def _empty_stats() -> dict:
+    return {
+        "multiply": {"count": 0, "elapsed": 0.0, "flops": 0, "algorithms": {}},
+        "import": {"count": 0, "elapsed": 0.0, "bytes": 0, "rows": 0},
+        "alloc": {"count": 0, "elements": 0},
+    }
+
+
+_stats = _empty_stats()
+
+
+def set_instrumentation(on: bool):
+    """
+    enable or disable instrumentation globally.
+
+    :param on: record counters and timers of matpak operations and call hooks.
+    """
+    global enabled
+    enabled = bool(on)
+
+
+def get_instrumentation() -> bool:
+    """
+    check whether instrumentation is enabled.
+
+    :return: bool
+    """
+    return enabled
+
+
+@contextmanager
+def use_instrumentation(on: bool = True):
+    """
+    enable or disable instrumentation in a with block and restore previous state on exit.
+
+    :param on: record counters and timers of matpak operations and call hooks.
+    """
+    prev = enabled
+    set_instrumentation(on)
+
+    try:
+        yield
+    finally:
+        set_instrumentation(prev)
+
+
+def add_hook(fn: Callable[[str, dict], None], events: Iterable[str] | None = None) -> Callable[[str, dict], None]:
+    """
+    register a callback that receives every recorded event as fn(event, fields), e.g, to forward events to a
+    metrics system. hooks are called synchronously in the thread running the operation, so they should be fast;
+    exceptions raised by hooks propagate to the caller of the operation.
+
+    :param fn: callback of event name and fields dict.
+    :param events: event names to receive; by default, all of EVENTS.
+    :return: fn, so it could be used as a decorator.
+    """
+    events = EVENTS if events is None else tuple(events)
+
+    for event in events:
+        if event not in EVENTS:
+            raise ValueError(f"unknown event '{event}', it should be one of {list(EVENTS)}")
+
+    with _lock:
+        for event in events:
+            if fn not in _hooks[event]:
+                _hooks[event].append(fn)
+
+    return fn
+
+
+def remove_hook(fn: Callable[[str, dict], None]):
+    """
+    unregister a callback from all events.
+
+    :param fn: callback registered by add_hook().
+    """
+    with _lock:
+        for hooks in _hooks.values():
+            if fn in hooks:
+                hooks.remove(fn)
+
+
+def stats() -> dict:
+    """
+    get a snapshot of counters recorded since instrumentation was enabled or reset_stats() was called.
+
+    :return: dict of "multiply" (count, elapsed, flops and count per algorithm), "import" (count, elapsed,
+    bytes and rows) and "alloc" (count and elements) counters, and "enabled" state.
+    """
+    with _lock:
+        snapshot = {event: dict(counters) for event, counters in _stats.items()}
+        snapshot["multiply"]["algorithms"] = dict(_stats["multiply"]["algorithms"])
+
+    snapshot["enabled"] = enabled
+    return snapshot
+
+
+def reset_stats():
+    """
+    zero all counters.
+    """
+    global _stats
+
+    with _lock:
+        _stats = _empty_stats()
+
+
+def record(event: str, **fields):
+    """
+    record an event: update its counters and pass it to hooks. it is called by instrumented operations only
+    while instrumentation is enabled.
+
+    :param event: one of EVENTS.
+    :param fields: event fields; see EVENTS.
+    """
+    with _lock:
+        counters = _stats[event]
+        counters["count"] += 1
+
+        if event == "multiply":
+            counters["elapsed"] += fields["elapsed"]
+            counters["flops"] += fields["flops"]
+            algorithms = counters["algorithms"]
+            algorithms[fields["algorithm"]] = algorithms.get(fields["algorithm"], 0) + 1
+        elif event == "import":
+            counters["elapsed"] += fields["elapsed"]
+            counters["bytes"] += fields["bytes"]
+            counters["rows"] += fields["rows"]
+        else:
+            counters["elements"] += fields["elements"]
+
+        hooks = tuple(_hooks[event])
+
+    for hook in hooks:
+        hook(event, fields)
+
+
+def record_alloc(obj):
+    """
+    record allocation of a new matrix or vector storage.
+
+    :param obj: Matrix or Vector.
+    """
+    rows, cols = obj.shape
+    record("alloc", kind=type(obj).__name__, shape=(rows, cols), dtype=obj.dtype, elements=rows * cols)
+
+
+def allocated(obj):
+    """
+    record allocation of a new result whose storage was built by the caller and wrapped without __init__ (e.g,
+    by from_fixed(), from_buffer() or from_numpy()); nothing is recorded if instrumentation is disabled.
+
+    :param obj: Matrix or Vector.
+    :return: obj
+    """
+    if enabled:
+        record_alloc(obj)
+    return obj
+
+
+def _outermost(fn, call, *args, **kwargs):
+    # nested instrumented operations are run as they are; only the outermost one is recorded
+    depth = getattr(_depth, "value", 0)
+    if depth:
+        return fn(*args, **kwargs)
+
+    _depth.value = 1
+    try:
+        return call(*args, **kwargs)
+    finally:
+        _depth.value = 0
+
+
+def _bind(sig: inspect.Signature, args: tuple, kwargs: dict) -> list:
+    bound = sig.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return list(bound.arguments.values())
+
+
+def multiplies(algorithm: str | None = None):
+    """
+    decorate a product operation of (lhs, rhs, ...) arguments to record "multiply" events.
+
+    :param algorithm: algorithm name reported for the operation; or None to report the strategy that
+    lhs.plan_multiply() chooses for the operation's algorithm argument.
+    """
+
+    def decorator(fn):
+        op = fn.__qualname__
+        sig = inspect.signature(fn)
+
+        def call(*args, **kwargs):
+            start = time.perf_counter()
+            res = fn(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+
+            lhs, rhs, *rest = _bind(sig, args, kwargs)
+            n, m = lhs.shape
+            p = rhs.shape[1]
+
+            record("multiply", op=op, lhs_shape=(n, m), rhs_shape=(m, p), dtype=getattr(res, "dtype", "decimal"),
+                   algorithm=algorithm or lhs.plan_multiply(rhs, rest[0]), elapsed=elapsed, flops=2 * n * m * p)
+            return res
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return fn(*args, **kwargs)
+            return _outermost(fn, call, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def imports(fn):
+    """
+    decorate an importer of (file, ...) arguments to record "import" events.
+    """
+    op = fn.__qualname__
+    sig = inspect.signature(fn)
+
+    def call(*args, **kwargs):
+        start = time.perf_counter()
+        res = fn(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+
+        file = _bind(sig, args, kwargs)[0]
+        record("import", op=op, file=file, bytes=os.path.getsize(file), rows=res.shape[0], elapsed=elapsed)
+        return res
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not enabled:
+            return fn(*args, **kwargs)
+        return _outermost(fn, call, *args, **kwargs)
+
+    return wrapper
@@ -1,13 +1,76 @@
-import re
+import io
+from array import array
 from decimal import Decimal
-
-from .types import lst_dec_1d_t, lst_dec_2d_t
-from .errors import MatrixFileInvalid, VectorFileInvalid
+from functools import partial
+from itertools import islice
+from typing import Iterable, Iterator
+
+from .types import lst_dec_1d_t, lst_dec_2d_t, dtype_t
+from .errors import MatrixFileInvalid, VectorFileInvalid, MatrixDimensionInvalid
+from .atomic import AtomicFile
+from . import backend, config, instrument
 from .mat import Matrix
+from .sparse import SparseMatrix
 from .vec import Vector
 
+# rows count read at once by float64 matrix importers.
+IMP_CHUNK_ROWS = 4096
+
+# rows count formatted and written at once by exporters.
+EXP_CHUNK_ROWS = 4096
+
+# chars of numbers in matrix and vector files
+_NUM_CHARS = "-0123456789."
+
+
+def _illegal_table(extra: str = '') -> dict:
+    # translation table deleting every legal char; a line is valid if nothing is left of it after translation
+    return str.maketrans('', '', _NUM_CHARS + extra)
+
+
+def _converter(dtype: dtype_t):
+    # decimal elements are rounded to matpak precision once it is set; fixed elements are read exactly and
+    # rounded to their scale when matrix or vector is built
+    if dtype == "float64":
+        return float
+
+    ctx = config.configured() if dtype == "decimal" else None
+    return Decimal if ctx is None else ctx.create_decimal
+
+
+def _legal_chars(sep: str = '') -> str:
+    return "[" + ','.join(f"'{ch}'" for ch in sep + _NUM_CHARS) + "]"
+
+
+def _locate(line: str, ln: int, sep: str, conv) -> str | None:
+    """
+    find first bad char or element of a line which could not be parsed. only called after parsing has failed,
+    so the fast path never pays for it.
+
+    :return: error message with 1-based line and column of bad input; or None if line is valid.
+    """
+    offset = len(line) - len(line.lstrip())
+    l = line.strip()
+    legal = _NUM_CHARS + sep
+
+    for col, ch in enumerate(l, offset + 1):
+        if ch not in legal:
+            return (f"contains non-standard char {ch!r} in line {ln}, column {col}. "
+                    f"it must only contain chars: {_legal_chars(sep)} and standard newline char")
+
+    col = offset + 1
+    for el in l.split(sep) if sep else [l]:
+        try:
+            conv(el)
+        except (ArithmeticError, ValueError):
+            return f"element {el!r} in line {ln}, column {col} is not a valid number"
+        col += len(el) + len(sep)
+
+    return None
+
 
-def imp_mat_file(file: str, sep: str = ',') -> Matrix:
+@instrument.imports
+def imp_mat_file(file: str, sep: str = ',', dtype: dtype_t = "decimal") -> Matrix:
     """
     Import matrix from a file. The file containing matrix should have the following syntax:
 
@@ -26,54 +89,216 @@ def imp_mat_file(file: str, sep: str = ',') -> Matrix:
         - last line could also be newline.
         - rows count and cols count is gathered from file automatically.
         - cols count in each row should be same as other rows.
-        - elements would be read as Decimal floating-point numbers with precision that is defined in configurations.
+        - elements would be read as Decimal floating-point numbers with precision that is defined in configurations
+          (see matpak.set_precision()), as float numbers if dtype is "float64", or as fixed-point numbers with
+          the smallest scale holding all elements exactly if dtype is "fixed".
 
-    return value is a class of type Matrix.
+    return value is a class of type Matrix. file is streamed by iter_mat_rows(), so no intermediate copies of the file
+    are made; float64 matrices are filled block by block into a single buffer, and parsed by numpy when numpy backend is active.
 
     if there is any issue, an exception would be raised. beside standard exceptions, there are following
     custom exceptions that would be raised in special scenarios:
         1- file empty or no matrix exists: MatrixFileInvalid
+        2- row contains non-standard chars or invalid numbers, or its cols count differs from first row: MatrixFileInvalid.
+           error message reports line and column of bad input.
 
     :param file: path to matrix file. each line in file represents a
     :param sep: file's elements separator char; by default, it is comma ','.
+    :param dtype: elements storage type of matrix; "decimal" by default.
 
     :return: Matrix
     """
+    if dtype == "float64":
+        buf = array('d')
+        rows_cnt = cols_cnt = 0
+
+        if backend.active_backend() == "numpy":
+            for block in _iter_mat_blocks_numpy(file, sep):
+                buf.frombytes(block.tobytes())
+                rows_cnt, cols_cnt = rows_cnt + block.shape[0], block.shape[1]
+        else:
+            for block in iter_mat_rows(file, sep, IMP_CHUNK_ROWS, dtype):
+                for row in block:
+                    buf.extend(row)
+                rows_cnt, cols_cnt = rows_cnt + len(block), len(block[0])
+
+        return instrument.allocated(Matrix.from_buffer(rows_cnt, cols_cnt, buf))
+
+    mat: lst_dec_2d_t = list(iter_mat_rows(file, sep, dtype=dtype))
+
+    # rows should be at least 1, there is no need to check
+    return Matrix(len(mat), len(mat[0]), mat, dtype)
+
+
+def iter_mat_rows(file: str, sep: str = ',', chunk_rows: int | None = None,
+                  dtype: dtype_t = "decimal") -> Iterator[lst_dec_1d_t | lst_dec_2d_t]:
+    """
+    Stream matrix rows from a file with the same syntax as imp_mat_file(). file is read line by line and
+    each row is validated as it arrives, so only one row (or one block of rows) is held in memory at a time.
+
+    if there is any issue, an exception would be raised when the offending row is reached:
+        1- file empty or no matrix exists: MatrixFileInvalid
+        2- row contains non-standard chars or invalid numbers, or its cols count differs from first row: MatrixFileInvalid.
+           error message reports line and column of bad input.
+
+    :param file: path to matrix file.
+    :param sep: file's elements separator char; by default, it is comma ','.
+    :param chunk_rows: if given, lists of up to chunk_rows rows are yielded instead of single rows.
+    :param dtype: elements are read as float for "float64", and as Decimal otherwise; fixed elements are read exactly.
+
+    :return: iterator of rows, or of row blocks if chunk_rows is given.
+    """
+    if chunk_rows is not None and chunk_rows <= 0:
+        raise ValueError(f"chunk rows {chunk_rows} should be positive")
+
+    conv = _converter(dtype)
+
+    # in matrix files, only 'separator char', '-', 0-9 and '.' are allowed. each line is validated by a single
+    # translate() and converted right away; bad input is located only once a line has failed.
+    illegal = _illegal_table(sep)
+    cols_cnt = 0
+    block: lst_dec_2d_t = []
+
     with open(file) as mat_f:
-        ls = mat_f.readlines()
+        for ln, line in enumerate(mat_f, 1):
+            l = line.strip()
+
+            # ignore any blank lines
+            if l == '':
+                continue
+
+            try:
+                if l.translate(illegal):
+                    raise ValueError
+                row = list(map(conv, l.split(sep)))
+            except (ArithmeticError, ValueError):
+                raise MatrixFileInvalid(file, _locate(line, ln, sep, conv)) from None
+
+            if cols_cnt == 0:
+                cols_cnt = len(row)
+            elif len(row) != cols_cnt:
+                raise MatrixFileInvalid(file, f"line {ln} has {len(row)} cols but previous rows have {cols_cnt} cols")
+
+            if chunk_rows is None:
+                yield row
+            else:
+                block.append(row)
+                if len(block) == chunk_rows:
+                    yield block
+                    block = []
+
+    if cols_cnt == 0:
+        raise MatrixFileInvalid(file, "does not contain any matrix")
+
+    if block:
+        yield block
+
+
+@instrument.imports
+def imp_sparse_mat_file(file: str, sep: str = ',') -> SparseMatrix:
+    """
+    Import sparse matrix from a file of COO triplets. The file should have the following syntax:
+
+        rows,cols\n
+        row,col,value\n
+        row,col,value
 
-        if len(ls) <= 0:
-            raise MatrixFileInvalid(file, "does not contain any matrix")
+    rules:
+        - first non-blank line is the header, containing rows count and cols count of matrix.
+        - each next line contains a nonzero element: its 0-based row index, 0-based col index and value.
+        - duplicated (row, col) elements are summed.
+        - blank lines are ignored.
+        - elements would be read as Decimal floating-point numbers with precision that is defined in configurations.
+
+    if there is any issue, an exception would be raised. beside standard exceptions, there are following
+    custom exceptions that would be raised in special scenarios:
+        1- file empty, header missing or a line is not a valid triplet: MatrixFileInvalid
+
+    :param file: path to sparse matrix file.
+    :param sep: file's elements separator char; by default, it is comma ','.
+
+    :return: SparseMatrix
+    """
+    illegal = _illegal_table(sep)
+    conv = _converter("decimal")
+    shape = None
+    triplets = []
+
+    with open(file) as mat_f:
+        for ln, line in enumerate(mat_f, 1):
+            l = line.strip()
+
+            if l == '':
+                continue
+
+            if l.translate(illegal):
+                raise MatrixFileInvalid(file, _locate(line, ln, sep, Decimal))
+
+            fields = l.split(sep)
+
+            try:
+                if shape is None:
+                    if len(fields) != 2:
+                        raise ValueError
+                    shape = int(fields[0]), int(fields[1])
+                else:
+                    if len(fields) != 3:
+                        raise ValueError
+                    triplets.append((int(fields[0]), int(fields[1]), conv(fields[2])))
+            except (ValueError, ArithmeticError):
+                raise MatrixFileInvalid(file, f"line {ln} should be a {'triplet' if shape else 'rows,cols header'}")
+
+    if shape is None:
+        raise MatrixFileInvalid(file, "does not contain any matrix")
+
+    try:
+        return SparseMatrix(shape[0], shape[1], triplets)
+    except ValueError as e:
+        raise MatrixFileInvalid(file, str(e))
+
+
+def _iter_mat_blocks_numpy(file: str, sep: str) -> Iterator:
+    # lines are validated as the pure parser does, so spaces are only allowed around lines
+    illegal = _illegal_table(sep)
+    cols_cnt = 0
+    ln = 0
+
+    with open(file) as mat_f:
+        while lines := list(islice(mat_f, IMP_CHUNK_ROWS)):
+            text = ''.join(lines)
+            ln += len(lines)
 
-        ls = list(map(lambda l: l.strip(), ls))
+            if text.strip() == '':
+                continue
 
-        # delete any blank lines
-        ls = list(filter(lambda l: l.strip() != '', ls))
+            try:
+                if ''.join(map(str.strip, lines)).translate(illegal):
+                    raise ValueError
+                block = backend.np.loadtxt(lines, delimiter=sep, dtype=backend.np.float64, ndmin=2)
+            except ValueError as e:
+                raise MatrixFileInvalid(file, _locate_lines(lines, ln - len(lines), sep) or f"could not be parsed: {e}") from None
 
-        # in matrix files, only 'separator char', 0-9 and '.' are allowed. so filtering other chars
-        if re.search(f"[^0-9.{sep}]", ''.join(ls)):
-            raise MatrixFileInvalid(file,
-                                    f"contains non-standard chars. it must only contain chars: ['{sep}','0','1','2','3','4','5','6','7','8','9','.'] and standard newline char")
+            if cols_cnt == 0:
+                cols_cnt = block.shape[1]
+            elif block.shape[1] != cols_cnt:
+                raise MatrixFileInvalid(file, f"has a row with {block.shape[1]} cols but previous rows have {cols_cnt} cols")
 
-        # ignore first empty lines in file by increasing 'base pointer' var until first non-empty line is reached.
-        bp = 0
-        while bp < len(ls) and len(ls[bp].strip()) == 0:
-            bp += 1
+            yield block
 
-        if bp >= len(ls):
-            raise MatrixFileInvalid(file, "does not contain any matrix")
+    if cols_cnt == 0:
+        raise MatrixFileInvalid(file, "does not contain any matrix")
 
-        mat: lst_dec_2d_t = list(map(lambda l: list(map(lambda el: Decimal(el.strip()), l.split(sep))), ls))
-        del ls
 
-        # rows should be at least 1, there is no need to check
-        rows_cnt = len(mat)
-        cols_cnt = len(mat[0])
+def _locate_lines(lines: list[str], first_ln: int, sep: str) -> str | None:
+    for ln, line in enumerate(lines, first_ln + 1):
+        if line.strip() and (msg := _locate(line, ln, sep, float)):
+            return msg
 
-        return Matrix(rows_cnt, cols_cnt, mat)
+    return None
 
 
-def imp_vec_file(file: str) -> Vector:
+@instrument.imports
+def imp_vec_file(file: str, dtype: dtype_t = "decimal") -> Vector:
     """
     Import vector from a file. The file containing vector should have the following syntax:
 
@@ -89,39 +314,301 @@ def imp_vec_file(file: str) -> Vector:
         - last char in end of each line (except for last line) should be same for all lines.
         - last line could also be newline.
         - rows count of vector is gathered from file automatically.
-        - elements would be read as Decimal floating-point numbers with precision that is defined in configurations.
+        - elements would be read as Decimal floating-point numbers with precision that is defined in configurations
+          (see matpak.set_precision()), as float numbers if dtype is "float64", or as fixed-point numbers with
+          the smallest scale holding all elements exactly if dtype is "fixed".
+
+    file is streamed line by line; each line is validated and converted in a single pass. float64 vectors are
+    parsed by numpy when numpy backend is active.
+
+    if there is any issue, an exception would be raised. beside standard exceptions, there are following
+    custom exceptions that would be raised in special scenarios:
+        1- file empty or no vector exists: VectorFileInvalid
+        2- line contains non-standard chars or an invalid number: VectorFileInvalid. error message reports line
+           and column of bad input.
 
     :param file: path to vector file. each element in file represents a vector element.
+    :param dtype: elements storage type of vector; "decimal" by default.
 
     :return: vec_t
     """
+    if dtype == "float64" and backend.active_backend() == "numpy":
+        return _imp_vec_file_numpy(file)
+
+    conv = _converter(dtype)
+
+    # in vector files, only '-', 0-9 and '.' are allowed. lines are validated and converted in a single pass
+    illegal = _illegal_table()
+    vec: lst_dec_1d_t = []
+
+    with open(file) as vec_f:
+        for ln, line in enumerate(vec_f, 1):
+            l = line.strip()
+
+            # ignore any blank lines
+            if l == '':
+                continue
+
+            try:
+                if l.translate(illegal):
+                    raise ValueError
+                vec.append(conv(l))
+            except (ArithmeticError, ValueError):
+                raise VectorFileInvalid(file, _locate(line, ln, '', conv)) from None
+
+    if not vec:
+        raise VectorFileInvalid(file, "does not contain any vector")
+
+    return Vector(len(vec), vec, dtype)
+
+
+def _imp_vec_file_numpy(file: str) -> Vector:
     with open(file) as vec_f:
-        ls = vec_f.readlines()
+        text = vec_f.read()
+
+    if text.strip() == '':
+        raise VectorFileInvalid(file, "does not contain any vector")
+
+    try:
+        if ''.join(map(str.strip, text.splitlines())).translate(_illegal_table()):
+            raise ValueError
+        arr = backend.np.loadtxt(io.StringIO(text), dtype=backend.np.float64, ndmin=1)
+    except ValueError as e:
+        raise VectorFileInvalid(file, _locate_lines(text.splitlines(), 0, '') or f"could not be parsed: {e}") from None
+
+    return instrument.allocated(Vector.from_numpy(arr))
+
+
+def _fixed_str(el: int, scale: int) -> str:
+    if scale == 0:
+        return str(el)
+
+    digits = str(abs(el)).rjust(scale + 1, '0')
+    return f"{'-' if el < 0 else ''}{digits[:-scale]}.{digits[-scale:]}"
+
+
+def _float_str(el: float) -> str:
+    # shortest repr of a float, without exponent notation
+    return format(Decimal(repr(el)), 'f')
+
+
+def _dec_str(el: Decimal) -> str:
+    return format(el, 'f')
+
+
+def _any_str(el) -> str:
+    if isinstance(el, float):
+        return _float_str(el)
+    if isinstance(el, Decimal):
+        return format(el, 'f')
+    return str(el)
+
+
+def _formatter(el, scale: int | None):
+    if scale is not None:
+        return partial(_fixed_str, scale=scale)
+    if isinstance(el, float):
+        return repr
+    if isinstance(el, Decimal):
+        return _dec_str
+    return str
 
-        if len(ls) <= 0:
-            raise VectorFileInvalid(file, "does not contain any matrix")
 
-        # delete any blank lines
-        ls = list(map(lambda l: l.strip(), ls))
-        ls = list(filter(lambda l: l.strip() != '', ls))
+class MatrixWriter:
+    def __init__(self, file: str, sep: str = ',', cols: int | None = None, scale: int | None = None):
+        """
+        initialize a streaming writer of a matrix file with the same syntax as imp_mat_file(). rows are appended
+        block by block by write_rows() or write(), so a matrix never has to be fully resident to be exported.
 
-        # in vector files, only 0-9 and '.' are allowed. so filtering other chars
-        if re.search(f"[^0-9.]", ''.join(ls)):
-            raise VectorFileInvalid(file,
-                                    f"contains non-standard chars. it must only contain chars: ['0','1','2','3','4','5','6','7','8','9','.'] and standard newline char")
+        rows are written to a temp file next to file, which replaces file atomically on close(); if writing fails
+        or the writer is used as a context manager and its block raises, temp file is removed and file is left
+        untouched, so readers never see a partial matrix.
 
-        # ignore first empty lines in file by increasing 'base pointer' var until first non-empty line is reached.
-        bp = 0
-        while bp < len(ls) and len(ls[bp].strip()) == 0:
-            bp += 1
+        elements are written in plain notation (no exponents), so they are imported back exactly: Decimal elements
+        as they are, float elements by their shortest repr and fixed elements (ints, when scale is given) with
+        scale digits after decimal point.
 
-        if bp >= len(ls):
-            raise VectorFileInvalid(file, "does not contain any vector")
+        :param file: path to matrix file; it is overwritten on close() if exists.
+        :param sep: file's elements separator char; by default, it is comma ','.
+        :param cols: cols count that every row should have; by default, cols count of the first row.
+        :param scale: scale of fixed elements written by write_rows(); or None if rows are not raw fixed ints.
+        """
 
-        vec: lst_dec_1d_t = list(map(lambda el: Decimal(el.strip()), ls))
-        del ls
+        if sep == '' or any(ch in _NUM_CHARS + "\n" for ch in sep):
+            raise ValueError(f"separator {sep!r} could not be used in matrix files")
 
-        # rows should be at least 1, there is no need to check
-        rows_cnt = len(vec)
+        self.__sep = sep
+        self.__cols = cols
+        self.__scale = scale
+        self.__rows = 0
+        self.__illegal = _illegal_table(sep)
+
+        self.__atomic = AtomicFile(file, "w", encoding="ascii", newline='\n')
+        self.__f = self.__atomic.f
+
+    def __enter__(self) -> "MatrixWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    @property
+    def rows(self) -> int:
+        """
+        get rows count written so far.
+
+        :return: int
+        """
+        return self.__rows
+
+    @property
+    def closed(self) -> bool:
+        """
+        check whether writer is closed or aborted.
+
+        :return: bool
+        """
+        return self.__f.closed
+
+    def write_rows(self, rows: Iterable) -> int:
+        """
+        append a block of rows; each row is a sequence of Decimal, float or int elements (or a memoryview row
+        of a float64 matrix).
+
+        :param rows: rows to be appended.
+        :return: rows count appended.
+        """
+
+        if self.__f.closed:
+            raise ValueError("matrix writer is closed")
+
+        sep, illegal = self.__sep, self.__illegal
+        fmt = None
+        lines = []
+
+        for row in rows:
+            if isinstance(row, memoryview):
+                row = row.tolist()
+
+            if self.__cols is None:
+                self.__cols = len(row)
+            if len(row) != self.__cols or not row:
+                raise MatrixDimensionInvalid(
+                    f"row {self.__rows + len(lines) + 1} has {len(row)} cols but matrix should have {self.__cols} cols")
+
+            if fmt is None:
+                fmt = _formatter(row[0], self.__scale)
+
+            line = sep.join(map(fmt, row))
+            if line.translate(illegal):
+                # floats could be in exponent notation or row could mix element types; every element is
+                # formatted by its own type then. non-finite elements could not be written at all
+                if self.__scale is None:
+                    line = sep.join(map(_any_str, row))
+                if line.translate(illegal):
+                    raise ValueError(f"row {self.__rows + len(lines) + 1} has elements which could not be written "
+                                     f"to a matrix file")
+
+            lines.append(line)
+            lines.append("\n")
+
+        self.__f.write(''.join(lines))
+        self.__rows += len(lines) // 2
+
+        return len(lines) // 2
+
+    def write(self, mat: "Matrix | TransposedMatrix") -> int:
+        """
+        append all rows of a matrix, EXP_CHUNK_ROWS rows at a time.
+
+        :param mat: Matrix or TransposedMatrix; fixed elements are written with their scale.
+        :return: rows count appended.
+        """
+
+        if self.__scale is not None:
+            same = mat.dtype == "fixed" and mat.scale == self.__scale
+            rows = (mat if same else mat.astype("fixed", self.__scale)).raw
+        elif mat.dtype == "fixed":
+            rows = mat.tolist()
+        else:
+            rows = mat.raw
+
+        for start in range(0, len(rows), EXP_CHUNK_ROWS):
+            self.write_rows(rows[start:start + EXP_CHUNK_ROWS])
+
+        return len(rows)
+
+    def close(self):
+        """
+        flush written rows to disk and atomically replace file by them. an empty matrix could not be written,
+        so writer is aborted if no rows are written.
+        """
+
+        if self.__f.closed:
+            return
+
+        if self.__rows == 0:
+            self.abort()
+            raise MatrixDimensionInvalid("could not write a matrix without any rows")
+
+        self.__atomic.commit()
+
+    def abort(self):
+        """
+        discard written rows; file is left untouched.
+        """
+        self.__atomic.abort()
+
+
+def exp_mat_file(mat: "Matrix | TransposedMatrix", file: str, sep: str = ','):
+    """
+    Export matrix to a file with the same syntax as imp_mat_file(), so imp_mat_file(file, sep, dtype) returns
+    an equal matrix. rows are formatted and written in blocks, and file is replaced atomically once all of them
+    are written; see MatrixWriter.
+
+    :param mat: Matrix or TransposedMatrix to be exported.
+    :param file: path to matrix file; it is overwritten if exists.
+    :param sep: file's elements separator char; by default, it is comma ','.
+    """
+    with MatrixWriter(file, sep, mat.shape[1], mat.scale) as writer:
+        writer.write(mat)
+
+
+def exp_vec_file(vec: Vector, file: str):
+    """
+    Export vector to a file with the same syntax as imp_vec_file(), so imp_vec_file(file, dtype) returns an
+    equal vector. file is replaced atomically once all elements are written; see MatrixWriter.
+
+    :param vec: vector to be exported.
+    :param file: path to vector file; it is overwritten if exists.
+    """
+    # a vector file is a single col matrix file, so separator is never written
+    with MatrixWriter(file, ',', 1, vec.scale) as writer:
+        raw = vec.raw.tolist() if isinstance(vec.raw, memoryview) else vec.raw
+
+        for start in range(0, len(raw), EXP_CHUNK_ROWS):
+            writer.write_rows([el] for el in raw[start:start + EXP_CHUNK_ROWS])
+
+
+def exp_mat_product_file(lhs: Matrix, rhs: "Matrix | TransposedMatrix", file: str, sep: str = ',',
+                         block_rows: int = 256):
+    """
+    Export product of lhs and rhs matrices to a file with the same syntax as imp_mat_file(), while it is being
+    computed: result rows are computed block_rows at a time by Matrix.iter_multiply_rows() and written right away,
+    so only one block of result is resident at a time. file is replaced atomically once the whole product is
+    written; see MatrixWriter.
+
+    :param lhs: left hand side Matrix.
+    :param rhs: right hand side Matrix or TransposedMatrix; dimensions of rhs should be valid for multiplication.
+    :param file: path to matrix file; it is overwritten if exists.
+    :param sep: file's elements separator char; by default, it is comma ','.
+    :param block_rows: result rows count computed and written at once.
+    """
+    scale = max(lhs.scale, rhs.scale) if lhs.dtype == rhs.dtype == "fixed" else None
 
-        return Vector(rows_cnt, vec)
+    with MatrixWriter(file, sep, rhs.shape[1], scale) as writer:
+        for block in lhs.iter_multiply_rows(rhs, block_rows):
+            writer.write_rows(block)
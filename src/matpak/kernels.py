@@ -0,0 +1,414 @@
+from array import array
+from decimal import Decimal
+from operator import add, mul, sub
+
+from .types import lst_dec_2d_t
+
+
+# multiplication kernels work directly on raw row storage (lists of rows), so there is no bounds check
+# or method dispatch per scalar step. every kernel writes the product of 'lhs' (n*m) and 'rhs' (m*p) into
+# 'out' (n*p). each out[i][k] is accumulated over j in ascending order, so for Decimal and fixed (int) elements
+# all kernels return exactly the same values as the classical triple loop. float elements could differ in last
+# bits between kernels: dot kernels sum by sum(), which is compensated on python 3.12+, while the others add
+# in plain float arithmetic.
+#
+# rows could also be memoryview slices of a float64 buffer; whole-row stores go through _store(), since
+# buffers only accept slices assigned from buffers of the same format.
+
+DEFAULT_BLOCK_SIZE = 64
+DEFAULT_STRASSEN_CROSSOVER = 64
+
+
+def _store(dst, vals: list, start: int = 0, stop: int | None = None):
+    if isinstance(dst, list):
+        dst[start:stop] = vals
+    else:
+        dst[start:stop] = array('d', vals)
+
+
+def _as_lists(rows: list) -> list:
+    # iterating a memoryview is much slower than iterating a list, and copying buffer rows to lists is cheap
+    if rows and isinstance(rows[0], memoryview):
+        return [row.tolist() for row in rows]
+    return rows
+
+
+def transpose(rows: lst_dec_2d_t) -> list[tuple]:
+    """
+    get columns of a raw matrix as tuples.
+
+    :param rows: raw matrix rows.
+    :return: list of column tuples.
+    """
+    return list(zip(*rows))
+
+
+def mul_dot(lhs: lst_dec_2d_t, rhs: lst_dec_2d_t, out: lst_dec_2d_t):
+    """
+    multiply by dotting every cached lhs row with every cached rhs column.
+
+    :param lhs: raw n*m lhs rows.
+    :param rhs: raw m*p rhs rows.
+    :param out: raw n*p rows that the result is stored in; previous values are overwritten.
+    """
+    mul_dot_cols(lhs, transpose(rhs), out)
+
+
+def mul_dot_cols(lhs: lst_dec_2d_t, cols: list, out: lst_dec_2d_t):
+    """
+    multiply by dotting every lhs row with every given rhs column; used when rhs columns are already available.
+
+    :param lhs: raw n*m lhs rows.
+    :param cols: p rhs columns, each one a sequence of m elements.
+    :param out: raw n*p rows that the result is stored in; previous values are overwritten.
+    """
+    cols = _as_lists(cols)
+    unrolled = _UNROLLED_DOTS.get(len(cols[0]))
+
+    if unrolled is not None and not isinstance(cols[0][0], float):
+        unrolled(lhs, cols, out)
+        return
+
+    for row, out_row in zip(_as_lists(lhs), out):
+        _store(out_row, [sum(map(mul, row, col)) for col in cols])
+
+
+# dots of 2, 3 or 4 elements (e.g, products of small transforms) are unrolled, which saves a sum() and a map() call
+# per out element. they start from 0 as sum() does, so Decimal results keep the same exponent. float dots are not
+# unrolled, since sum() of floats is compensated on python 3.12+ and results would differ in last bits.
+
+def _dots_2(lhs: lst_dec_2d_t, cols: list, out: lst_dec_2d_t):
+    for (a0, a1), out_row in zip(lhs, out):
+        out_row[:] = [0 + a0 * b0 + a1 * b1 for b0, b1 in cols]
+
+
+def _dots_3(lhs: lst_dec_2d_t, cols: list, out: lst_dec_2d_t):
+    for (a0, a1, a2), out_row in zip(lhs, out):
+        out_row[:] = [0 + a0 * b0 + a1 * b1 + a2 * b2 for b0, b1, b2 in cols]
+
+
+def _dots_4(lhs: lst_dec_2d_t, cols: list, out: lst_dec_2d_t):
+    for (a0, a1, a2, a3), out_row in zip(lhs, out):
+        out_row[:] = [0 + a0 * b0 + a1 * b1 + a2 * b2 + a3 * b3 for b0, b1, b2, b3 in cols]
+
+
+_UNROLLED_DOTS = {2: _dots_2, 3: _dots_3, 4: _dots_4}
+
+
+def mul_blocked(lhs: lst_dec_2d_t, rhs: lst_dec_2d_t, out: lst_dec_2d_t, block_size: int = DEFAULT_BLOCK_SIZE):
+    """
+    multiply with tiled loops. each lhs element of a tile is scaled into a cached out row slice, which keeps
+    the working set of a tile small on large matrices.
+
+    :param lhs: raw n*m lhs rows.
+    :param rhs: raw m*p rhs rows.
+    :param out: raw n*p rows that the result is accumulated into; should be zero filled.
+    :param block_size: tile edge size.
+    """
+    if block_size <= 0:
+        raise ValueError(f"block size {block_size} should be positive")
+
+    n, m, p = len(lhs), len(rhs), len(rhs[0])
+
+    for i0 in range(0, n, block_size):
+        i1 = min(i0 + block_size, n)
+        for k0 in range(0, p, block_size):
+            k1 = min(k0 + block_size, p)
+            for j0 in range(0, m, block_size):
+                j1 = min(j0 + block_size, m)
+                rhs_tile = [rhs[j][k0:k1] for j in range(j0, j1)]
+
+                for i in range(i0, i1):
+                    lhs_row = lhs[i]
+                    acc = out[i][k0:k1]
+                    for j in range(j0, j1):
+                        a = lhs_row[j]
+                        acc = [c + a * b for c, b in zip(acc, rhs_tile[j - j0])]
+                    _store(out[i], acc, k0, k1)
+
+
+def mul_naive(lhs: lst_dec_2d_t, rhs: lst_dec_2d_t, out: lst_dec_2d_t):
+    """
+    multiply with the classical i-k-j triple loop. kept as the reference kernel.
+
+    :param lhs: raw n*m lhs rows.
+    :param rhs: raw m*p rhs rows.
+    :param out: raw n*p rows that the result is accumulated into; should be zero filled.
+    """
+    m, p = len(rhs), len(rhs[0])
+
+    for lhs_row, out_row in zip(lhs, out):
+        for k in range(p):
+            acc = out_row[k]
+            for j in range(m):
+                acc += lhs_row[j] * rhs[j][k]
+            out_row[k] = acc
+
+
+def mul_col_major(lhs: lst_dec_2d_t, rhs: lst_dec_2d_t, out: lst_dec_2d_t):
+    """
+    multiply with col-major loop order: for each out col, every lhs col is scaled and accumulated.
+
+    :param lhs: raw n*m lhs rows.
+    :param rhs: raw m*p rhs rows.
+    :param out: raw n*p rows that the result is accumulated into; should be zero filled.
+    """
+    lhs_cols = transpose(lhs)
+
+    for k in range(len(rhs[0])):
+        acc = [row[k] for row in out]
+        for lhs_col, rhs_row in zip(lhs_cols, rhs):
+            b = rhs_row[k]
+            acc = [c + a * b for c, a in zip(acc, lhs_col)]
+        for out_row, c in zip(out, acc):
+            out_row[k] = c
+
+
+def mul_vec(lhs: lst_dec_2d_t, vec, out):
+    """
+    multiply raw matrix by raw vector.
+
+    :param lhs: raw n*m matrix rows.
+    :param vec: raw m vector elements.
+    :param out: raw n vector elements that the result is stored in; previous values are overwritten.
+    """
+    _store(out, [sum(map(mul, row, vec)) for row in lhs])
+
+
+# elementwise kernels update raw rows in place; each row is rebuilt once and stored back, so row lists
+# and float64 buffers are reused.
+
+def zero(dtype: str):
+    """
+    get zero element of dtype.
+
+    :param dtype: "decimal", "float64" or "fixed".
+    :return: Decimal, float or int
+    """
+    return 0.0 if dtype == "float64" else 0 if dtype == "fixed" else Decimal(0)
+
+
+def as_scalar(val, dtype: str):
+    """
+    convert a scalar to elements type of dtype. floats become Decimal through their shortest repr.
+
+    :param val: int, float or Decimal scalar.
+    :param dtype: "decimal" or "float64".
+    :return: Decimal or float
+    """
+    if dtype == "float64":
+        return float(val)
+    if isinstance(val, float):
+        return Decimal(repr(val))
+    return Decimal(val)
+
+
+def fill(rows: lst_dec_2d_t, val):
+    """
+    overwrite every element of raw rows with val.
+
+    :param rows: raw rows.
+    :param val: scalar to store.
+    """
+    for row in rows:
+        _store(row, [val] * len(row))
+
+
+def axpy(alpha, x: lst_dec_2d_t, y: lst_dec_2d_t):
+    """
+    y = y + alpha * x, elementwise in place.
+
+    :param alpha: scalar of x; or None to add x as is.
+    :param x: raw rows.
+    :param y: raw rows with same shape as x, which are updated.
+    """
+    for x_row, y_row in zip(_as_lists(x), y):
+        y_vals = y_row.tolist() if isinstance(y_row, memoryview) else y_row
+        if alpha is None:
+            _store(y_row, list(map(add, y_vals, x_row)))
+        else:
+            _store(y_row, [b + alpha * a for a, b in zip(x_row, y_vals)])
+
+
+def scale(alpha, rows: lst_dec_2d_t):
+    """
+    rows = alpha * rows, elementwise in place.
+
+    :param alpha: scalar.
+    :param rows: raw rows, which are updated.
+    """
+    for row in rows:
+        _store(row, [alpha * a for a in (row.tolist() if isinstance(row, memoryview) else row)])
+
+
+def combine(alpha, x: lst_dec_2d_t, beta=None, y: lst_dec_2d_t | None = None) -> list[list]:
+    """
+    get new rows of alpha * x + beta * y, elementwise in one pass.
+
+    :param alpha: scalar of x; or None to take x as is.
+    :param x: raw rows.
+    :param beta: scalar of y; or None to take y as is.
+    :param y: raw rows with same shape as x; or None to get alpha * x only.
+    :return: list of row lists.
+    """
+    x = _as_lists(x)
+
+    if y is None:
+        return [list(row) if alpha is None else [alpha * a for a in row] for row in x]
+
+    y = _as_lists(y)
+
+    if alpha is None and beta is None:
+        return [list(map(add, a, b)) for a, b in zip(x, y)]
+    if alpha is None and beta == -1:
+        return [list(map(sub, a, b)) for a, b in zip(x, y)]
+    if alpha is None:
+        return [[a + beta * b for a, b in zip(x_row, y_row)] for x_row, y_row in zip(x, y)]
+    if beta is None:
+        return [[alpha * a + b for a, b in zip(x_row, y_row)] for x_row, y_row in zip(x, y)]
+
+    return [[alpha * a + beta * b for a, b in zip(x_row, y_row)] for x_row, y_row in zip(x, y)]
+
+
+def _accumulate(alpha, dots: list, beta, old) -> list:
+    # alpha * dots + beta * old, where beta of 0 drops old values as they are (even if they are not finite)
+    if alpha is not None:
+        dots = [alpha * d for d in dots]
+
+    if beta == 0:
+        return dots
+
+    old = old.tolist() if not isinstance(old, list) else old
+
+    if beta is None:
+        return list(map(add, dots, old))
+
+    return [d + beta * c for d, c in zip(dots, old)]
+
+
+def gemm_cols(alpha, lhs: lst_dec_2d_t, cols: list, beta, out: lst_dec_2d_t):
+    """
+    out = alpha * lhs * rhs + beta * out, fused: every lhs row is dotted with every given rhs column and combined
+    with its out row right away, so no product matrix is allocated and each out row is stored once.
+
+    :param alpha: scalar of product; or None to take product as is.
+    :param lhs: raw n*m lhs rows.
+    :param cols: p rhs columns, each one a sequence of m elements.
+    :param beta: scalar of out; or None to add product to out as is; 0 to overwrite out.
+    :param out: raw n*p rows, which are updated.
+    """
+    cols = _as_lists(cols)
+
+    for row, out_row in zip(_as_lists(lhs), out):
+        _store(out_row, _accumulate(alpha, [sum(map(mul, row, col)) for col in cols], beta, out_row))
+
+
+def gemv(alpha, lhs: lst_dec_2d_t, vec, beta, out):
+    """
+    out = alpha * lhs * vec + beta * out, fused in one pass over lhs rows. all dots are computed before out is
+    stored, so out could be vec itself.
+
+    :param alpha: scalar of product; or None to take product as is.
+    :param lhs: raw n*m matrix rows.
+    :param vec: raw m vector elements.
+    :param beta: scalar of out; or None to add product to out as is; 0 to overwrite out.
+    :param out: raw n vector elements, which are updated.
+    """
+    _store(out, _accumulate(alpha, [sum(map(mul, row, vec)) for row in _as_lists(lhs)], beta, out))
+
+
+def _add(lhs: lst_dec_2d_t, rhs: lst_dec_2d_t) -> lst_dec_2d_t:
+    return [list(map(add, a, b)) for a, b in zip(lhs, rhs)]
+
+
+def _sub(lhs: lst_dec_2d_t, rhs: lst_dec_2d_t) -> lst_dec_2d_t:
+    return [list(map(sub, a, b)) for a, b in zip(lhs, rhs)]
+
+
+def _split(rows: lst_dec_2d_t, h: int) -> tuple[lst_dec_2d_t, lst_dec_2d_t, lst_dec_2d_t, lst_dec_2d_t]:
+    return [r[:h] for r in rows[:h]], [r[h:] for r in rows[:h]], [r[:h] for r in rows[h:]], [r[h:] for r in rows[h:]]
+
+
+def _strassen(lhs: lst_dec_2d_t, rhs: lst_dec_2d_t, crossover: int) -> lst_dec_2d_t:
+    n = len(lhs)
+
+    if n <= crossover:
+        out = [[None] * n for _ in range(n)]
+        mul_dot(lhs, rhs, out)
+        return out
+
+    h = n // 2
+    a11, a12, a21, a22 = _split(lhs, h)
+    b11, b12, b21, b22 = _split(rhs, h)
+
+    m1 = _strassen(_add(a11, a22), _add(b11, b22), crossover)
+    m2 = _strassen(_add(a21, a22), b11, crossover)
+    m3 = _strassen(a11, _sub(b12, b22), crossover)
+    m4 = _strassen(a22, _sub(b21, b11), crossover)
+    m5 = _strassen(_add(a11, a12), b22, crossover)
+    m6 = _strassen(_sub(a21, a11), _add(b11, b12), crossover)
+    m7 = _strassen(_sub(a12, a22), _add(b21, b22), crossover)
+
+    c11 = _add(_sub(_add(m1, m4), m5), m7)
+    c12 = _add(m3, m5)
+    c21 = _add(m2, m4)
+    c22 = _add(_add(_sub(m1, m2), m3), m6)
+
+    return [r1 + r2 for r1, r2 in zip(c11, c12)] + [r1 + r2 for r1, r2 in zip(c21, c22)]
+
+
+def strassen_size(n: int, m: int, p: int, crossover: int) -> int:
+    """
+    get edge size of the square matrices that n*m and m*p operands are padded to. the size is the smallest
+    one that can be halved evenly down to a block not larger than crossover.
+
+    :param n: lhs rows count.
+    :param m: lhs cols count and rhs rows count.
+    :param p: rhs cols count.
+    :param crossover: edge size below which classical kernel is used.
+    :return: padded edge size.
+    """
+    size = max(n, m, p)
+    levels = 0
+
+    while size > crossover:
+        size = (size + 1) // 2
+        levels += 1
+
+    return size << levels
+
+
+def mul_strassen(lhs: lst_dec_2d_t, rhs: lst_dec_2d_t, out: lst_dec_2d_t, crossover: int = DEFAULT_STRASSEN_CROSSOVER):
+    """
+    multiply with recursive Strassen algorithm. operands are zero padded to square matrices of
+    strassen_size() edge, and blocks with edge not larger than crossover are multiplied by mul_dot.
+
+    note that the additions and subtractions of Strassen algorithm round differently than the classical
+    summation, so results are only identical to other kernels if arithmetic is exact.
+
+    :param lhs: raw n*m lhs rows.
+    :param rhs: raw m*p rhs rows.
+    :param out: raw n*p rows that the result is stored in; previous values are overwritten.
+    :param crossover: edge size below which classical kernel is used.
+    """
+    if crossover <= 0:
+        raise ValueError(f"crossover {crossover} should be positive")
+
+    n, m, p = len(lhs), len(rhs), len(rhs[0])
+    size = strassen_size(n, m, p, crossover)
+    zero = type(lhs[0][0])(0)
+
+    a = [list(r) + [zero] * (size - m) for r in lhs] + [[zero] * size for _ in range(size - n)]
+    b = [list(r) + [zero] * (size - p) for r in rhs] + [[zero] * size for _ in range(size - m)]
+
+    res = _strassen(a, b, crossover)
+
+    for out_row, res_row in zip(out, res):
+        _store(out_row, res_row[:p])
+
+
+KERNELS = {
+    "dot": mul_dot,
+    "blocked": mul_blocked,
+    "naive": mul_naive,
+}
@@ -0,0 +1,164 @@
+from .errors import MultiplicationDimensionMismatched
+from .mat import Matrix
+from .vec import Vector
+from .types import common_dtype
+from . import backend, config, fixed, instrument, kernels
+
+
+class LazyProduct:
+    def __init__(self, operands: list["Matrix | Vector"]):
+        """
+        initialize a deferred product of a chain of matrices and vectors. no multiplication is done until
+        evaluate() is called; then the association order with the fewest scalar multiplications is chosen by
+        matrix-chain dynamic programming, e.g, A.B.C.v is evaluated as A(B(Cv)) with matrix-vector products only.
+
+        use Matrix.lazy() or Vector.lazy() to start a chain.
+
+        :param operands: chain operands in multiplication order; dimensions of neighbours should be valid for multiplication.
+        """
+
+        for lhs, rhs in zip(operands, operands[1:]):
+            if lhs.shape[1] != rhs.shape[0]:
+                raise MultiplicationDimensionMismatched(lhs.shape, rhs.shape)
+
+        self.__operands = list(operands)
+        self.__order: tuple[int, list[list[int]]] | None = None
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        get result dimensions without evaluating the product.
+
+        :return: a tuple of result rows*cols
+        """
+        return self.__operands[0].shape[0], self.__operands[-1].shape[1]
+
+    @property
+    def operands(self) -> list["Matrix | Vector"]:
+        """
+        get chain operands.
+
+        :return: list of Matrix or Vector objects.
+        """
+        return self.__operands
+
+    def lazy(self) -> "LazyProduct":
+        """
+        get chain itself, so chains and operands could be used interchangeably.
+
+        :return: LazyProduct
+        """
+        return self
+
+    def multiply(self, rhs: "Matrix | Vector | LazyProduct") -> "LazyProduct":
+        """
+        append rhs to the chain. nothing is computed.
+
+        :param rhs: right hand side, could be Matrix, Vector or other LazyProduct.
+        :return: LazyProduct
+        """
+
+        if self.shape[1] != rhs.shape[0]:
+            raise MultiplicationDimensionMismatched(self.shape, rhs.shape)
+
+        return LazyProduct(self.__operands + (rhs.operands if isinstance(rhs, LazyProduct) else [rhs]))
+
+    def __optimize(self) -> tuple[int, list[list[int]]]:
+        if self.__order is not None:
+            return self.__order
+
+        n = len(self.__operands)
+        dims = [op.shape[0] for op in self.__operands] + [self.shape[1]]
+
+        # cost[i][j]: fewest scalar multiplications of operands i..j; split[i][j]: last split point of that product
+        cost = [[0] * n for _ in range(n)]
+        split = [[0] * n for _ in range(n)]
+
+        for length in range(2, n + 1):
+            for i in range(n - length + 1):
+                j = i + length - 1
+                cost[i][j], split[i][j] = min(
+                    (cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1], k) for k in range(i, j))
+
+        self.__order = cost[0][n - 1], split
+        return self.__order
+
+    @property
+    def flops(self) -> int:
+        """
+        get scalar multiplications count of the optimal association order.
+
+        :return: int
+        """
+        return self.__optimize()[0]
+
+    def plan(self) -> str:
+        """
+        get the optimal association order, with operands named by their chain position, e.g, "(A0 (A1 A2))".
+
+        :return: str
+        """
+        split = self.__optimize()[1]
+
+        def paren(i: int, j: int) -> str:
+            if i == j:
+                return f"A{i}"
+            return f"({paren(i, split[i][j])} {paren(split[i][j] + 1, j)})"
+
+        return paren(0, len(self.__operands) - 1)
+
+    @config.in_context
+    def evaluate(self) -> "Matrix | Vector":
+        """
+        compute the chain product in its optimal association order. intermediate products are kept as raw rows
+        and released as soon as they are consumed, so no intermediate Matrix objects are allocated.
+
+        fixed chains are computed exactly and only the result is rounded, to the largest scale of operands.
+
+        :return: Vector if the last operand is a vector, else Matrix.
+        """
+
+        split = self.__optimize()[1]
+        operands = self.__operands
+
+        if len(operands) == 1:
+            return operands[0].astype(operands[0].dtype)
+
+        if backend.numpy_enabled(*operands):
+            leaves = [op.to_numpy().reshape(op.shape) for op in operands]
+            mul = backend.np.matmul
+        else:
+            dtype = common_dtype(*(op.dtype for op in operands))
+            leaves = [(op if op.dtype == dtype else op.astype(dtype)).raw for op in operands]
+            leaves = [[[el] for el in leaf] if isinstance(op, Vector) else leaf for op, leaf in zip(operands, leaves)]
+
+            def mul(lhs, rhs):
+                out = [[None] * len(rhs[0]) for _ in range(len(lhs))]
+                kernels.mul_dot(lhs, rhs, out)
+                return out
+
+        def product(i: int, j: int):
+            if i == j:
+                return leaves[i]
+            return mul(product(i, split[i][j]), product(split[i][j] + 1, j))
+
+        res = product(0, len(operands) - 1)
+        rows, cols = self.shape
+
+        if backend.numpy_enabled(*operands):
+            if isinstance(operands[-1], Vector):
+                return instrument.allocated(Vector.from_numpy(res.reshape(rows)))
+            return instrument.allocated(Matrix.from_numpy(res))
+
+        if dtype == "fixed":
+            scale = max(op.scale for op in operands)
+            fixed.rescale(res, sum(op.scale for op in operands), scale)
+
+            if isinstance(operands[-1], Vector):
+                return instrument.allocated(Vector.from_fixed(rows, [row[0] for row in res], scale))
+            return instrument.allocated(Matrix.from_fixed(rows, cols, res, scale))
+
+        if isinstance(operands[-1], Vector):
+            return Vector(rows, [row[0] for row in res], dtype)
+
+        return Matrix.from_rows(res, dtype, validate=False)
@@ -0,0 +1,351 @@
+import math
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from operator import mul
+from typing import Iterable
+
+from .errors import MatrixDimensionInvalid, MatrixNotPositiveDefinite, MatrixSingular, VectorDimensionInvalid
+from .mat import Matrix
+from .vec import Vector
+from . import backend, config, instrument, kernels
+
+
+# factorizations work on raw row storage like multiplication kernels do: decimal rows are lists of Decimal,
+# float64 rows are lists of floats, or memoryview rows of the matrix buffer when it is factored in place (a numpy
+# view of the buffer on numpy backend). fixed matrices are factored as decimal, since their factors do not fit
+# the scale of matrix elements.
+#
+# a factorization is computed once in O(n^3) and then every solve() costs O(n^2), so one factorization should
+# be reused for all right hand sides of a matrix.
+
+
+def _rows(mat: Matrix, overwrite: bool) -> tuple[str, list]:
+    if mat.dtype == "fixed":
+        if overwrite:
+            raise ValueError("fixed matrices could not be factored in place; convert it by astype('decimal') first")
+        return "decimal", mat.astype("decimal").raw
+
+    if mat.dtype == "float64" and backend.numpy_enabled(mat):
+        arr = mat.to_numpy()
+        return "numpy", arr if overwrite else arr.copy()
+
+    if mat.dtype == "float64":
+        # iterating memoryview rows is slower than iterating lists, so a copy is factored on lists
+        return "float64", mat.raw if overwrite else kernels._as_lists(mat.raw)
+
+    return "decimal", mat.raw if overwrite else [list(row) for row in mat.raw]
+
+
+def _tail(row, start: int) -> list:
+    # elements of a row from start on, as a list
+    tail = row[start:]
+    return tail.tolist() if isinstance(tail, memoryview) else tail
+
+
+def _swap(a: list, i: int, j: int):
+    # buffer rows are views of fixed places in the buffer, so their elements are swapped instead of the rows
+    if isinstance(a[i], memoryview):
+        row_i = a[i].tolist()
+        a[i][:] = a[j]
+        kernels._store(a[j], row_i)
+    else:
+        a[i], a[j] = a[j], a[i]
+
+
+class _Factorization(ABC):
+    def __init__(self, mat: Matrix, overwrite: bool):
+        n, cols = mat.shape
+        if n != cols:
+            raise MatrixDimensionInvalid(f"could not factor {n}x{cols} matrix, it should be square")
+
+        self._n = n
+        self._kind, self._a = _rows(mat, overwrite)
+
+        try:
+            self._factor()
+        finally:
+            # rows are partly rewritten even if factoring fails on a singular matrix
+            if overwrite:
+                mat._changed()
+
+    @abstractmethod
+    def _factor(self):
+        pass
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        get dimensions of factored matrix.
+
+        :return: a tuple of matrix rows*cols
+        """
+        return self._n, self._n
+
+    @property
+    def dtype(self) -> str:
+        """
+        get elements type of factors and solutions: "decimal" (for fixed matrices too) or "float64".
+
+        :return: str
+        """
+        return "decimal" if self._kind == "decimal" else "float64"
+
+    def __rhs(self, vec: Vector) -> list:
+        if vec.shape[0] != self._n:
+            raise VectorDimensionInvalid(f"could not solve {self._n}x{self._n} system for a vector with "
+                                         f"{vec.shape[0]} rows")
+
+        if vec.dtype == self.dtype:
+            return list(vec.raw)
+
+        return list(vec.astype(self.dtype).raw)
+
+    @abstractmethod
+    def _solve(self, b: list) -> list:
+        pass
+
+    @config.in_context
+    def solve(self, vec: Vector) -> Vector:
+        """
+        solve matrix * x = vec for x by forward and back substitution in O(n^2). vec is converted to
+        factorization dtype if it is of another dtype.
+
+        :param vec: right hand side vector with rows count of matrix.
+        :return: Vector x of factorization dtype.
+        """
+        x = self._solve(self.__rhs(vec))
+
+        if self._kind == "numpy":
+            return instrument.allocated(Vector.from_numpy(x))
+
+        return Vector(self._n, x, self.dtype)
+
+    @config.in_context
+    def solve_many(self, vectors: Iterable[Vector]) -> list[Vector]:
+        """
+        solve matrix * x = vec for every vector; see solve().
+
+        :param vectors: right hand side vectors.
+        :return: list of Vector x, in the same order as vectors.
+        """
+        return [self.solve(vec) for vec in vectors]
+
+    @abstractmethod
+    def det(self) -> Decimal | float:
+        pass
+
+    @config.in_context
+    def inverse(self) -> Matrix:
+        """
+        get inverse of matrix by solving for every column of identity matrix.
+
+        :return: Matrix of factorization dtype.
+        """
+        n = self._n
+        one, zero = (1.0, 0.0) if self.dtype == "float64" else (Decimal(1), Decimal(0))
+        cols = []
+
+        for j in range(n):
+            e = [zero] * n
+            e[j] = one
+            x = self._solve(e)
+            cols.append(x.tolist() if self._kind == "numpy" else x)
+
+        return Matrix.from_rows([list(row) for row in zip(*cols)], self.dtype, validate=False)
+
+
+class LUFactorization(_Factorization):
+    @config.in_context
+    def __init__(self, mat: Matrix, overwrite: bool = False):
+        """
+        factor square matrix as P * matrix = L * U with partial pivoting: in every step, the row with the largest
+        pivot in magnitude is swapped in. L is unit lower triangular and U is upper triangular; both are kept in
+        a single n*n storage. decimal elements are computed under matpak precision (see matpak.set_precision()).
+
+        if there is any issue, an exception would be raised. beside standard exceptions, there are following
+        custom exceptions that would be raised in special scenarios:
+            1- matrix is not square: MatrixDimensionInvalid
+            2- matrix is singular, i.e, a zero pivot is met: MatrixSingular
+
+        :param mat: square matrix.
+        :param overwrite: factor matrix in place on its row storage (or float64 buffer) instead of a copy, so no
+        n*n storage is allocated; matrix rows are then the rows of L and U (below and above diagonal) of the row
+        permuted matrix. they are partly rewritten if a MatrixSingular is raised.
+        :return: LUFactorization
+        """
+        self._perm = list(range(mat.shape[0]))
+        self._sign = 1
+        super().__init__(mat, overwrite)
+
+    def _factor(self):
+        a, n, perm = self._a, self._n, self._perm
+
+        if self._kind == "numpy":
+            np = backend.np
+            for k in range(n):
+                p = k + int(np.argmax(np.abs(a[k:, k])))
+                if a[p, k] == 0:
+                    raise MatrixSingular(f"matrix is singular, no pivot is found for column {k}")
+
+                if p != k:
+                    a[[k, p]] = a[[p, k]]
+                    perm[k], perm[p] = perm[p], perm[k]
+                    self._sign = -self._sign
+
+                a[k + 1:, k] /= a[k, k]
+                a[k + 1:, k + 1:] -= np.outer(a[k + 1:, k], a[k, k + 1:])
+            return
+
+        for k in range(n):
+            p = max(range(k, n), key=lambda i: abs(a[i][k]))
+            if not a[p][k]:
+                raise MatrixSingular(f"matrix is singular, no pivot is found for column {k}")
+
+            if p != k:
+                _swap(a, k, p)
+                perm[k], perm[p] = perm[p], perm[k]
+                self._sign = -self._sign
+
+            pivot_row = a[k]
+            pivot, tail = pivot_row[k], _tail(pivot_row, k + 1)
+
+            for i in range(k + 1, n):
+                row = a[i]
+                f = row[k] / pivot
+                row[k] = f
+                if f:
+                    kernels._store(row, [el - f * t for el, t in zip(_tail(row, k + 1), tail)], k + 1)
+
+    @property
+    def perm(self) -> list[int]:
+        """
+        get row permutation: row i of L * U is row perm[i] of matrix.
+
+        :return: list of row indices.
+        """
+        return list(self._perm)
+
+    def _solve(self, b: list) -> list:
+        a, n = self._a, self._n
+        y = [b[p] for p in self._perm]
+
+        if self._kind == "numpy":
+            np = backend.np
+            y = np.array(y, dtype=np.float64)
+            for i in range(1, n):
+                y[i] -= a[i, :i] @ y[:i]
+            for i in range(n - 1, -1, -1):
+                y[i] = (y[i] - a[i, i + 1:] @ y[i + 1:]) / a[i, i]
+            return y
+
+        for i in range(1, n):
+            y[i] -= sum(map(mul, a[i][:i], y[:i]))
+        for i in range(n - 1, -1, -1):
+            row = a[i]
+            y[i] = (y[i] - sum(map(mul, row[i + 1:], y[i + 1:]))) / row[i]
+
+        return y
+
+    @config.in_context
+    def det(self) -> Decimal | float:
+        """
+        get determinant of matrix: product of U diagonal, negated for an odd row permutation.
+
+        :return: Decimal or float based on factorization dtype.
+        """
+        d = Decimal(self._sign) if self.dtype == "decimal" else float(self._sign)
+
+        for i in range(self._n):
+            d *= self._a[i][i]
+
+        return float(d) if self._kind == "numpy" else d
+
+
+class CholeskyFactorization(_Factorization):
+    @config.in_context
+    def __init__(self, mat: Matrix, overwrite: bool = False):
+        """
+        factor symmetric positive definite matrix as matrix = L * L^T, where L is lower triangular. only lower
+        triangle of matrix is read, so symmetry is not checked. it takes half the operations of LU
+        factorization and needs no pivoting. decimal elements are computed under matpak precision (see
+        matpak.set_precision()).
+
+        if there is any issue, an exception would be raised. beside standard exceptions, there are following
+        custom exceptions that would be raised in special scenarios:
+            1- matrix is not square: MatrixDimensionInvalid
+            2- matrix is not positive definite: MatrixNotPositiveDefinite
+
+        :param mat: square symmetric matrix.
+        :param overwrite: factor matrix in place on its row storage (or float64 buffer) instead of a copy; lower
+        triangle of matrix is then overwritten by L and upper triangle is left as it is. it is partly rewritten if a
+        MatrixNotPositiveDefinite is raised.
+        :return: CholeskyFactorization
+        """
+        super().__init__(mat, overwrite)
+
+    def _factor(self):
+        a, n = self._a, self._n
+
+        if self._kind == "numpy":
+            np = backend.np
+            for j in range(n):
+                d = a[j, j] - a[j, :j] @ a[j, :j]
+                if not d > 0:
+                    raise MatrixNotPositiveDefinite(f"matrix is not positive definite, pivot {j} is {d}")
+
+                d = math.sqrt(d)
+                a[j, j] = d
+                a[j + 1:, j] = (a[j + 1:, j] - a[j + 1:, :j] @ a[j, :j]) / d
+            return
+
+        sqrt = math.sqrt if self._kind == "float64" else Decimal.sqrt
+
+        for j in range(n):
+            row_j = a[j]
+            head = row_j[:j]
+            d = row_j[j] - sum(map(mul, head, head))
+            if not d > 0:
+                raise MatrixNotPositiveDefinite(f"matrix is not positive definite, pivot {j} is {d}")
+
+            d = sqrt(d)
+            row_j[j] = d
+
+            for i in range(j + 1, n):
+                row = a[i]
+                row[j] = (row[j] - sum(map(mul, row[:j], head))) / d
+
+    def _solve(self, b: list) -> list:
+        a, n = self._a, self._n
+        y = b
+
+        if self._kind == "numpy":
+            np = backend.np
+            y = np.array(y, dtype=np.float64)
+            for i in range(n):
+                y[i] = (y[i] - a[i, :i] @ y[:i]) / a[i, i]
+            for i in range(n - 1, -1, -1):
+                y[i] = (y[i] - a[i + 1:, i] @ y[i + 1:]) / a[i, i]
+            return y
+
+        for i in range(n):
+            row = a[i]
+            y[i] = (y[i] - sum(map(mul, row[:i], y[:i]))) / row[i]
+        for i in range(n - 1, -1, -1):
+            y[i] = (y[i] - sum(a[k][i] * y[k] for k in range(i + 1, n))) / a[i][i]
+
+        return y
+
+    @config.in_context
+    def det(self) -> Decimal | float:
+        """
+        get determinant of matrix: square of product of L diagonal.
+
+        :return: Decimal or float based on factorization dtype.
+        """
+        d = Decimal(1) if self.dtype == "decimal" else 1.0
+
+        for i in range(self._n):
+            d *= self._a[i][i]
+
+        d *= d
+        return float(d) if self._kind == "numpy" else d
@@ -1,34 +1,347 @@
-from decimal import Decimal
+from array import array
+from decimal import Decimal, localcontext, MAX_EMAX, MAX_PREC, MIN_EMIN
+from itertools import chain, islice
+from operator import mul
+from typing import Iterable, Iterator
 
-from .errors import MatrixDimensionInvalid, MultiplicationDimensionMismatched
-from .types import lst_dec_2d_t
+from .errors import MatrixDimensionInvalid, VectorDimensionInvalid, MultiplicationDimensionMismatched, MatrixSingular
+from .types import lst_dec_2d_t, dtype_t, DTYPES, common_dtype
+from . import backend, config, fixed, instrument, kernels
+
+
+_ZERO = Decimal(0)
+_ONE = Decimal(1)
+
+
+def _check_new(rows: int, cols: int, dtype: dtype_t, scale: int | None) -> int | None:
+    """
+    validate arguments of a new matrix; get its scale, which is 0 by default for fixed matrices.
+    """
+
+    if rows <= 0 or cols <= 0:
+        raise MatrixDimensionInvalid(f"matrix {rows}x{cols} rows count or cols count are invalid.")
+
+    if dtype not in DTYPES:
+        raise ValueError(f"unknown dtype '{dtype}', it should be one of {list(DTYPES)}")
+
+    if dtype != "fixed":
+        return None
+
+    if scale is not None and scale < 0:
+        raise ValueError(f"fixed scale {scale} should not be negative")
+
+    return scale or 0
+
+
+def _zeros(rows: int, cols: int, dtype: dtype_t):
+    """
+    allocate zero storage of a rows*cols matrix: a memoryview of float64 buffer, or a 2D list of elements.
+    """
+
+    if dtype == "float64":
+        return memoryview(array('d', bytes(8 * rows * cols)))
+
+    zero = 0 if dtype == "fixed" else _ZERO
+    return [[zero] * cols for _ in range(rows)]
+
+
+def _check_out(out, kind: type, shape: tuple[int, int], dtype: dtype_t, operands: tuple):
+    """
+    validate an out= result holder of a product.
+    """
+
+    if not isinstance(out, kind):
+        raise ValueError(f"out should be a {kind.__name__}")
+
+    if out.shape != shape:
+        dim_error = MatrixDimensionInvalid if kind is Matrix else VectorDimensionInvalid
+        raise dim_error(f"out with shape {out.shape[0]}x{out.shape[1]} could not hold a {shape[0]}x{shape[1]} result")
+
+    if out.dtype != dtype:
+        raise ValueError(f"out dtype '{out.dtype}' should be '{dtype}'")
+
+    if any(out is op for op in operands):
+        raise ValueError("out should not be an operand of the product; use in-place methods instead")
+
+
+def _fixed_product(res, lhs_scale: int, rhs_scale: int):
+    """
+    round a fixed product, which is accumulated exactly at the sum of operands scales, to the larger one of them.
+    """
+    scale = max(lhs_scale, rhs_scale)
+    fixed.rescale(res.raw if isinstance(res, Matrix) else [res.raw], lhs_scale + rhs_scale, scale)
+    res._changed(scale)
 
 
 class Matrix:
-    def __init__(self, rows: int, cols: int, init_mat: lst_dec_2d_t | None = None):
+    # no per-instance dict; many small matrices are cheaper to keep and to create
+    __slots__ = ("__rows", "__cols", "__dtype", "__scale", "__version", "__t_cache", "__raw_mat", "__buf",
+                 "__weakref__")
+
+    def __init__(self, rows: int, cols: int, init_mat: lst_dec_2d_t | None = None, dtype: dtype_t = "decimal",
+                 scale: int | None = None):
         """
         initialize rows*cols matrix with init_mat 2D list elements.
 
+        elements are stored based on dtype:
+            - "decimal": a list of rows, each row is a list of Decimal elements.
+            - "float64": a single contiguous buffer of C doubles (8 bytes per element); raw rows are memoryview
+              slices of that buffer. init_mat elements are converted to float.
+            - "fixed": a list of rows, each row is a list of python ints holding element * 10**scale; scale is
+              shared by all elements. init_mat elements are rounded to scale with matpak rounding (see
+              matpak.set_precision()). exact integer arithmetic is used for fixed matrices, which is much faster
+              than Decimal arithmetic.
+
         :param rows: matrix rows count.
         :param cols: matrix cols count.
         :param init_mat: initial rows*cols 2D Decimal values for matrix elements; or None as default for zero matrix.
+        :param dtype: elements storage type; "decimal" by default.
+        :param scale: digits count after decimal point of fixed elements; by default, the smallest one holding
+        init_mat elements exactly. it is ignored for other dtypes.
         """
 
         if rows <= 0 or cols <= 0:
             raise MatrixDimensionInvalid(f"matrix {rows}x{cols} rows count or cols count are invalid.")
 
-        self.__rows = rows
-        self.__cols = cols
+        if dtype not in DTYPES:
+            raise ValueError(f"unknown dtype '{dtype}', it should be one of {list(DTYPES)}")
 
-        if init_mat is None:
-            self.__raw_mat: lst_dec_2d_t = [[Decimal(0.0)] * cols for _ in range(rows)]
-        else:
+        if init_mat is not None:
             for i in range(rows):
                 if len(init_mat[i]) != cols:
                     raise MatrixDimensionInvalid(
                         f"matrix cols count should be {cols} but found a row with cols count of {len(init_mat[i])}")
+
+        self.__rows = rows
+        self.__cols = cols
+        self.__dtype = dtype
+        self.__scale: int | None = None
+        self.__version = 0
+        self.__t_cache: tuple[int, Matrix] | None = None
+
+        if dtype == "float64":
+            if init_mat is None:
+                buf = array('d', bytes(8 * rows * cols))
+            else:
+                buf = array('d', chain.from_iterable(init_mat[:rows]))
+            self.__init_buffer(memoryview(buf))
+        elif dtype == "fixed":
+            if scale is None:
+                scale = 0 if init_mat is None else fixed.infer_scale(chain.from_iterable(init_mat[:rows]))
+
+            self.__scale = scale
+            if init_mat is None:
+                self.__raw_mat: lst_dec_2d_t = [[0] * cols for _ in range(rows)]
+            else:
+                self.__raw_mat: lst_dec_2d_t = fixed.to_fixed_rows(init_mat[:rows], scale)
+        elif init_mat is None:
+            self.__raw_mat: lst_dec_2d_t = [[_ZERO] * cols for _ in range(rows)]
+        else:
             self.__raw_mat: lst_dec_2d_t = init_mat
 
+        if instrument.enabled:
+            instrument.record_alloc(self)
+
+    def __init_buffer(self, buf: memoryview):
+        self.__buf = buf
+        cols = self.__cols
+        self.__raw_mat = [buf[i:i + cols] for i in range(0, self.__rows * cols, cols)]
+
+    def __reduce__(self):
+        return Matrix, (self.__rows, self.__cols, self.tolist(), self.__dtype, self.__scale)
+
+    @classmethod
+    def __wrap(cls, rows: int, cols: int, dtype: dtype_t, scale: int | None, storage,
+               alloc: bool = False) -> "Matrix":
+        # create a matrix on storage that is already valid for its shape and dtype, without any check or copy:
+        # a memoryview of float64 buffer, or a 2D list of elements. storage newly allocated for the matrix is
+        # recorded as __init__ does.
+        mat = cls.__new__(cls)
+        mat.__rows = rows
+        mat.__cols = cols
+        mat.__dtype = dtype
+        mat.__scale = scale
+        mat.__version = 0
+        mat.__t_cache = None
+
+        if dtype == "float64":
+            mat.__init_buffer(storage)
+        else:
+            mat.__raw_mat = storage
+
+        if alloc and instrument.enabled:
+            instrument.record_alloc(mat)
+
+        return mat
+
+    @classmethod
+    def from_rows(cls, init_mat: lst_dec_2d_t, dtype: dtype_t = "decimal", scale: int | None = None,
+                  validate: bool = True) -> "Matrix":
+        """
+        create a matrix from a 2D list of elements; its shape is taken from the list. decimal rows are used as
+        they are, without copying, as __init__ does.
+
+        :param init_mat: non-empty 2D list of elements, all rows of the same length.
+        :param dtype: elements storage type; "decimal" by default.
+        :param scale: digits count after decimal point of fixed elements; see __init__.
+        :param validate: check row lengths of init_mat. rows built by trusted code (e.g, results of a kernel) could
+        skip the check, which is a python loop over all rows; ragged rows then give an invalid matrix.
+        :return: Matrix
+        """
+
+        if dtype not in DTYPES:
+            raise ValueError(f"unknown dtype '{dtype}', it should be one of {list(DTYPES)}")
+
+        rows = len(init_mat)
+        cols = len(init_mat[0]) if rows else 0
+
+        if validate:
+            if rows == 0 or cols == 0:
+                raise MatrixDimensionInvalid(f"matrix {rows}x{cols} rows count or cols count are invalid.")
+
+            for row in init_mat:
+                if len(row) != cols:
+                    raise MatrixDimensionInvalid(
+                        f"matrix cols count should be {cols} but found a row with cols count of {len(row)}")
+
+        if dtype == "float64":
+            buf = memoryview(array('d', chain.from_iterable(init_mat)))
+            return cls.__wrap(rows, cols, dtype, None, buf, alloc=True)
+
+        if dtype == "fixed":
+            if scale is None:
+                scale = fixed.infer_scale(chain.from_iterable(init_mat))
+            return cls.__wrap(rows, cols, dtype, scale, fixed.to_fixed_rows(init_mat, scale), alloc=True)
+
+        return cls.__wrap(rows, cols, dtype, None, init_mat, alloc=True)
+
+    @classmethod
+    def from_flat(cls, rows: int, cols: int, values: Iterable, dtype: dtype_t = "decimal",
+                  scale: int | None = None) -> "Matrix":
+        """
+        create a matrix from rows*cols elements in row-major order, e.g, a flat list read from a file or a
+        generator. float64 elements are written straight to the matrix buffer, without any row list.
+
+        :param rows: matrix rows count.
+        :param cols: matrix cols count.
+        :param values: iterable of rows*cols elements.
+        :param dtype: elements storage type; "decimal" by default.
+        :param scale: digits count after decimal point of fixed elements; see __init__.
+        :return: Matrix
+        """
+
+        if rows <= 0 or cols <= 0:
+            raise MatrixDimensionInvalid(f"matrix {rows}x{cols} rows count or cols count are invalid.")
+
+        if dtype not in DTYPES:
+            raise ValueError(f"unknown dtype '{dtype}', it should be one of {list(DTYPES)}")
+
+        flat = array('d', values) if dtype == "float64" else values if isinstance(values, list) else list(values)
+        size = rows * cols
+
+        if len(flat) != size:
+            raise MatrixDimensionInvalid(f"{len(flat)} elements could not fill a {rows}x{cols} matrix")
+
+        if dtype == "float64":
+            return cls.__wrap(rows, cols, dtype, None, memoryview(flat), alloc=True)
+
+        raw = [flat[i:i + cols] for i in range(0, size, cols)]
+
+        if dtype == "fixed":
+            if scale is None:
+                scale = fixed.infer_scale(flat)
+            return cls.__wrap(rows, cols, dtype, scale, fixed.to_fixed_rows(raw, scale), alloc=True)
+
+        return cls.__wrap(rows, cols, dtype, None, raw, alloc=True)
+
+    @classmethod
+    def zeros(cls, rows: int, cols: int, dtype: dtype_t = "decimal", scale: int | None = None) -> "Matrix":
+        """
+        create a zero matrix. all decimal elements share a single Decimal(0), so nothing is converted per element.
+
+        :param rows: matrix rows count.
+        :param cols: matrix cols count.
+        :param dtype: elements storage type; "decimal" by default.
+        :param scale: digits count after decimal point of fixed elements; 0 by default.
+        :return: Matrix
+        """
+
+        scale = _check_new(rows, cols, dtype, scale)
+        return cls.__wrap(rows, cols, dtype, scale, _zeros(rows, cols, dtype), alloc=True)
+
+    @classmethod
+    def identity(cls, n: int, dtype: dtype_t = "decimal", scale: int | None = None) -> "Matrix":
+        """
+        create an n*n identity matrix.
+
+        :param n: matrix rows count and cols count.
+        :param dtype: elements storage type; "decimal" by default.
+        :param scale: digits count after decimal point of fixed elements; 0 by default.
+        :return: Matrix
+        """
+        scale = _check_new(n, n, dtype, scale)
+        mat = cls.__wrap(n, n, dtype, scale, _zeros(n, n, dtype), alloc=True)
+        one = 10 ** scale if dtype == "fixed" else 1.0 if dtype == "float64" else _ONE
+
+        for i, row in enumerate(mat.__raw_mat):
+            row[i] = one
+
+        return mat
+
+    @classmethod
+    def from_buffer(cls, rows: int, cols: int, buf) -> "Matrix":
+        """
+        create a float64 matrix backed by an existing buffer of rows*cols C doubles in row-major order.
+        buffer is not copied, so changes to matrix elements are visible through buffer and vice versa.
+
+        :param rows: matrix rows count.
+        :param cols: matrix cols count.
+        :param buf: any object supporting buffer protocol, e.g, array('d'), bytearray or mmap.
+        :return: Matrix
+        """
+
+        if rows <= 0 or cols <= 0:
+            raise MatrixDimensionInvalid(f"matrix {rows}x{cols} rows count or cols count are invalid.")
+
+        view = memoryview(buf)
+        if view.format != 'd' or view.ndim != 1:
+            view = view.cast('B').cast('d')
+
+        if len(view) != rows * cols:
+            raise MatrixDimensionInvalid(f"buffer with {len(view)} elements could not hold a {rows}x{cols} matrix")
+
+        return cls.__wrap(rows, cols, "float64", None, view)
+
+    @classmethod
+    def _adopt(cls, mat: "Matrix") -> "Matrix":
+        # wrap storage of a new matrix that is not referenced anywhere else; nothing is copied, and nothing is
+        # recorded as its storage was recorded when mat was allocated
+        rows, cols = mat.shape
+        return cls.__wrap(rows, cols, mat.dtype, mat.scale, mat.buffer if mat.dtype == "float64" else mat.raw)
+
+    @classmethod
+    def from_fixed(cls, rows: int, cols: int, raw: list[list[int]], scale: int) -> "Matrix":
+        """
+        create a fixed matrix from rows of python ints holding element * 10**scale. rows are not copied.
+
+        :param rows: matrix rows count.
+        :param cols: matrix cols count.
+        :param raw: rows*cols 2D list of ints.
+        :param scale: digits count after decimal point.
+        :return: Matrix
+        """
+
+        if rows <= 0 or cols <= 0:
+            raise MatrixDimensionInvalid(f"matrix {rows}x{cols} rows count or cols count are invalid.")
+
+        if len(raw) != rows or any(len(row) != cols for row in raw):
+            raise MatrixDimensionInvalid(f"raw rows could not hold a {rows}x{cols} matrix")
+
+        if scale < 0:
+            raise ValueError(f"fixed scale {scale} should not be negative")
+
+        return cls.__wrap(rows, cols, "fixed", scale, raw)
+
     @property
     def shape(self) -> tuple[int, int]:
         """
@@ -38,15 +351,191 @@ class Matrix:
         """
         return self.__rows, self.__cols
 
+    @property
+    def dtype(self) -> dtype_t:
+        """
+        get matrix elements storage type.
+
+        :return: "decimal", "float64" or "fixed"
+        """
+        return self.__dtype
+
+    @property
+    def scale(self) -> int | None:
+        """
+        get digits count after decimal point of fixed elements.
+
+        :return: int; or None if dtype is not "fixed".
+        """
+        return self.__scale
+
     @property
     def raw(self) -> lst_dec_2d_t:
         """
-        get raw matrix 2D list of Decimal values.
+        get raw matrix 2D list of Decimal values. for float64 matrices, it is a list of memoryview rows of
+        the underlying buffer, and for fixed matrices, it is a 2D list of ints holding element * 10**scale.
 
         :return: lst_dec_2d_t
         """
         return self.__raw_mat
 
+    @property
+    def buffer(self) -> memoryview | None:
+        """
+        get underlying contiguous buffer of float64 matrix elements in row-major order.
+
+        :return: memoryview of C doubles; or None for decimal matrices.
+        """
+        return self.__buf if self.__dtype == "float64" else None
+
+    @property
+    def T(self) -> "TransposedMatrix":
+        """
+        get a zero-copy transposed view of matrix. elements are read from and written to this matrix; a contiguous
+        transpose is only materialised when the view's rows are needed, and it is cached in this matrix until
+        an element is changed by set().
+
+        note that writes straight to raw rows or buffer are not tracked, so they do not invalidate the cached transpose.
+
+        :return: TransposedMatrix
+        """
+
+        from .transposed import TransposedMatrix
+        return TransposedMatrix(self)
+
+    def _transposed(self, build: bool = True) -> "Matrix | None":
+        """
+        get cached contiguous transpose of matrix, which is materialised if it is missing or stale.
+
+        :param build: if False, None is returned instead of materialising a missing or stale transpose.
+        """
+
+        if self.__t_cache is not None and self.__t_cache[0] == self.__version:
+            return self.__t_cache[1]
+
+        if not build:
+            return None
+
+        if self.__dtype == "float64":
+            t = instrument.allocated(
+                Matrix.from_buffer(self.__cols, self.__rows, array('d', chain.from_iterable(zip(*self.__raw_mat)))))
+        elif self.__dtype == "fixed":
+            t = instrument.allocated(
+                Matrix.from_fixed(self.__cols, self.__rows, [list(col) for col in zip(*self.__raw_mat)], self.__scale))
+        else:
+            t = Matrix.from_rows([list(col) for col in zip(*self.__raw_mat)], validate=False)
+
+        self.__t_cache = self.__version, t
+        return t
+
+    def to_numpy(self):
+        """
+        get matrix as a 2D NumPy array. for float64 matrices, array shares the underlying buffer without copying;
+        decimal matrices are copied to an array of Decimal objects.
+
+        :return: numpy.ndarray
+        """
+        backend.require_numpy()
+
+        if self.__dtype == "float64":
+            return backend.np.frombuffer(self.__buf, dtype=backend.np.float64).reshape(self.__rows, self.__cols)
+
+        return backend.np.array(self.tolist(), dtype=object)
+
+    @classmethod
+    def from_numpy(cls, arr) -> "Matrix":
+        """
+        create a matrix from a 2D NumPy array. C-contiguous float64 arrays are wrapped without copying; object arrays
+        become decimal matrices and other numeric arrays are converted to float64.
+
+        :param arr: 2D numpy.ndarray.
+        :return: Matrix
+        """
+        backend.require_numpy()
+
+        if arr.ndim != 2:
+            raise MatrixDimensionInvalid(f"could not create a matrix from a {arr.ndim}D array")
+
+        rows, cols = arr.shape
+
+        if arr.dtype == object:
+            return cls(rows, cols, arr.tolist())
+
+        buf = backend.np.ascontiguousarray(arr, dtype=backend.np.float64)
+        mat = cls.from_buffer(rows, cols, buf)
+
+        # arrays of another layout or element type are copied to a new buffer
+        return mat if buf is arr else instrument.allocated(mat)
+
+    def tolist(self) -> lst_dec_2d_t:
+        """
+        get a copy of matrix elements as a 2D list. fixed elements are converted to exact Decimal values.
+
+        :return: lst_dec_2d_t
+        """
+
+        if self.__dtype == "fixed":
+            scale = self.__scale
+            return [[fixed.from_fixed(el, scale) for el in row] for row in self.__raw_mat]
+
+        return [list(row) for row in self.__raw_mat]
+
+    def astype(self, dtype: dtype_t, scale: int | None = None) -> "Matrix":
+        """
+        get a copy of matrix with elements converted to dtype. float elements are converted to Decimal
+        through their shortest repr, so 0.1 becomes Decimal("0.1").
+
+        :param dtype: elements storage type of the copy.
+        :param scale: scale of a fixed copy; by default, the current one for fixed matrices, else the smallest
+        one holding elements exactly.
+        :return: Matrix
+        """
+
+        if dtype == "fixed" and self.__dtype == "fixed":
+            raw = [list(row) for row in self.__raw_mat]
+            if scale is not None:
+                fixed.rescale(raw, self.__scale, scale)
+            return instrument.allocated(
+                Matrix.from_fixed(self.__rows, self.__cols, raw, self.__scale if scale is None else scale))
+
+        if dtype == "float64" and self.__dtype == "fixed":
+            d = 10 ** self.__scale
+            return Matrix.from_rows([[el / d for el in row] for row in self.__raw_mat], dtype, validate=False)
+
+        if dtype == "decimal" and self.__dtype == "float64":
+            return Matrix.from_rows([[Decimal(repr(el)) for el in row] for row in self.__raw_mat], validate=False)
+
+        return Matrix.from_rows(self.tolist(), dtype, scale, validate=False)
+
+    def freeze(self) -> "FrozenMatrix":
+        """
+        get an immutable copy of matrix; see matpak.FrozenMatrix.
+
+        :return: FrozenMatrix
+        """
+
+        from .frozen import FrozenMatrix
+
+        if self.__dtype == "float64":
+            return FrozenMatrix.from_buffer(self.__rows, self.__cols, self.__buf)
+
+        if self.__dtype == "fixed":
+            return FrozenMatrix.from_fixed(self.__rows, self.__cols, self.__raw_mat, self.__scale)
+
+        return FrozenMatrix(self.__rows, self.__cols, self.__raw_mat)
+
+    def _seal(self) -> "Matrix":
+        """
+        make element storage immutable: rows are copied to tuples and float64 buffer becomes read-only.
+        """
+
+        if self.__dtype == "float64":
+            self.__init_buffer(self.__buf.toreadonly())
+        else:
+            self.__raw_mat = tuple(map(tuple, self.__raw_mat))
+
+        return self
+
     def set(self, row: int, col: int, val: Decimal):
         """
         store 'val' in matrix[row][col] address.
@@ -56,10 +545,22 @@ class Matrix:
         :param val: value to be stored inside matrix[row][col] address.
         """
 
-        if row > self.__rows or col > self.__cols or row < 0 or col < 0:
+        if row > self.__rows-1 or col > self.__cols-1 or row < 0 or col < 0:
             raise ValueError(f"address {row}*{col} is not in boundaries of matrix {self.__rows}*{self.__cols}")
 
-        self.__raw_mat[row][col] = val
+        self.__raw_mat[row][col] = fixed.to_fixed(val, self.__scale) if self.__dtype == "fixed" else val
+        self.__version += 1
+
+    def _changed(self, scale: int | None = None):
+        """
+        mark elements as changed after writing to raw rows, so the cached transpose is dropped.
+
+        :param scale: new scale of fixed elements written to raw rows; or None to keep it.
+        """
+        self.__version += 1
+
+        if scale is not None and self.__dtype == "fixed":
+            self.__scale = scale
 
     def get(self, row: int, col: int) -> Decimal:
         """
@@ -73,15 +574,106 @@ class Matrix:
         if row > self.__rows-1 or col > self.__cols-1 or row < 0 or col < 0:
             raise ValueError(f"address {row}*{col} is not in boundaries of matrix {self.__rows}*{self.__cols}")
 
+        if self.__dtype == "fixed":
+            return fixed.from_fixed(self.__raw_mat[row][col], self.__scale)
+
         return self.__raw_mat[row][col]
 
     # multiplication methods
 
-    def multiply(self, rhs: "Matrix | Vector") -> "Matrix | Vector":
+    def lazy(self) -> "LazyProduct":
+        """
+        start a deferred multiplication chain with this matrix. chain is computed on evaluate() in the
+        association order with the fewest scalar multiplications.
+
+        :return: LazyProduct
+        """
+
+        from .lazy import LazyProduct
+        return LazyProduct([self])
+
+    def _operands(self, rhs: "Matrix | Vector") -> tuple[dtype_t, lst_dec_2d_t, list]:
+        """
+        get common dtype and raw storage of matrix and rhs. if dtypes are different, operands are converted
+        to their common dtype (see matpak.types.common_dtype()), as elements of different types could not be
+        mixed in arithmetic.
+        """
+
+        if self.__dtype == rhs.dtype:
+            return self.__dtype, self.__raw_mat, rhs.raw
+
+        dtype = common_dtype(self.__dtype, rhs.dtype)
+        lhs = self if self.__dtype == dtype else self.astype(dtype)
+        rhs = rhs if rhs.dtype == dtype else rhs.astype(dtype)
+
+        return dtype, lhs.raw, rhs.raw
+
+    def plan_multiply(self, rhs: "Matrix | TransposedMatrix | Vector", algorithm: str = "auto") -> str:
+        """
+        get the strategy that multiply() takes for rhs, so callers could confirm that a fast path is taken.
+
+        strategies:
+            - "numpy": numpy backend is active and both operands are float64; product is computed by numpy.matmul.
+            - "vec": rhs is a vector; every row of matrix is dotted with it.
+            - "dot_rows": rhs is a transposed view (e.g, B.T); rows of matrix are dotted with rows of its base
+              matrix, so nothing is transposed or copied.
+            - "dot_cached": rhs has a cached transpose (see T); its rows are used as cols of rhs.
+            - "dot": rhs is transposed into cols once, then every row of matrix is dotted with every col.
+            - "blocked", "naive": the explicitly requested kernel.
+
+        :param rhs: right hand side, could be Matrix, TransposedMatrix or Vector.
+        :param algorithm: "auto" (or "dot") to choose a dot strategy by operands layout, or a kernel name.
+        :return: strategy name.
+        """
+
+        from .transposed import TransposedMatrix
+
+        if algorithm != "auto" and algorithm not in kernels.KERNELS:
+            raise ValueError(f"unknown multiplication algorithm '{algorithm}', it should be one of {['auto', *kernels.KERNELS]}")
+
+        if backend.numpy_enabled(self, rhs):
+            return "numpy"
+
+        if not isinstance(rhs, (Matrix, TransposedMatrix)):
+            return "vec"
+
+        if algorithm not in ("auto", "dot"):
+            return algorithm
+
+        if isinstance(rhs, TransposedMatrix):
+            return "dot_rows"
+
+        if rhs.dtype == self.__dtype and rhs._transposed(build=False) is not None:
+            return "dot_cached"
+
+        return "dot"
+
+    @instrument.multiplies()
+    @config.in_context
+    def multiply(self, rhs: "Matrix | TransposedMatrix | Vector", algorithm: str = "auto",
+                 block_size: int = kernels.DEFAULT_BLOCK_SIZE, out: "Matrix | Vector | None" = None) -> "Matrix | Vector":
         """
         multiply row-major one matrix and other matrix or vector. return type is analogous to rhs type.
 
-        :param rhs: right hand side, could be Matrix or Vector but dimensions of rhs should be valid for multiplication.
+        available algorithms (all of them return exactly the same result for decimal and fixed operands; float64
+        results of "auto" and "dot" could differ from the others in last bits on python 3.12+, where sum() of floats
+        is compensated):
+            - "auto": loop order and operands layout are chosen by plan_multiply(); rows of matrix are dotted with
+              cols of rhs, which are read from rows of a transposed view's base or from a cached transpose when
+              available, so no transpose is made.
+            - "dot": same as "auto".
+            - "blocked": tiled loops over block_size*block_size tiles of both operands.
+            - "naive": classical triple loop, kept as reference.
+
+        when numpy backend is active and both operands are float64, product is computed by numpy.matmul and
+        algorithm is ignored. products of fixed operands are accumulated exactly and rounded once to the larger
+        scale of operands. Decimal arithmetic runs in matpak decimal context (see matpak.use_precision()).
+
+        :param rhs: right hand side, could be Matrix, TransposedMatrix or Vector but dimensions of rhs should be valid for multiplication.
+        :param algorithm: multiplication kernel name; "auto" by default. it is ignored when rhs is a vector.
+        :param block_size: tile edge size of "blocked" algorithm.
+        :param out: Matrix or Vector that the result is stored in instead of allocating a new one; its shape and
+        dtype should match the result and it should not be one of operands.
         :return: Matrix or Vector based on rhs type (if rhs is matrix, result would be matrix too, but if rhs is vector, result would be the vector too)
         """
 
@@ -91,28 +683,322 @@ class Matrix:
         if self_shape[1] != rhs.shape[0]:
             raise MultiplicationDimensionMismatched(self_shape, rhs.shape)
 
-        if isinstance(rhs, Matrix):
-            res: Matrix = Matrix(self_shape[0], rhs.shape[1])
+        if out is not None:
+            # a transposed view shares storage with its base matrix
+            operands = (self, rhs) if isinstance(rhs, (Matrix, Vector)) else (self, rhs, rhs.T)
+            _check_out(out, Vector if isinstance(rhs, Vector) else Matrix, (self_shape[0], rhs.shape[1]),
+                       common_dtype(self.__dtype, rhs.dtype), operands)
+
+        strategy = self.plan_multiply(rhs, algorithm)
+
+        if strategy == "numpy":
+            if out is not None:
+                if isinstance(out, Matrix):
+                    out._changed()
+                backend.np.matmul(self.to_numpy(), rhs.to_numpy(), out=out.to_numpy())
+                return out
 
-            for k in range(rhs.shape[1]):
-                for i in range(self_shape[0]):
-                    for j in range(self_shape[1]):
-                        tmp = res.get(i, k)
-                        tmp += self.get(i, j) * rhs.get(j, k)
-                        res.set(i, k, tmp)
+            res = backend.np.matmul(self.to_numpy(), rhs.to_numpy())
+            return instrument.allocated(Vector.from_numpy(res) if isinstance(rhs, Vector) else Matrix.from_numpy(res))
+
+        if strategy == "vec":
+            dtype, lhs_raw, rhs_raw = self._operands(rhs)
+            res: Vector = out if out is not None else Vector(self_shape[0], dtype=dtype)
+            kernels.mul_vec(lhs_raw, rhs_raw, res.raw)
+
+            if dtype == "fixed":
+                _fixed_product(res, self.__scale, rhs.scale)
 
             return res
+
+        if strategy == "dot_rows":
+            dtype, lhs_raw, rhs_cols = self._operands(rhs.T)
+        elif strategy == "dot_cached":
+            dtype, lhs_raw, rhs_cols = self.__dtype, self.__raw_mat, rhs._transposed().raw
+        else:
+            dtype, lhs_raw, rhs_raw = self._operands(rhs if isinstance(rhs, Matrix) else rhs.materialize())
+
+        if out is None:
+            res: Matrix = Matrix(self_shape[0], rhs.shape[1], dtype=dtype)
+        else:
+            res: Matrix = out
+            res._changed()
+
+            # accumulating kernels need a zero filled result
+            if strategy in ("blocked", "naive"):
+                kernels.fill(res.raw, kernels.zero(dtype))
+
+        if strategy in ("dot_rows", "dot_cached"):
+            kernels.mul_dot_cols(lhs_raw, rhs_cols, res.raw)
+        elif strategy == "blocked":
+            kernels.mul_blocked(lhs_raw, rhs_raw, res.raw, block_size)
+        else:
+            kernels.KERNELS[strategy](lhs_raw, rhs_raw, res.raw)
+
+        if dtype == "fixed":
+            _fixed_product(res, self.__scale, rhs.scale)
+
+        return res
+
+    def __coerce(self, other: "Matrix | TransposedMatrix") -> tuple[lst_dec_2d_t, int | None]:
+        # in-place results keep matrix dtype, so operands of a wider dtype (see common_dtype()) could not be taken
+        if other.dtype == self.__dtype:
+            return other.raw, other.scale
+
+        if common_dtype(self.__dtype, other.dtype) == self.__dtype:
+            return other.astype(self.__dtype).raw, None
+
+        raise ValueError(f"could not store {other.dtype} elements in a {self.__dtype} matrix in place; "
+                         f"convert it by astype() first")
+
+    @config.in_context
+    def imul_(self, rhs: "Matrix | TransposedMatrix") -> "Matrix":
+        """
+        multiply matrix by square rhs in place: matrix = matrix * rhs. each row is overwritten right after it is
+        computed, so no result matrix is allocated; rhs could be the matrix itself or its transposed view.
+
+        :param rhs: right hand side cols*cols square matrix.
+        :return: matrix itself.
+        """
+
+        if rhs.shape != (self.__cols, self.__cols):
+            raise MultiplicationDimensionMismatched(self.shape, rhs.shape)
+
+        if backend.numpy_enabled(self, rhs):
+            arr = self.to_numpy()
+            arr[...] = backend.np.matmul(arr, rhs.to_numpy())
+        else:
+            rhs_raw, rhs_scale = self.__coerce(rhs)
+            # rhs cols are copied by kernel before any row is overwritten
+            kernels.mul_dot(self.__raw_mat, rhs_raw, self.__raw_mat)
+
+            if self.__dtype == "fixed":
+                fixed.rescale(self.__raw_mat, self.__scale + rhs_scale, self.__scale)
+
+        self.__version += 1
+        return self
+
+    def add_(self, other: "Matrix | TransposedMatrix") -> "Matrix":
+        """
+        add other matrix to matrix in place: matrix = matrix + other.
+
+        :param other: matrix with same shape.
+        :return: matrix itself.
+        """
+        return self.axpy(None, other)
+
+    @config.in_context
+    def axpy(self, alpha, x: "Matrix | TransposedMatrix") -> "Matrix":
+        """
+        add scaled x to matrix in place: matrix = matrix + alpha * x.
+
+        :param alpha: scalar of x; or None to add x as is.
+        :param x: matrix with same shape.
+        :return: matrix itself.
+        """
+
+        if x.shape != self.shape:
+            raise MatrixDimensionInvalid(
+                f"could not add {x.shape[0]}x{x.shape[1]} matrix to {self.__rows}x{self.__cols} matrix")
+
+        x_raw, x_scale = self.__coerce(x)
+
+        if self.__dtype == "fixed":
+            fixed.axpy(alpha, x_raw, x_scale, self.__raw_mat, self.__scale)
+        else:
+            alpha = None if alpha is None else kernels.as_scalar(alpha, self.__dtype)
+            kernels.axpy(alpha, x_raw, self.__raw_mat)
+
+        self.__version += 1
+        return self
+
+    @config.in_context
+    def scale_(self, alpha) -> "Matrix":
+        """
+        scale matrix in place: matrix = alpha * matrix.
+
+        :param alpha: scalar.
+        :return: matrix itself.
+        """
+        if self.__dtype == "fixed":
+            fixed.scale(alpha, self.__raw_mat, self.__scale)
+        else:
+            kernels.scale(kernels.as_scalar(alpha, self.__dtype), self.__raw_mat)
+
+        self.__version += 1
+        return self
+
+    async def amultiply(self, rhs: "Matrix | TransposedMatrix | Vector", executor=None,
+                        block_rows: int = 32) -> "Matrix | Vector":
+        """
+        async version of multiply(); see matpak.aio.amultiply().
+
+        :param rhs: right hand side, could be Matrix, TransposedMatrix or Vector but dimensions of rhs should be valid for multiplication.
+        :param executor: executor to compute product in; by default, the configured one, else product is computed
+        cooperatively in event loop thread.
+        :param block_rows: result rows count computed between two yields in cooperative mode.
+        :return: Matrix or Vector based on rhs type.
+        """
+
+        from .aio import amultiply
+        return await amultiply(self, rhs, executor, block_rows)
+
+    @instrument.multiplies("strassen")
+    @config.in_context
+    def multiply_strassen(self, rhs: "Matrix", crossover: int = kernels.DEFAULT_STRASSEN_CROSSOVER,
+                          exact: bool = True) -> "Matrix":
+        """
+        multiply one matrix and other matrix with Strassen algorithm. operands are zero padded to square matrices
+        which are recursively split until block edge is not larger than crossover; those blocks are multiplied
+        by classical kernel.
+
+        in exact mode, Decimal elements are computed without any intermediate rounding and only the final elements
+        are rounded to current decimal context. so result is identical to multiply() whenever the classical product
+        is exact in current context (e.g, elements imported from files), and it is the correctly rounded product otherwise.
+
+        :param rhs: right hand side Matrix; dimensions of rhs should be valid for multiplication.
+        :param crossover: block edge size below which classical kernel is used.
+        :param exact: compute Decimal elements exactly; it has no effect on other element types.
+        :return: Matrix
+        """
+
+        self_shape = self.shape
+
+        if self_shape[1] != rhs.shape[0]:
+            raise MultiplicationDimensionMismatched(self_shape, rhs.shape)
+
+        dtype, lhs_raw, rhs_raw = self._operands(rhs)
+        res: Matrix = Matrix(self_shape[0], rhs.shape[1], dtype=dtype)
+
+        if exact and dtype == "decimal":
+            with localcontext(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN):
+                kernels.mul_strassen(lhs_raw, rhs_raw, res.raw, crossover)
+
+            for row in res.raw:
+                row[:] = [+el for el in row]
+        else:
+            kernels.mul_strassen(lhs_raw, rhs_raw, res.raw, crossover)
+
+        if dtype == "fixed":
+            _fixed_product(res, self.__scale, rhs.scale)
+
+        return res
+
+    def iter_multiply_many(self, vectors: Iterable["Vector"], chunk_size: int = 256) -> Iterator["Vector"]:
+        """
+        multiply matrix by many vectors, yielding result vectors in order. matrix rows are prepared once for all
+        vectors, and vectors are consumed chunk_size at a time, so a lazy iterable of vectors is never fully
+        resident in memory.
+
+        on numpy backend, float64 chunks are stacked and multiplied by a single numpy.matmul call.
+
+        :param vectors: iterable of vectors with rows count equal to matrix cols count.
+        :param chunk_size: vectors count processed at once.
+        :return: iterator of Vector results.
+        """
+
+        from .vec import Vector
+
+        if chunk_size <= 0:
+            raise ValueError(f"chunk size {chunk_size} should be positive")
+
+        rows = self.__rows
+        prepared: dict = {}
+        vectors = iter(vectors)
+
+        while chunk := list(islice(vectors, chunk_size)):
+            for vec in chunk:
+                if vec.shape[0] != self.__cols:
+                    raise MultiplicationDimensionMismatched(self.shape, vec.shape)
+
+            if backend.numpy_enabled(self, *chunk):
+                if "numpy" not in prepared:
+                    prepared["numpy"] = self.to_numpy().T
+                res = backend.np.stack([vec.to_numpy() for vec in chunk]) @ prepared["numpy"]
+                yield from (instrument.allocated(Vector.from_numpy(r)) for r in res)
+                continue
+
+            results = []
+
+            # generator is suspended between chunks, so decimal context is entered per chunk
+            with config.scope():
+                for vec in chunk:
+                    dtype = common_dtype(self.__dtype, vec.dtype)
+
+                    if dtype not in prepared:
+                        mat = self if self.__dtype == dtype else self.astype(dtype)
+                        prepared[dtype] = [tuple(row) for row in mat.raw]
+
+                    x = vec.raw if vec.dtype == dtype else vec.astype(dtype).raw
+                    vals = [sum(map(mul, row, x)) for row in prepared[dtype]]
+
+                    if dtype == "fixed":
+                        res = instrument.allocated(Vector.from_fixed(rows, vals, self.__scale + vec.scale))
+                        _fixed_product(res, self.__scale, vec.scale)
+                    else:
+                        res = Vector(rows, vals, dtype)
+
+                    results.append(res)
+
+            yield from results
+
+    def iter_multiply_rows(self, rhs: "Matrix | TransposedMatrix",
+                           block_rows: int = 256) -> Iterator[lst_dec_2d_t]:
+        """
+        multiply matrix by rhs block by block, yielding lists of up to block_rows result rows as soon as they are
+        computed, so a large product could be consumed (e.g, written to a file) without ever being fully resident.
+        rhs cols are prepared once for all blocks. rows of fixed products are ints of the result scale, which is
+        the larger scale of operands.
+
+        :param rhs: right hand side Matrix or TransposedMatrix; dimensions of rhs should be valid for multiplication.
+        :param block_rows: result rows count of each block.
+        :return: iterator of result row blocks.
+        """
+
+        from .transposed import TransposedMatrix
+
+        if block_rows <= 0:
+            raise ValueError(f"block rows {block_rows} should be positive")
+
+        if self.__cols != rhs.shape[0]:
+            raise MultiplicationDimensionMismatched(self.shape, rhs.shape)
+
+        if backend.numpy_enabled(self, rhs):
+            lhs_arr, rhs_arr = self.to_numpy(), rhs.to_numpy()
+            for start in range(0, self.__rows, block_rows):
+                yield backend.np.matmul(lhs_arr[start:start + block_rows], rhs_arr).tolist()
+            return
+
+        if isinstance(rhs, TransposedMatrix):
+            dtype, lhs_raw, cols = self._operands(rhs.T)
         else:
-             res: Vector = Vector(self_shape[1])
+            dtype, lhs_raw, rhs_raw = self._operands(rhs)
+            cols = kernels.transpose(rhs_raw)
 
-             for i in range(self_shape[0]):
-                 for j in range(self_shape[1]):
-                     tmp = res.get(i)
-                     tmp += self.get(i, j) * rhs.get(j)
-                     res.set(i, tmp)
+        for start in range(0, self.__rows, block_rows):
+            block = lhs_raw[start:start + block_rows]
+            out = [[None] * len(cols) for _ in range(len(block))]
 
-             return res
+            # generator is suspended between blocks, so decimal context is entered per block
+            with config.scope():
+                kernels.mul_dot_cols(block, cols, out)
+                if dtype == "fixed":
+                    fixed.rescale(out, self.__scale + rhs.scale, max(self.__scale, rhs.scale))
+
+            yield out
+
+    def multiply_many(self, vectors: Iterable["Vector"], chunk_size: int = 256) -> list["Vector"]:
+        """
+        multiply matrix by many vectors. it is a list collecting version of iter_multiply_many().
 
+        :param vectors: iterable of vectors with rows count equal to matrix cols count.
+        :param chunk_size: vectors count processed at once.
+        :return: list of Vector results in order of vectors.
+        """
+        return list(self.iter_multiply_many(vectors, chunk_size))
+
+    @instrument.multiplies("col_major")
+    @config.in_context
     def multiply_col_major(self, rhs: "Matrix | Vector") -> "Matrix | Vector":
         """
         multiply col-major one matrix and other matrix or vector. return type is analogous to rhs type.
@@ -127,25 +1013,252 @@ class Matrix:
         if self_shape[1] != rhs.shape[0]:
             raise MultiplicationDimensionMismatched(self_shape, rhs.shape)
 
-        self_shape = self.shape
+        dtype, lhs_raw, rhs_raw = self._operands(rhs)
+
         if isinstance(rhs, Matrix):
-            res: Matrix = Matrix(self_shape[0], rhs.shape[1])
+            res: Matrix = Matrix(self_shape[0], rhs.shape[1], dtype=dtype)
+            kernels.mul_col_major(lhs_raw, rhs_raw, res.raw)
+        else:
+            out = [[el] for el in Vector(self_shape[0], dtype=dtype).raw]
+            kernels.mul_col_major(lhs_raw, [[el] for el in rhs_raw], out)
 
-            for k in range(rhs.shape[1]):
-                for j in range(self_shape[1]):
-                    for i in range(self_shape[0]):
-                        tmp = res.get(i, k)
-                        tmp += self.get(i, j) * rhs.get(j, k)
-                        res.set(i, k, tmp)
+            res: Vector = Vector(self_shape[0], [row[0] for row in out], dtype)
 
-            return res
-        else:
-            res: Vector = Vector(self_shape[1])
+        if dtype == "fixed":
+            _fixed_product(res, self.__scale, rhs.scale)
+
+        return res
+
+    def __check_power(self, k: int):
+        if self.__rows != self.__cols:
+            raise MatrixDimensionInvalid(
+                f"could not raise {self.__rows}x{self.__cols} matrix to a power, it should be square")
+
+        if k < 0:
+            raise ValueError(f"power {k} should not be negative")
+
+    @config.in_context
+    def power(self, k: int) -> "Matrix":
+        """
+        raise square matrix to k power by binary exponentiation: matrix is squared for every bit of k and squares
+        of set bits are multiplied into result, so it takes at most 2*log2(k) products instead of k. products are
+        written to scratch matrices that are reused by later products, so at most four n*n matrices are allocated
+        whatever k is.
 
-            for j in range(self_shape[1]):
-                for i in range(self_shape[1]):
-                    tmp = res.get(i)
-                    tmp += self.get(i, j) * rhs.get(j)
-                    res.set(i, tmp)
+        :param k: non-negative power; matrix^0 is identity matrix.
+        :return: Matrix
+        """
+        self.__check_power(k)
+
+        if k == 0:
+            return Matrix.identity(self.__rows, self.__dtype, self.__scale)
+
+        spare: list[Matrix] = []
+        base, res = self, None
+
+        def scratch() -> Matrix:
+            return spare.pop() if spare else Matrix(self.__rows, self.__cols, dtype=self.__dtype)
+
+        while True:
+            if k & 1:
+                if res is None:
+                    res = base.astype(self.__dtype)
+                else:
+                    out = res.multiply(base, out=scratch())
+                    spare.append(res)
+                    res = out
+
+            k >>= 1
+            if not k:
+                return res
+
+            out = base.multiply(base, out=scratch())
+            if base is not self:
+                spare.append(base)
+            base = out
+
+    @config.in_context
+    def power_apply(self, k: int, vec: "Vector") -> "Vector":
+        """
+        compute matrix^k * vec without keeping intermediate vectors. it takes the cheaper one of two paths by
+        flops count: k matrix-vector products (2*k*n^2 flops), or power(k) and one matrix-vector product (2*n^3
+        flops per matrix product), so small k or large matrices never form matrix^k. both vectors of the first
+        path are reused between products.
+
+        :param k: non-negative power; matrix^0 * vec is a copy of vec.
+        :param vec: vector with rows count of matrix.
+        :return: Vector of common dtype of matrix and vec (see matpak.types.common_dtype()).
+        """
+        from .vec import Vector
+        self.__check_power(k)
+        n = self.__rows
+
+        if vec.shape[0] != n:
+            raise MultiplicationDimensionMismatched(self.shape, vec.shape)
 
+        products = k.bit_length() - 1 + k.bit_count() - 1
+
+        if k * n > products * n * n + n:
+            return self.power(k).multiply(vec)
+
+        dtype = common_dtype(self.__dtype, vec.dtype)
+        lhs = self if self.__dtype == dtype else self.astype(dtype)
+        x, tmp = vec.astype(dtype), Vector(n, dtype=dtype)
+
+        for _ in range(k):
+            x, tmp = lhs.multiply(x, out=tmp), x
+
+        return x
+
+    # linear algebra methods
+
+    def lu(self, overwrite: bool = False) -> "LUFactorization":
+        """
+        factor square matrix with partial pivoting; see matpak.linalg.LUFactorization. the factorization should
+        be reused to solve for many right hand sides.
+
+        :param overwrite: factor matrix in place on its row storage instead of a copy.
+        :return: LUFactorization
+        """
+
+        from .linalg import LUFactorization
+        return LUFactorization(self, overwrite)
+
+    def cholesky(self, overwrite: bool = False) -> "CholeskyFactorization":
+        """
+        factor symmetric positive definite matrix; see matpak.linalg.CholeskyFactorization.
+
+        :param overwrite: factor matrix in place on its row storage instead of a copy.
+        :return: CholeskyFactorization
+        """
+
+        from .linalg import CholeskyFactorization
+        return CholeskyFactorization(self, overwrite)
+
+    def solve(self, vec: "Vector") -> "Vector":
+        """
+        solve matrix * x = vec for x by LU factorization. to solve for many vectors, factor matrix once by lu()
+        and reuse it.
+
+        :param vec: right hand side vector with rows count of matrix.
+        :return: Vector x
+        """
+        return self.lu().solve(vec)
+
+    def det(self) -> Decimal | float:
+        """
+        get determinant of square matrix by LU factorization; it is zero for singular matrices.
+
+        :return: Decimal or float based on dtype (Decimal for fixed matrices).
+        """
+        try:
+            return self.lu().det()
+        except MatrixSingular:
+            return 0.0 if self.__dtype == "float64" else Decimal(0)
+
+    def inverse(self) -> "Matrix":
+        """
+        get inverse of square matrix by LU factorization.
+
+        :return: Matrix of decimal (for fixed matrices too) or float64 elements.
+        """
+        return self.lu().inverse()
+
+    # operators
+
+    def __matmul__(self, other: "Matrix | TransposedMatrix | Vector") -> "Matrix | Vector":
+        from .transposed import TransposedMatrix
+        from .vec import Vector
+
+        if not isinstance(other, (Matrix, TransposedMatrix, Vector)):
+            return NotImplemented
+
+        return self.multiply(other)
+
+    @config.in_context
+    def _combine(self, other: "Matrix | TransposedMatrix", beta, reflected: bool = False) -> "Matrix":
+        """
+        get a new matrix of matrix + beta * other in one pass over rows (other + beta * matrix if reflected).
+        operands are converted to their common dtype; fixed operands to the larger scale of them.
+        """
+        from .transposed import TransposedMatrix
+
+        if not isinstance(other, (Matrix, TransposedMatrix)):
+            return NotImplemented
+
+        if other.shape != self.shape:
+            raise MatrixDimensionInvalid(
+                f"could not add {other.shape[0]}x{other.shape[1]} matrix to {self.__rows}x{self.__cols} matrix")
+
+        dtype = common_dtype(self.__dtype, other.dtype)
+        scale = max(self.__scale, other.scale) if dtype == "fixed" else None
+        lhs, rhs = (other, self) if reflected else (self, other)
+
+        lhs_raw = lhs.raw if (lhs.dtype, lhs.scale) == (dtype, scale) else lhs.astype(dtype, scale).raw
+        rhs_raw = rhs.raw if (rhs.dtype, rhs.scale) == (dtype, scale) else rhs.astype(dtype, scale).raw
+        rows = kernels.combine(None, lhs_raw, beta, rhs_raw)
+
+        if dtype == "fixed":
+            return instrument.allocated(Matrix.from_fixed(self.__rows, self.__cols, rows, scale))
+
+        return Matrix.from_rows(rows, dtype, validate=False)
+
+    def __add__(self, other: "Matrix | TransposedMatrix") -> "Matrix":
+        return self._combine(other, None)
+
+    def __radd__(self, other: "Matrix | TransposedMatrix") -> "Matrix":
+        return self._combine(other, None, reflected=True)
+
+    def __sub__(self, other: "Matrix | TransposedMatrix") -> "Matrix":
+        return self._combine(other, -1)
+
+    def __rsub__(self, other: "Matrix | TransposedMatrix") -> "Matrix":
+        return self._combine(other, -1, reflected=True)
+
+    @config.in_context
+    def __mul__(self, alpha) -> "Matrix":
+        if not isinstance(alpha, (int, float, Decimal)):
+            return NotImplemented
+
+        if self.__dtype == "fixed":
+            res = self.astype("fixed")
+            fixed.scale(alpha, res.raw, self.__scale)
             return res
+
+        rows = kernels.combine(kernels.as_scalar(alpha, self.__dtype), self.__raw_mat)
+        return Matrix.from_rows(rows, self.__dtype, validate=False)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Matrix":
+        return self * -1
+
+    def __iadd__(self, other: "Matrix | TransposedMatrix") -> "Matrix":
+        from .transposed import TransposedMatrix
+
+        if not isinstance(other, (Matrix, TransposedMatrix)):
+            return NotImplemented
+
+        return self.add_(other)
+
+    def __isub__(self, other: "Matrix | TransposedMatrix") -> "Matrix":
+        from .transposed import TransposedMatrix
+
+        if not isinstance(other, (Matrix, TransposedMatrix)):
+            return NotImplemented
+
+        return self.axpy(-1, other)
+
+    def __imul__(self, alpha) -> "Matrix":
+        if not isinstance(alpha, (int, float, Decimal)):
+            return NotImplemented
+
+        return self.scale_(alpha)
+
+    def __imatmul__(self, rhs: "Matrix | TransposedMatrix") -> "Matrix":
+        from .transposed import TransposedMatrix
+
+        if not isinstance(rhs, (Matrix, TransposedMatrix)):
+            return NotImplemented
+
+        return self.imul_(rhs)
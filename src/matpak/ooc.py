@@ -0,0 +1,395 @@
+import math
+import os
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+from .atomic import AtomicFile
+from .binio import HEADER_SIZE, read_mat_header, write_mat_header
+from .errors import MatrixDimensionInvalid, MatrixFileInvalid, MultiplicationDimensionMismatched
+from .io import IMP_CHUNK_ROWS, iter_mat_rows
+from .mat import Matrix
+from . import backend, instrument, kernels
+
+
+# out-of-core products work on float64 matpak binary files (see matpak.binio), whose row-major payload is
+# addressed as a grid of tiles: a tile is read by one positioned read per row (or a single read when it spans
+# whole rows), so no file is ever mapped or loaded as a whole.
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+# estimated bytes held by a resident tile element: a C double for numpy tiles; a python float and its list slot
+# for pure tiles.
+_ELEMENT_BYTES = {"numpy": 8, "pure": 32}
+
+# resident tiles during a product: lhs and rhs tiles in use, the prefetched next pair and the result tile.
+_RESIDENT_TILES = 5
+
+
+class DiskMatrix:
+    def __init__(self, file: str, writable: bool = False):
+        """
+        open a float64 matpak binary matrix file (see matpak.save_mat_bin()) for tile access. elements stay on
+        disk; tiles are read and written by positioned I/O, so any number of threads could read tiles at once.
+
+        if there is any issue, an exception would be raised. beside standard exceptions, there are following
+        custom exceptions that would be raised in special scenarios:
+            1- file is not a matpak binary matrix file, it is truncated or its dtype is not float64: MatrixFileInvalid
+
+        :param file: path to binary matrix file.
+        :param writable: open file for write_tile() too.
+        """
+        self.__file = file
+        self.__f = open(file, "r+b" if writable else "rb")
+
+        try:
+            dtype, native, _, rows, cols = read_mat_header(self.__f, file)
+
+            if dtype != "float64":
+                raise MatrixFileInvalid(file, f"contains a {dtype} matrix, only float64 matrices could be used on disk")
+
+            if rows <= 0 or cols <= 0:
+                raise MatrixFileInvalid(file, f"header declares an invalid {rows}x{cols} matrix")
+
+            if os.fstat(self.__f.fileno()).st_size < HEADER_SIZE + 8 * rows * cols:
+                raise MatrixFileInvalid(file, f"payload is truncated, {rows * cols} elements are expected")
+        except BaseException:
+            self.__f.close()
+            raise
+
+        self.__rows = rows
+        self.__cols = cols
+        self.__swap = not native
+        self.__lock = threading.Lock()
+
+    def __enter__(self) -> "DiskMatrix":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @classmethod
+    def create(cls, file: str, rows: int, cols: int) -> "DiskMatrix":
+        """
+        create a zero rows*cols float64 matrix file and open it for writing. file is allocated sparsely where the
+        file system supports it, so creating a large matrix does not write its payload.
+
+        :param file: path to binary matrix file; it is overwritten if exists.
+        :param rows: matrix rows count.
+        :param cols: matrix cols count.
+        :return: DiskMatrix
+        """
+
+        if rows <= 0 or cols <= 0:
+            raise MatrixDimensionInvalid(f"matrix {rows}x{cols} rows count or cols count are invalid.")
+
+        with open(file, "wb") as f:
+            write_mat_header(f, rows, cols)
+            f.truncate(HEADER_SIZE + 8 * rows * cols)
+
+        return cls(file, writable=True)
+
+    @classmethod
+    def from_text(cls, src: str, file: str, sep: str = ',') -> "DiskMatrix":
+        """
+        convert a matrix text file (see matpak.imp_mat_file()) to a float64 binary file, IMP_CHUNK_ROWS rows at
+        a time, so the matrix is never fully resident. file is replaced atomically once all rows are written.
+
+        :param src: path to matrix text file.
+        :param file: path to binary matrix file; it is overwritten if exists.
+        :param sep: text file's elements separator char; by default, it is comma ','.
+        :return: DiskMatrix
+        """
+        rows = cols = 0
+
+        with AtomicFile(file) as f:
+            # header is written once rows count is known
+            f.write(bytes(HEADER_SIZE))
+
+            for block in iter_mat_rows(src, sep, IMP_CHUNK_ROWS, "float64"):
+                buf = array('d')
+                for row in block:
+                    buf.extend(row)
+                f.write(buf.tobytes())
+                rows, cols = rows + len(block), len(block[0])
+
+            f.seek(0)
+            write_mat_header(f, rows, cols)
+
+        return cls(file)
+
+    @property
+    def file(self) -> str:
+        """
+        get path to binary matrix file.
+
+        :return: str
+        """
+        return self.__file
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        get matrix dimensions.
+
+        :return: a tuple of matrix rows*cols
+        """
+        return self.__rows, self.__cols
+
+    @property
+    def dtype(self) -> str:
+        """
+        get matrix elements storage type.
+
+        :return: "float64"
+        """
+        return "float64"
+
+    def close(self):
+        """
+        close matrix file.
+        """
+        self.__f.close()
+
+    def load(self) -> Matrix:
+        """
+        read whole matrix into memory.
+
+        :return: Matrix
+        """
+        buf = self._read(0, 0, self.__rows, self.__cols)
+        return instrument.allocated(Matrix.from_buffer(self.__rows, self.__cols, buf))
+
+    def __check_tile(self, row: int, col: int, rows: int, cols: int):
+        if row < 0 or col < 0 or rows <= 0 or cols <= 0 or row + rows > self.__rows or col + cols > self.__cols:
+            raise ValueError(f"tile {rows}x{cols} at {row}*{col} is not in boundaries of matrix {self.__rows}*{self.__cols}")
+
+    def __pread(self, size: int, offset: int) -> bytes:
+        if hasattr(os, "pread"):
+            data = os.pread(self.__f.fileno(), size, offset)
+        else:
+            with self.__lock:
+                self.__f.seek(offset)
+                data = self.__f.read(size)
+
+        if len(data) != size:
+            raise MatrixFileInvalid(self.__file, f"payload is truncated at byte {offset + len(data)}")
+
+        return data
+
+    def __pwrite(self, data: bytes, offset: int):
+        if hasattr(os, "pwrite"):
+            os.pwrite(self.__f.fileno(), data, offset)
+        else:
+            with self.__lock:
+                self.__f.seek(offset)
+                self.__f.write(data)
+
+    def _read(self, row: int, col: int, rows: int, cols: int) -> array:
+        """
+        read a tile as a flat row-major array of C doubles.
+        """
+        self.__check_tile(row, col, rows, cols)
+        buf = array('d')
+        offset = HEADER_SIZE + 8 * (row * self.__cols + col)
+
+        if cols == self.__cols:
+            buf.frombytes(self.__pread(8 * rows * cols, offset))
+        else:
+            for i in range(rows):
+                buf.frombytes(self.__pread(8 * cols, offset + 8 * i * self.__cols))
+
+        if self.__swap:
+            buf.byteswap()
+
+        return buf
+
+    def _write(self, row: int, col: int, rows: int, cols: int, data):
+        """
+        write a flat row-major buffer of C doubles as a tile.
+        """
+        self.__check_tile(row, col, rows, cols)
+
+        if self.__swap:
+            raise MatrixFileInvalid(self.__file, "has non-native byte order, it could not be written in place")
+
+        data = memoryview(data).cast('B')
+        offset = HEADER_SIZE + 8 * (row * self.__cols + col)
+
+        if cols == self.__cols:
+            self.__pwrite(data, offset)
+        else:
+            for i in range(rows):
+                self.__pwrite(data[8 * cols * i:8 * cols * (i + 1)], offset + 8 * i * self.__cols)
+
+    def read_tile(self, row: int, col: int, rows: int, cols: int) -> Matrix:
+        """
+        read a rows*cols tile whose top left element is matrix[row][col].
+
+        :param row: first row of tile.
+        :param col: first col of tile.
+        :param rows: tile rows count.
+        :param cols: tile cols count.
+        :return: float64 Matrix
+        """
+        return instrument.allocated(Matrix.from_buffer(rows, cols, self._read(row, col, rows, cols)))
+
+    def write_tile(self, row: int, col: int, tile: Matrix):
+        """
+        write a tile whose top left element goes to matrix[row][col]. matrix should be opened as writable.
+
+        :param row: first row of tile.
+        :param col: first col of tile.
+        :param tile: float64 Matrix.
+        """
+
+        if tile.dtype != "float64":
+            tile = tile.astype("float64")
+
+        self._write(row, col, *tile.shape, tile.buffer)
+
+    def flush(self):
+        """
+        flush written tiles to disk.
+        """
+        self.__f.flush()
+        os.fsync(self.__f.fileno())
+
+
+def tile_size(memory_budget: int = DEFAULT_MEMORY_BUDGET) -> int:
+    """
+    get the largest square tile edge whose resident tiles of an out-of-core product fit in memory budget on
+    the active backend.
+
+    :param memory_budget: bytes that tiles could hold at once.
+    :return: tile edge size.
+    """
+    size = math.isqrt(memory_budget // (_RESIDENT_TILES * _ELEMENT_BYTES[backend.active_backend()]))
+
+    if size <= 0:
+        raise ValueError(f"memory budget of {memory_budget} bytes could not hold any tile")
+
+    return size
+
+
+def _tiles(n: int, size: int) -> list[tuple[int, int]]:
+    return [(start, min(size, n - start)) for start in range(0, n, size)]
+
+
+def ooc_multiply(lhs: "DiskMatrix | str", rhs: "DiskMatrix | str", file: str,
+                 memory_budget: int = DEFAULT_MEMORY_BUDGET, tile: int | None = None,
+                 prefetch: bool = True) -> DiskMatrix:
+    """
+    multiply two float64 matrices stored on disk and write the product to disk, holding only a few tiles in
+    memory at a time. result is computed tile by tile: every result tile accumulates products of a row of lhs
+    tiles and a col of rhs tiles, and it is written as soon as it is complete.
+
+    while a pair of tiles is being multiplied, the next pair is read by a background thread, so I/O overlaps
+    compute. on pure backend, every result element is accumulated in the same order as the "blocked" algorithm of
+    Matrix.multiply(), so the result is bit-identical to that in-memory product.
+
+    :param lhs: left hand side DiskMatrix, or path to its float64 binary file.
+    :param rhs: right hand side DiskMatrix, or path to its float64 binary file; dimensions of rhs should be valid
+    for multiplication.
+    :param file: path to result binary file; it is replaced atomically once the whole product is written.
+    :param memory_budget: bytes that resident tiles could hold at once; it sets tile edge size unless tile is given.
+    :param tile: tile edge size; by default, the largest one fitting in memory budget (see tile_size()).
+    :param prefetch: read next tiles in background while current ones are multiplied.
+    :return: DiskMatrix of result, opened for reading.
+    """
+    # files given by path are opened and closed here
+    opened = []
+
+    try:
+        if isinstance(lhs, str):
+            lhs = DiskMatrix(lhs)
+            opened.append(lhs)
+
+        if isinstance(rhs, str):
+            rhs = DiskMatrix(rhs)
+            opened.append(rhs)
+
+        return _multiply(lhs, rhs, file, memory_budget, tile, prefetch)
+    finally:
+        for op in opened:
+            op.close()
+
+
+def _multiply(lhs: DiskMatrix, rhs: DiskMatrix, file: str, memory_budget: int, tile: int | None,
+              prefetch: bool) -> DiskMatrix:
+    if lhs.shape[1] != rhs.shape[0]:
+        raise MultiplicationDimensionMismatched(lhs.shape, rhs.shape)
+
+    if tile is None:
+        tile = tile_size(memory_budget)
+    elif tile <= 0:
+        raise ValueError(f"tile size {tile} should be positive")
+
+    start_time = time.perf_counter()
+    (n, m), p = lhs.shape, rhs.shape[1]
+    use_numpy = backend.active_backend() == "numpy"
+
+    # result tiles in row-major order; each one is reduced over the tiles of inner dimension in ascending order
+    steps = [(i, j, k) for i in _tiles(n, tile) for k in _tiles(p, tile) for j in _tiles(m, tile)]
+
+    def load(step: tuple) -> tuple:
+        (i0, ni), (j0, nj), (k0, nk) = step
+        a, b = lhs._read(i0, j0, ni, nj), rhs._read(j0, k0, nj, nk)
+
+        if use_numpy:
+            np = backend.np
+            return np.frombuffer(a, dtype=np.float64).reshape(ni, nj), np.frombuffer(b, dtype=np.float64).reshape(nj, nk)
+
+        a, b = a.tolist(), b.tolist()
+        return [a[r * nj:(r + 1) * nj] for r in range(ni)], [b[r * nk:(r + 1) * nk] for r in range(nj)]
+
+    def loads() -> Iterator[tuple]:
+        if not prefetch:
+            yield from map(load, steps)
+            return
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="matpak-ooc-prefetch") as executor:
+            pending = executor.submit(load, steps[0])
+            for idx in range(len(steps)):
+                tiles = pending.result()
+                if idx + 1 < len(steps):
+                    pending = executor.submit(load, steps[idx + 1])
+                yield tiles
+
+    atomic = AtomicFile(file)
+
+    with atomic as f:
+        write_mat_header(f, n, p)
+        f.truncate(HEADER_SIZE + 8 * n * p)
+        f.flush()
+
+        out = DiskMatrix(atomic.tmp_path, writable=True)
+        acc = None
+
+        try:
+            for step, (a, b) in zip(steps, loads()):
+                (i0, ni), (j0, nj), (k0, nk) = step
+
+                if acc is None:
+                    acc = backend.np.zeros((ni, nk)) if use_numpy else [[0] * nk for _ in range(ni)]
+
+                if use_numpy:
+                    acc += a @ b
+                else:
+                    kernels.mul_blocked(a, b, acc)
+
+                # last tile of inner dimension completes the result tile
+                if j0 + nj == m:
+                    data = acc if use_numpy else array('d', (el for row in acc for el in row))
+                    out._write(i0, k0, ni, nk, data)
+                    acc = None
+        finally:
+            out.close()
+
+    if instrument.enabled:
+        instrument.record("multiply", op="ooc_multiply", lhs_shape=(n, m), rhs_shape=(m, p), dtype="float64",
+                          algorithm="ooc", elapsed=time.perf_counter() - start_time, flops=2 * n * m * p)
+
+    return DiskMatrix(file)
@@ -0,0 +1,144 @@
+import os
+import pickle
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Context, setcontext
+from multiprocessing import shared_memory
+
+from .errors import MultiplicationDimensionMismatched
+from .mat import Matrix
+from .types import common_dtype
+from . import config, fixed, instrument, kernels
+
+
+# operands are copied into shared memory blocks once per product; every worker process attaches to them once
+# in its initializer, so tasks only carry row ranges. float64 products are written by workers straight into a
+# shared result block, decimal and fixed rows are returned to the parent. workers run in matpak decimal context
+# of the parent (see matpak.use_precision()).
+#
+# every result row is computed by the same kernel as Matrix.multiply(), so results are bit-identical to a single
+# process product regardless of workers count and block size.
+
+_worker_operands: dict = {}
+
+
+def _share(data=None, size: int = 0) -> shared_memory.SharedMemory:
+    data = memoryview(data).cast('B') if data is not None else None
+    size = data.nbytes if data is not None else size
+
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    if data is not None:
+        shm.buf[:size] = data
+
+    return shm
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # attached blocks are owned by parent process, which unlinks them after the product is done
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(ctx: Context, dtype: str, lhs: tuple, rhs: tuple, out: tuple | None):
+    setcontext(ctx)
+    _worker_operands.clear()
+    _worker_operands["dtype"] = dtype
+
+    if dtype == "float64":
+        for key, (name, rows, cols) in (("lhs", lhs), ("rhs", rhs), ("out", out)):
+            shm = _attach(name)
+            _worker_operands[key + "_shm"] = shm
+            _worker_operands[key] = Matrix.from_buffer(rows, cols, shm.buf[:8 * rows * cols]).raw
+    else:
+        for key, (name, size) in (("lhs", lhs), ("rhs", rhs)):
+            shm = _attach(name)
+            _worker_operands[key] = pickle.loads(shm.buf[:size])
+            shm.close()
+
+
+def _mul_rows(start: int, stop: int):
+    lhs, rhs = _worker_operands["lhs"], _worker_operands["rhs"]
+
+    if _worker_operands["dtype"] == "float64":
+        kernels.mul_dot(lhs[start:stop], rhs, _worker_operands["out"][start:stop])
+        return None
+
+    out = [[None] * len(rhs[0]) for _ in range(start, stop)]
+    kernels.mul_dot(lhs[start:stop], rhs, out)
+    return out
+
+
+@instrument.multiplies("parallel")
+def parallel_multiply(lhs: Matrix, rhs: Matrix, workers: int | None = None, block_rows: int | None = None,
+                      mp_context=None) -> Matrix:
+    """
+    multiply one matrix and other matrix on multiple processes. result rows are split into blocks of block_rows
+    rows, which are computed by a pool of worker processes. result is bit-identical to lhs.multiply(rhs) on
+    pure backend. fixed products are computed exactly by workers and rounded once by parent process.
+
+    operands are shipped to workers through shared memory: float64 buffers are shared as they are and decimal
+    operands are pickled once into a shared block, instead of being pickled for every task.
+
+    :param lhs: left hand side Matrix.
+    :param rhs: right hand side Matrix; dimensions of rhs should be valid for multiplication.
+    :param workers: worker processes count; by default, count of CPUs.
+    :param block_rows: result rows count computed by each task; by default, rows are split evenly to 4 tasks per worker.
+    :param mp_context: multiprocessing context of worker processes; by default, the platform default one.
+    :return: Matrix
+    """
+
+    if lhs.shape[1] != rhs.shape[0]:
+        raise MultiplicationDimensionMismatched(lhs.shape, rhs.shape)
+
+    if lhs.dtype != rhs.dtype:
+        dtype = common_dtype(lhs.dtype, rhs.dtype)
+        lhs = lhs if lhs.dtype == dtype else lhs.astype(dtype)
+        rhs = rhs if rhs.dtype == dtype else rhs.astype(dtype)
+
+    rows, cols = lhs.shape[0], rhs.shape[1]
+    workers = workers or os.cpu_count() or 1
+    block_rows = block_rows or max(1, -(-rows // (workers * 4)))
+
+    if block_rows <= 0:
+        raise ValueError(f"block rows {block_rows} should be positive")
+
+    blocks = [(start, min(start + block_rows, rows)) for start in range(0, rows, block_rows)]
+    dtype = lhs.dtype
+    ctx = config.get_decimal_context()
+    shms = []
+
+    try:
+        if dtype == "float64":
+            shms = [_share(lhs.buffer), _share(rhs.buffer), _share(size=8 * rows * cols)]
+            init_args = (ctx, dtype, (shms[0].name, *lhs.shape), (shms[1].name, *rhs.shape),
+                         (shms[2].name, rows, cols))
+        else:
+            lhs_data, rhs_data = pickle.dumps(lhs.raw), pickle.dumps(rhs.raw)
+            shms = [_share(lhs_data), _share(rhs_data)]
+            init_args = (ctx, dtype, (shms[0].name, len(lhs_data)), (shms[1].name, len(rhs_data)), None)
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(blocks)), mp_context=mp_context,
+                                 initializer=_init_worker, initargs=init_args) as pool:
+            results = list(pool.map(_mul_rows, *zip(*blocks)))
+
+        if dtype == "float64":
+            buf = array('d')
+            buf.frombytes(shms[2].buf[:8 * rows * cols])
+            return instrument.allocated(Matrix.from_buffer(rows, cols, buf))
+
+        res_raw = [row for block in results for row in block]
+
+        if dtype == "fixed":
+            scale = max(lhs.scale, rhs.scale)
+            with config.scope():
+                fixed.rescale(res_raw, lhs.scale + rhs.scale, scale)
+            return instrument.allocated(Matrix.from_fixed(rows, cols, res_raw, scale))
+
+        return Matrix.from_rows(res_raw, validate=False)
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,110 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from .mat import Matrix
+from .types import dtype_t
+from .vec import Vector
+from . import kernels
+
+
+class BufferPool:
+    def __init__(self, max_per_shape: int = 4):
+        """
+        initialize a pool of temporary matrices and vectors. released objects are kept per (kind, shape, dtype)
+        and handed out again by acquire(), so iterative code could reuse the same buffers as out= targets
+        instead of allocating a new result on every step.
+
+        :param max_per_shape: count of released objects kept for each kind, shape and dtype; extra ones are dropped.
+        """
+
+        if max_per_shape < 0:
+            raise ValueError(f"max per shape {max_per_shape} should not be negative")
+
+        self.__max_per_shape = max_per_shape
+        self.__free: dict[tuple, list["Matrix | Vector"]] = {}
+        self.__lock = threading.Lock()
+
+        self.__stats = {"hits": 0, "misses": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        get pool counters: acquires served from pool (hits), acquires that allocated (misses) and pooled objects count.
+
+        :return: dict of counters.
+        """
+        with self.__lock:
+            return {**self.__stats, "pooled": sum(len(free) for free in self.__free.values())}
+
+    def clear(self):
+        """
+        drop all pooled objects.
+        """
+        with self.__lock:
+            self.__free.clear()
+
+    def acquire(self, rows: int, cols: int | None = None, dtype: dtype_t = "decimal",
+                zero: bool = False) -> "Matrix | Vector":
+        """
+        get a rows*cols matrix, or a vector if cols is None, from pool; a new one is allocated if pool has none.
+        elements of a pooled object are left from its last use unless zero is set.
+
+        :param rows: rows count.
+        :param cols: cols count of matrix; or None for a vector.
+        :param dtype: elements storage type.
+        :param zero: zero fill elements of a pooled object.
+        :return: Matrix or Vector
+        """
+        key = (Vector if cols is None else Matrix), (rows, 1 if cols is None else cols), dtype
+
+        with self.__lock:
+            free = self.__free.get(key)
+            obj = free.pop() if free else None
+            self.__stats["hits" if obj is not None else "misses"] += 1
+
+        if obj is None:
+            return Vector(rows, dtype=dtype) if cols is None else Matrix(rows, cols, dtype=dtype)
+
+        if zero:
+            kernels.fill([obj.raw] if isinstance(obj, Vector) else obj.raw, kernels.zero(dtype))
+
+        if isinstance(obj, Matrix):
+            obj._changed()
+
+        return obj
+
+    def release(self, obj: "Matrix | Vector"):
+        """
+        return an acquired object to pool. it should not be used by caller afterwards.
+
+        :param obj: Matrix or Vector.
+        """
+        key = type(obj), obj.shape, obj.dtype
+
+        with self.__lock:
+            free = self.__free.setdefault(key, [])
+
+            if any(el is obj for el in free):
+                raise ValueError("object is already released to pool")
+
+            if len(free) < self.__max_per_shape:
+                free.append(obj)
+
+    @contextmanager
+    def temporary(self, rows: int, cols: int | None = None, dtype: dtype_t = "decimal",
+                  zero: bool = False) -> Iterator["Matrix | Vector"]:
+        """
+        acquire an object for the duration of a with block; it is released on exit.
+
+        :param rows: rows count.
+        :param cols: cols count of matrix; or None for a vector.
+        :param dtype: elements storage type.
+        :param zero: zero fill elements of a pooled object.
+        :return: context manager of Matrix or Vector.
+        """
+        obj = self.acquire(rows, cols, dtype, zero)
+        try:
+            yield obj
+        finally:
+            self.release(obj)
@@ -0,0 +1,285 @@
+from bisect import bisect_left
+from decimal import Decimal
+from operator import itemgetter
+from typing import Iterable, Iterator
+
+from .errors import MatrixDimensionInvalid, MultiplicationDimensionMismatched
+from .mat import Matrix
+from .vec import Vector
+from . import config, fixed, instrument, kernels
+
+type triplet_t = tuple[int, int, Decimal]
+
+
+class SparseMatrix:
+    def __init__(self, rows: int, cols: int, triplets: Iterable[triplet_t] | None = None):
+        """
+        initialize rows*cols sparse matrix in CSR (compressed sparse row) format from COO triplets.
+
+        only nonzero elements are stored: for row i, its col indices are indices[indptr[i]:indptr[i+1]]
+        in ascending order and its values are data[indptr[i]:indptr[i+1]]. duplicated triplets are summed
+        and zero values are dropped.
+
+        :param rows: matrix rows count.
+        :param cols: matrix cols count.
+        :param triplets: initial (row, col, value) triplets; or None as default for zero matrix.
+        """
+
+        if rows <= 0 or cols <= 0:
+            raise MatrixDimensionInvalid(f"matrix {rows}x{cols} rows count or cols count are invalid.")
+
+        self.__rows = rows
+        self.__cols = cols
+
+        self.__indptr: list[int] = [0] * (rows + 1)
+        self.__indices: list[int] = []
+        self.__data: list[Decimal] = []
+
+        if triplets is None:
+            return
+
+        last = None
+        for row, col, val in sorted(triplets, key=itemgetter(0, 1)):
+            if row >= rows or col >= cols or row < 0 or col < 0:
+                raise ValueError(f"address {row}*{col} is not in boundaries of matrix {rows}*{cols}")
+
+            if (row, col) == last:
+                self.__data[-1] += val
+                continue
+
+            self.__indptr[row + 1] += 1
+            self.__indices.append(col)
+            self.__data.append(val)
+            last = row, col
+
+        for i in range(rows):
+            self.__indptr[i + 1] += self.__indptr[i]
+
+        if any(val == 0 for val in self.__data):
+            self.__rebuild(list(self.coo()))
+
+    def __rebuild(self, triplets: list[triplet_t]):
+        self.__indptr = [0] * (self.__rows + 1)
+        self.__indices = []
+        self.__data = []
+
+        for row, col, val in triplets:
+            if val != 0:
+                self.__indptr[row + 1] += 1
+                self.__indices.append(col)
+                self.__data.append(val)
+
+        for i in range(self.__rows):
+            self.__indptr[i + 1] += self.__indptr[i]
+
+    @classmethod
+    def from_dense(cls, mat: Matrix) -> "SparseMatrix":
+        """
+        create sparse matrix from nonzero elements of a dense matrix. elements are stored as Decimal for every
+        dtype; float elements are converted through their shortest repr, as Matrix.astype() does.
+
+        :param mat: dense matrix.
+        :return: SparseMatrix
+        """
+        rows, cols = mat.shape
+        dense = mat.tolist() if mat.dtype == "fixed" else mat.raw
+        nonzeros = ((i, j, val) for i, row in enumerate(dense) for j, val in enumerate(row) if val != 0)
+
+        if mat.dtype == "float64":
+            nonzeros = ((i, j, fixed.to_decimal(val)) for i, j, val in nonzeros)
+
+        return cls(rows, cols, nonzeros)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        get matrix dimensions.
+
+        :return: a tuple of matrix rows*cols
+        """
+        return self.__rows, self.__cols
+
+    @property
+    def nnz(self) -> int:
+        """
+        get count of stored nonzero elements.
+
+        :return: int
+        """
+        return len(self.__data)
+
+    @property
+    def csr(self) -> tuple[list[int], list[int], list[Decimal]]:
+        """
+        get raw CSR storage of matrix.
+
+        :return: a tuple of (indptr, indices, data) lists.
+        """
+        return self.__indptr, self.__indices, self.__data
+
+    def coo(self) -> Iterator[triplet_t]:
+        """
+        iterate nonzero elements as (row, col, value) triplets in row-major order.
+
+        :return: iterator of triplets.
+        """
+        indptr, indices, data = self.__indptr, self.__indices, self.__data
+
+        for i in range(self.__rows):
+            for p in range(indptr[i], indptr[i + 1]):
+                yield i, indices[p], data[p]
+
+    def to_dense(self, dtype: str = "decimal") -> Matrix:
+        """
+        get dense copy of matrix.
+
+        :param dtype: elements storage type of dense matrix.
+        :return: Matrix
+        """
+
+        if dtype == "fixed":
+            return self.to_dense().astype(dtype)
+
+        res = Matrix(self.__rows, self.__cols, dtype=dtype)
+        raw = res.raw
+
+        for i, j, val in self.coo():
+            raw[i][j] = val
+
+        return res
+
+    def __find(self, row: int, col: int) -> int:
+        if row > self.__rows - 1 or col > self.__cols - 1 or row < 0 or col < 0:
+            raise ValueError(f"address {row}*{col} is not in boundaries of matrix {self.__rows}*{self.__cols}")
+
+        start, end = self.__indptr[row], self.__indptr[row + 1]
+        return bisect_left(self.__indices, col, start, end)
+
+    def set(self, row: int, col: int, val: Decimal):
+        """
+        store 'val' in matrix[row][col] address. inserting a new nonzero or removing one shifts the storage,
+        so it costs O(nnz); build matrices from triplets where possible.
+
+        :param row: number of row.
+        :param col: number of col.
+        :param val: value to be stored inside matrix[row][col] address.
+        """
+
+        p = self.__find(row, col)
+        exists = p < self.__indptr[row + 1] and self.__indices[p] == col
+
+        if exists and val != 0:
+            self.__data[p] = val
+            return
+
+        if exists:
+            del self.__indices[p]
+            del self.__data[p]
+            shift = -1
+        elif val != 0:
+            self.__indices.insert(p, col)
+            self.__data.insert(p, val)
+            shift = 1
+        else:
+            return
+
+        for i in range(row + 1, self.__rows + 1):
+            self.__indptr[i] += shift
+
+    def get(self, row: int, col: int) -> Decimal:
+        """
+        get value of matrix[row][col] address.
+
+        :param row: number of row.
+        :param col: number of col.
+        :return: Decimal
+        """
+
+        p = self.__find(row, col)
+
+        if p < self.__indptr[row + 1] and self.__indices[p] == col:
+            return self.__data[p]
+
+        return Decimal(0.0)
+
+    # multiplication methods
+
+    @instrument.multiplies("sparse")
+    @config.in_context
+    def multiply(self, rhs: "SparseMatrix | Matrix | Vector") -> "SparseMatrix | Matrix | Vector":
+        """
+        multiply sparse matrix and other sparse matrix, dense matrix or vector. only nonzero elements of sparse
+        operands are visited. return type is analogous to rhs type.
+
+        for a fixed rhs, elements are converted to fixed with the smallest scale holding them exactly, and product
+        is rounded to the larger scale of operands, as in Matrix.multiply().
+
+        :param rhs: right hand side, could be SparseMatrix, Matrix or Vector but dimensions of rhs should be valid for multiplication.
+        :return: SparseMatrix, Matrix or Vector based on rhs type.
+        """
+
+        self_shape = self.shape
+
+        if self_shape[1] != rhs.shape[0]:
+            raise MultiplicationDimensionMismatched(self_shape, rhs.shape)
+
+        indptr, indices, data = self.__indptr, self.__indices, self.__data
+
+        if isinstance(rhs, SparseMatrix):
+            rhs_indptr, rhs_indices, rhs_data = rhs.csr
+            triplets: list[triplet_t] = []
+
+            for i in range(self.__rows):
+                acc: dict[int, Decimal] = {}
+
+                for p in range(indptr[i], indptr[i + 1]):
+                    a = data[p]
+                    for q in range(rhs_indptr[indices[p]], rhs_indptr[indices[p] + 1]):
+                        k = rhs_indices[q]
+                        acc[k] = acc[k] + a * rhs_data[q] if k in acc else a * rhs_data[q]
+
+                triplets.extend((i, k, acc[k]) for k in sorted(acc))
+
+            res = SparseMatrix(self.__rows, rhs.shape[1])
+            res.__rebuild(triplets)
+
+            return res
+
+        if rhs.dtype == "fixed":
+            scale = fixed.infer_scale(data)
+            data = fixed.to_fixed_rows([data], scale)[0]
+        elif rhs.dtype == "float64":
+            data = list(map(float, data))
+
+        zero = kernels.zero(rhs.dtype)
+
+        if isinstance(rhs, Matrix):
+            rhs_raw = rhs.raw
+            zero_row = [zero] * rhs.shape[1]
+            res_raw = []
+
+            for i in range(self.__rows):
+                acc = zero_row
+                for p in range(indptr[i], indptr[i + 1]):
+                    a = data[p]
+                    acc = [c + a * b for c, b in zip(acc, rhs_raw[indices[p]])]
+                res_raw.append(list(acc) if acc is zero_row else acc)
+
+            if rhs.dtype == "fixed":
+                fixed.rescale(res_raw, scale + rhs.scale, max(scale, rhs.scale))
+                res = Matrix.from_fixed(self.__rows, rhs.shape[1], res_raw, max(scale, rhs.scale))
+                return instrument.allocated(res)
+
+            return Matrix(self.__rows, rhs.shape[1], res_raw, rhs.dtype)
+
+        vec = rhs.raw
+        res_vec = [
+            sum((data[p] * vec[indices[p]] for p in range(indptr[i], indptr[i + 1])), zero)
+            for i in range(self.__rows)
+        ]
+
+        if rhs.dtype == "fixed":
+            fixed.rescale([res_vec], scale + rhs.scale, max(scale, rhs.scale))
+            return instrument.allocated(Vector.from_fixed(self.__rows, res_vec, max(scale, rhs.scale)))
+
+        return Vector(self.__rows, res_vec, rhs.dtype)
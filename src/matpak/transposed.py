@@ -0,0 +1,180 @@
+from decimal import Decimal
+
+from .mat import Matrix
+from .types import lst_dec_2d_t, dtype_t
+from . import instrument, kernels
+
+
+class TransposedMatrix:
+    __slots__ = ("__base",)
+
+    def __init__(self, base: Matrix):
+        """
+        initialize a zero-copy transposed view of base matrix; use Matrix.T to get one.
+
+        elements are addressed in transposed order but stored in base matrix only, so changes through the view
+        are visible in base matrix and vice versa. rows of the view are only materialised when they are needed
+        (raw, or multiplying the view by other operand); the contiguous transpose is cached in base matrix until
+        one of its elements is changed.
+
+        :param base: matrix to be viewed transposed.
+        """
+        self.__base = base
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        get view dimensions, which are base matrix dimensions swapped.
+
+        :return: a tuple of view rows*cols
+        """
+        rows, cols = self.__base.shape
+        return cols, rows
+
+    @property
+    def dtype(self) -> dtype_t:
+        """
+        get elements storage type of base matrix.
+
+        :return: "decimal", "float64" or "fixed"
+        """
+        return self.__base.dtype
+
+    @property
+    def scale(self) -> int | None:
+        """
+        get digits count after decimal point of fixed elements of base matrix.
+
+        :return: int; or None if dtype is not "fixed".
+        """
+        return self.__base.scale
+
+    @property
+    def T(self) -> Matrix:
+        """
+        get base matrix, which is transpose of this view.
+
+        :return: Matrix
+        """
+        return self.__base
+
+    @property
+    def raw(self) -> lst_dec_2d_t:
+        """
+        get rows of the cached contiguous transpose; it is materialised on first access. rows should not be
+        modified, use set() instead.
+
+        :return: lst_dec_2d_t
+        """
+        return self.__base._transposed().raw
+
+    def materialize(self) -> Matrix:
+        """
+        get a transposed copy of base matrix, which is independent from it.
+
+        :return: Matrix
+        """
+        t = self.__base._transposed()
+        return t.astype(t.dtype)
+
+    def astype(self, dtype: dtype_t, scale: int | None = None) -> Matrix:
+        """
+        get a transposed copy of base matrix with elements converted to dtype.
+
+        :param dtype: elements storage type of the copy.
+        :param scale: scale of a fixed copy; see Matrix.astype().
+        :return: Matrix
+        """
+        return self.__base._transposed().astype(dtype, scale)
+
+    def to_numpy(self):
+        """
+        get view as a transposed 2D NumPy array of base matrix; see Matrix.to_numpy().
+
+        :return: numpy.ndarray
+        """
+        return self.__base.to_numpy().T
+
+    def tolist(self) -> lst_dec_2d_t:
+        """
+        get a copy of view elements as a 2D list.
+
+        :return: lst_dec_2d_t
+        """
+        return [list(col) for col in zip(*self.__base.tolist())]
+
+    def set(self, row: int, col: int, val: Decimal):
+        """
+        store 'val' in view[row][col] address, which is base[col][row] address.
+
+        :param row: number of row.
+        :param col: number of col.
+        :param val: value to be stored inside view[row][col] address.
+        """
+        self.__base.set(col, row, val)
+
+    def get(self, row: int, col: int) -> Decimal:
+        """
+        get value of view[row][col] address, which is base[col][row] address.
+
+        :param row: number of row.
+        :param col: number of col.
+        :return: Decimal
+        """
+        return self.__base.get(col, row)
+
+    # multiplication methods
+
+    def plan_multiply(self, rhs: "Matrix | TransposedMatrix | Vector", algorithm: str = "auto") -> str:
+        """
+        get the strategy that multiply() takes for rhs; see Matrix.plan_multiply(). rows of the view are
+        materialised (and cached) to plan the product.
+
+        :param rhs: right hand side, could be Matrix, TransposedMatrix or Vector.
+        :param algorithm: "auto" (or "dot") to choose a dot strategy by operands layout, or a kernel name.
+        :return: strategy name.
+        """
+        return self.__base._transposed().plan_multiply(rhs, algorithm)
+
+    @instrument.multiplies()
+    def multiply(self, rhs: "Matrix | TransposedMatrix | Vector", algorithm: str = "auto",
+                 block_size: int = kernels.DEFAULT_BLOCK_SIZE, out: "Matrix | Vector | None" = None) -> "Matrix | Vector":
+        """
+        multiply view and other matrix or vector; see Matrix.multiply(). view rows are read from the cached
+        contiguous transpose of base matrix, so repeated products of the same view transpose it only once.
+
+        :param rhs: right hand side, could be Matrix, TransposedMatrix or Vector but dimensions of rhs should be valid for multiplication.
+        :param algorithm: multiplication kernel name; "auto" by default.
+        :param block_size: tile edge size of "blocked" algorithm.
+        :param out: Matrix or Vector that the result is stored in; see Matrix.multiply().
+        :return: Matrix or Vector based on rhs type.
+        """
+
+        if out is self.__base:
+            raise ValueError("out should not be an operand of the product; use in-place methods instead")
+
+        return self.__base._transposed().multiply(rhs, algorithm, block_size, out)
+
+    # operators; results are new matrices, computed from the cached contiguous transpose of base matrix
+
+    def __matmul__(self, other: "Matrix | TransposedMatrix | Vector") -> "Matrix | Vector":
+        from .vec import Vector
+
+        if not isinstance(other, (Matrix, TransposedMatrix, Vector)):
+            return NotImplemented
+
+        return self.multiply(other)
+
+    def __add__(self, other: "Matrix | TransposedMatrix") -> Matrix:
+        return self.__base._transposed()._combine(other, None)
+
+    def __sub__(self, other: "Matrix | TransposedMatrix") -> Matrix:
+        return self.__base._transposed()._combine(other, -1)
+
+    def __mul__(self, alpha) -> Matrix:
+        return self.__base._transposed() * alpha
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> Matrix:
+        return -self.__base._transposed()
@@ -1,4 +1,23 @@
 from decimal import Decimal
+from typing import Literal
 
 type lst_dec_1d_t = list[Decimal]
 type lst_dec_2d_t = list[list[Decimal]]
+
+type dtype_t = Literal["decimal", "float64", "fixed"]
+
+DTYPES: tuple[str, ...] = ("decimal", "float64", "fixed")
+
+
+def common_dtype(*dtypes: dtype_t) -> dtype_t:
+    """
+    get dtype that operands of mixed dtypes are computed in: float64 if any of them is float64, else decimal
+    if any of them is decimal, else fixed.
+
+    :param dtypes: operands dtypes.
+    :return: dtype_t
+    """
+    for dtype in ("float64", "decimal"):
+        if dtype in dtypes:
+            return dtype
+    return "fixed"
@@ -1,28 +1,157 @@
 from __future__ import annotations
+from array import array
 from decimal import Decimal
+from typing import Iterable
 
 from .errors import VectorDimensionInvalid, MultiplicationDimensionMismatched
-from .types import lst_dec_1d_t
+from .types import lst_dec_1d_t, dtype_t, DTYPES, common_dtype
+from . import backend, config, fixed, instrument, kernels
+
+
+_ZERO = Decimal(0)
 
 
 class Vector:
-    def __init__(self, rows: int, init_vec: lst_dec_1d_t | None = None):
+    # no per-instance dict; many small vectors are cheaper to keep and to create
+    __slots__ = ("__rows", "__dtype", "__scale", "__raw_vec", "__weakref__")
+
+    def __init__(self, rows: int, init_vec: lst_dec_1d_t | None = None, dtype: dtype_t = "decimal",
+                 scale: int | None = None):
         """
         initialize a rows count vector and init_vec list
 
+        elements are stored based on dtype:
+            - "decimal": a list of Decimal elements.
+            - "float64": a contiguous array('d') of C doubles (8 bytes per element). init_vec elements are converted to float.
+            - "fixed": a list of python ints holding element * 10**scale; see Matrix.
+
         :param rows: vector rows count.
         :param init_vec: initial values for vector; or None as default for zero vector.
+        :param dtype: elements storage type; "decimal" by default.
+        :param scale: digits count after decimal point of fixed elements; by default, the smallest one holding
+        init_vec elements exactly. it is ignored for other dtypes.
         """
         if rows <= 0:
             raise VectorDimensionInvalid(f"vector with {rows} rows is invalid.")
 
+        if dtype not in DTYPES:
+            raise ValueError(f"unknown dtype '{dtype}', it should be one of {list(DTYPES)}")
+
+        if init_vec is not None and len(init_vec) != rows:
+            raise VectorDimensionInvalid(f"vector rows count should be {rows} but found {len(init_vec)} elements")
+
         self.__rows = rows
+        self.__dtype = dtype
+        self.__scale: int | None = None
+
+        if dtype == "float64":
+            if init_vec is None:
+                self.__raw_vec: array = array('d', bytes(8 * rows))
+            else:
+                self.__raw_vec: array = array('d', init_vec)
+        elif dtype == "fixed":
+            if scale is None:
+                scale = 0 if init_vec is None else fixed.infer_scale(init_vec)
 
-        if init_vec is None:
-            self.__raw_vec: lst_dec_1d_t = [Decimal(0.0)] * rows
+            self.__scale = scale
+            self.__raw_vec: list[int] = [0] * rows if init_vec is None else fixed.to_fixed_rows([init_vec], scale)[0]
+        elif init_vec is None:
+            self.__raw_vec: lst_dec_1d_t = [_ZERO] * rows
         else:
             self.__raw_vec: lst_dec_1d_t = init_vec
 
+        if instrument.enabled:
+            instrument.record_alloc(self)
+
+    def __reduce__(self):
+        return Vector, (self.__rows, self.tolist(), self.__dtype, self.__scale)
+
+    @classmethod
+    def __wrap(cls, rows: int, dtype: dtype_t, scale: int | None, raw) -> Vector:
+        # create a vector on storage that is already valid for its dtype, without any check or copy
+        vec = cls.__new__(cls)
+        vec.__rows = rows
+        vec.__dtype = dtype
+        vec.__scale = scale
+        vec.__raw_vec = raw
+
+        return vec
+
+    @classmethod
+    def from_iterable(cls, values: Iterable, dtype: dtype_t = "decimal", scale: int | None = None) -> Vector:
+        """
+        create a vector from elements of an iterable, e.g, a generator; rows count is taken from the elements.
+        float64 elements are written straight to the vector array, and a list of decimal elements is used as it
+        is, without copying, as __init__ does.
+
+        :param values: iterable of elements.
+        :param dtype: elements storage type; "decimal" by default.
+        :param scale: digits count after decimal point of fixed elements; see __init__.
+        :return: Vector
+        """
+
+        if dtype not in DTYPES:
+            raise ValueError(f"unknown dtype '{dtype}', it should be one of {list(DTYPES)}")
+
+        raw = array('d', values) if dtype == "float64" else values if isinstance(values, list) else list(values)
+
+        if not raw:
+            raise VectorDimensionInvalid("vector with 0 rows is invalid.")
+
+        if dtype == "fixed":
+            if scale is None:
+                scale = fixed.infer_scale(raw)
+            raw = fixed.to_fixed_rows([raw], scale)[0]
+
+        vec = cls.__wrap(len(raw), dtype, scale if dtype == "fixed" else None, raw)
+
+        if instrument.enabled:
+            instrument.record_alloc(vec)
+
+        return vec
+
+    @classmethod
+    def from_buffer(cls, rows: int, buf) -> Vector:
+        """
+        create a float64 vector backed by an existing buffer of rows C doubles. buffer is not copied, so changes
+        to vector elements are visible through buffer and vice versa.
+
+        :param rows: vector rows count.
+        :param buf: any object supporting buffer protocol, e.g, array('d'), bytearray or mmap.
+        :return: Vector
+        """
+
+        if rows <= 0:
+            raise VectorDimensionInvalid(f"vector with {rows} rows is invalid.")
+
+        view = memoryview(buf)
+        if view.format != 'd' or view.ndim != 1:
+            view = view.cast('B').cast('d')
+
+        if len(view) != rows:
+            raise VectorDimensionInvalid(f"buffer with {len(view)} elements could not hold a vector with {rows} rows")
+
+        return cls.__wrap(rows, "float64", None, view)
+
+    @classmethod
+    def from_fixed(cls, rows: int, raw: list[int], scale: int) -> Vector:
+        """
+        create a fixed vector from a list of python ints holding element * 10**scale. list is not copied.
+
+        :param rows: vector rows count.
+        :param raw: list of rows ints.
+        :param scale: digits count after decimal point.
+        :return: Vector
+        """
+
+        if rows <= 0 or len(raw) != rows:
+            raise VectorDimensionInvalid(f"list with {len(raw)} elements could not hold a vector with {rows} rows")
+
+        if scale < 0:
+            raise ValueError(f"fixed scale {scale} should not be negative")
+
+        return cls.__wrap(rows, "fixed", scale, raw)
+
     @property
     def shape(self) -> tuple[int, int]:
         """
@@ -32,15 +161,110 @@ class Vector:
         """
         return self.__rows, 1
 
+    @property
+    def dtype(self) -> dtype_t:
+        """
+        get vector elements storage type.
+
+        :return: "decimal", "float64" or "fixed"
+        """
+        return self.__dtype
+
+    @property
+    def scale(self) -> int | None:
+        """
+        get digits count after decimal point of fixed elements.
+
+        :return: int; or None if dtype is not "fixed".
+        """
+        return self.__scale
+
     @property
     def raw(self) -> lst_dec_1d_t:
         """
-        get raw vector 1D list of Decimal values.
+        get raw vector 1D list of Decimal values. for float64 vectors, it is a buffer of C doubles, and for fixed
+        vectors, it is a list of ints holding element * 10**scale.
 
         :return: lst_dec_1d_t
         """
         return self.__raw_vec
 
+    def to_numpy(self):
+        """
+        get vector as a 1D NumPy array. for float64 vectors, array shares the underlying buffer without copying;
+        decimal vectors are copied to an array of Decimal objects.
+
+        :return: numpy.ndarray
+        """
+        backend.require_numpy()
+
+        if self.__dtype == "float64":
+            return backend.np.frombuffer(self.__raw_vec, dtype=backend.np.float64)
+
+        return backend.np.array(self.tolist(), dtype=object)
+
+    @classmethod
+    def from_numpy(cls, arr) -> Vector:
+        """
+        create a vector from a 1D NumPy array. C-contiguous float64 arrays are wrapped without copying; object arrays
+        become decimal vectors and other numeric arrays are converted to float64.
+
+        :param arr: 1D numpy.ndarray.
+        :return: Vector
+        """
+        backend.require_numpy()
+
+        if arr.ndim != 1:
+            raise VectorDimensionInvalid(f"could not create a vector from a {arr.ndim}D array")
+
+        if arr.dtype == object:
+            return cls(len(arr), arr.tolist())
+
+        buf = backend.np.ascontiguousarray(arr, dtype=backend.np.float64)
+        vec = cls.from_buffer(len(arr), buf)
+
+        # arrays of another layout or element type are copied to a new buffer
+        return vec if buf is arr else instrument.allocated(vec)
+
+    def tolist(self) -> lst_dec_1d_t:
+        """
+        get a copy of vector elements as a list. fixed elements are converted to exact Decimal values.
+
+        :return: lst_dec_1d_t
+        """
+
+        if self.__dtype == "fixed":
+            scale = self.__scale
+            return [fixed.from_fixed(el, scale) for el in self.__raw_vec]
+
+        return list(self.__raw_vec)
+
+    def astype(self, dtype: dtype_t, scale: int | None = None) -> Vector:
+        """
+        get a copy of vector with elements converted to dtype. float elements are converted to Decimal
+        through their shortest repr, so 0.1 becomes Decimal("0.1").
+
+        :param dtype: elements storage type of the copy.
+        :param scale: scale of a fixed copy; see Matrix.astype().
+        :return: Vector
+        """
+
+        if dtype == "fixed" and self.__dtype == "fixed":
+            raw = [list(self.__raw_vec)]
+            if scale is not None:
+                fixed.rescale(raw, self.__scale, scale)
+            res = Vector.from_fixed(self.__rows, raw[0], self.__scale if scale is None else scale)
+            return instrument.allocated(res)
+
+        if dtype == "float64" and self.__dtype == "fixed":
+            d = 10 ** self.__scale
+            return Vector(self.__rows, [el / d for el in self.__raw_vec], dtype)
+
+        if dtype == "decimal" and self.__dtype == "float64":
+            return Vector(self.__rows, [Decimal(repr(el)) for el in self.__raw_vec])
+
+        return Vector(self.__rows, self.tolist(), dtype, scale)
+
     def set(self, row: int, val: Decimal):
         """
         store 'val' in vector[row] address.
@@ -49,10 +273,10 @@ class Vector:
         :param val: value to be stored inside vector[row] address.
         """
 
-        if row > self.__rows or row < 0:
+        if row > self.__rows-1 or row < 0:
             raise ValueError(f"address {row} is not in boundaries of vector with {self.__rows} rows")
 
-        self.__raw_vec[row] = val
+        self.__raw_vec[row] = fixed.to_fixed(val, self.__scale) if self.__dtype == "fixed" else val
 
     def get(self, row: int) -> Decimal:
         """
@@ -62,19 +286,47 @@ class Vector:
         :return: Decimal
         """
 
-        if row > self.__rows:
+        if row > self.__rows-1 or row < 0:
             raise ValueError(f"address {row} is not in boundaries of vector with {self.__rows} rows")
 
+        if self.__dtype == "fixed":
+            return fixed.from_fixed(self.__raw_vec[row], self.__scale)
+
         return self.__raw_vec[row]
 
+    def _changed(self, scale: int | None = None):
+        """
+        mark elements as changed after writing to raw list; see Matrix._changed().
+
+        :param scale: new scale of fixed elements written to raw list; or None to keep it.
+        """
+
+        if scale is not None and self.__dtype == "fixed":
+            self.__scale = scale
+
     # multiplication methods
 
-    def multiply(self, rhs: "Matrix") -> "Matrix":
-        from .mat import Matrix
+    def lazy(self) -> "LazyProduct":
+        """
+        start a deferred multiplication chain with this vector. chain is computed on evaluate() in the
+        association order with the fewest scalar multiplications.
+
+        :return: LazyProduct
+        """
+
+        from .lazy import LazyProduct
+        return LazyProduct([self])
+
+    @instrument.multiplies("dot")
+    @config.in_context
+    def multiply(self, rhs: "Matrix", out: "Matrix | None" = None) -> "Matrix":
+        from .mat import Matrix, _check_out, _fixed_product
         """
         multiply row-major(col-major and row-major are not different in vector-matrix multiplication) one vector and other matrix or vecto.
 
         :param rhs: right hand side, should be Matrix 1*m.
+        :param out: Matrix that the result is stored in instead of allocating a new one; its shape and dtype
+        should match the result and it should not be rhs.
         :return: Matrix
         """
 
@@ -83,12 +335,194 @@ class Vector:
         if self_shape[1] != rhs.shape[0]:
             raise MultiplicationDimensionMismatched(self_shape, rhs.shape)
 
-        res: Matrix = Matrix(self_shape[0], rhs.shape[1])
+        dtype = common_dtype(self.__dtype, rhs.dtype)
+
+        if out is not None:
+            _check_out(out, Matrix, (self_shape[0], rhs.shape[1]), dtype, (rhs,))
+            out._changed()
+
+        if backend.numpy_enabled(self, rhs):
+            if out is not None:
+                backend.np.matmul(self.to_numpy()[:, None], rhs.to_numpy(), out=out.to_numpy())
+                return out
+
+            return instrument.allocated(Matrix.from_numpy(backend.np.matmul(self.to_numpy()[:, None], rhs.to_numpy())))
+
+        vec = self if self.__dtype == dtype else self.astype(dtype)
+        rhs = rhs if rhs.dtype == dtype else rhs.astype(dtype)
+
+        res: Matrix = out if out is not None else Matrix(self_shape[0], rhs.shape[1], dtype=dtype)
+        kernels.mul_dot([[el] for el in vec.raw], rhs.raw, res.raw)
+
+        if dtype == "fixed":
+            _fixed_product(res, vec.scale, rhs.scale)
+
+        return res
+
+    # in-place methods
+
+    def __coerce(self, other) -> tuple[list, int | None]:
+        # in-place results keep vector dtype, so operands of a wider dtype (see common_dtype()) could not be taken
+        if other.dtype == self.__dtype:
+            return other.raw, other.scale
+
+        if common_dtype(self.__dtype, other.dtype) == self.__dtype:
+            return other.astype(self.__dtype).raw, None
+
+        raise ValueError(f"could not store {other.dtype} elements in a {self.__dtype} vector in place; "
+                         f"convert it by astype() first")
+
+    @config.in_context
+    def imul_(self, lhs: "Matrix") -> Vector:
+        """
+        multiply square lhs matrix by vector in place: vector = lhs * vector. no result vector is allocated.
+
+        :param lhs: rows*rows square matrix.
+        :return: vector itself.
+        """
+
+        if lhs.shape != (self.__rows, self.__rows):
+            raise MultiplicationDimensionMismatched(lhs.shape, self.shape)
+
+        if backend.numpy_enabled(self, lhs):
+            arr = self.to_numpy()
+            arr[...] = backend.np.matmul(lhs.to_numpy(), arr)
+        else:
+            lhs_raw, lhs_scale = self.__coerce(lhs)
+            # all elements are computed before any of them is stored
+            kernels.mul_vec(lhs_raw, self.__raw_vec, self.__raw_vec)
+
+            if self.__dtype == "fixed":
+                fixed.rescale([self.__raw_vec], lhs_scale + self.__scale, self.__scale)
+
+        return self
+
+    def add_(self, other: Vector) -> Vector:
+        """
+        add other vector to vector in place: vector = vector + other.
+
+        :param other: vector with same rows count.
+        :return: vector itself.
+        """
+        return self.axpy(None, other)
+
+    @config.in_context
+    def axpy(self, alpha, x: Vector) -> Vector:
+        """
+        add scaled x to vector in place: vector = vector + alpha * x.
+
+        :param alpha: scalar of x; or None to add x as is.
+        :param x: vector with same rows count.
+        :return: vector itself.
+        """
+
+        if x.shape != self.shape:
+            raise VectorDimensionInvalid(f"could not add vector with {x.shape[0]} rows to vector with {self.__rows} rows")
+
+        x_raw, x_scale = self.__coerce(x)
+
+        if self.__dtype == "fixed":
+            fixed.axpy(alpha, [x_raw], x_scale, [self.__raw_vec], self.__scale)
+        else:
+            alpha = None if alpha is None else kernels.as_scalar(alpha, self.__dtype)
+            kernels.axpy(alpha, [x_raw], [self.__raw_vec])
+
+        return self
+
+    @config.in_context
+    def scale_(self, alpha) -> Vector:
+        """
+        scale vector in place: vector = alpha * vector.
+
+        :param alpha: scalar.
+        :return: vector itself.
+        """
+        if self.__dtype == "fixed":
+            fixed.scale(alpha, [self.__raw_vec], self.__scale)
+        else:
+            kernels.scale(kernels.as_scalar(alpha, self.__dtype), [self.__raw_vec])
+
+        return self
+
+    # operators
+
+    def __matmul__(self, rhs: "Matrix") -> "Matrix":
+        from .mat import Matrix
+
+        if not isinstance(rhs, Matrix):
+            return NotImplemented
+
+        return self.multiply(rhs)
+
+    @config.in_context
+    def _combine(self, other: Vector, beta, reflected: bool = False) -> Vector:
+        """
+        get a new vector of vector + beta * other in one pass (other + beta * vector if reflected). operands are
+        converted to their common dtype; fixed operands to the larger scale of them.
+        """
+
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        if other.shape != self.shape:
+            raise VectorDimensionInvalid(f"could not add vector with {other.shape[0]} rows to vector with "
+                                         f"{self.__rows} rows")
+
+        dtype = common_dtype(self.__dtype, other.dtype)
+        scale = max(self.__scale, other.scale) if dtype == "fixed" else None
+        lhs, rhs = (other, self) if reflected else (self, other)
+
+        lhs_raw = lhs.raw if (lhs.dtype, lhs.scale) == (dtype, scale) else lhs.astype(dtype, scale).raw
+        rhs_raw = rhs.raw if (rhs.dtype, rhs.scale) == (dtype, scale) else rhs.astype(dtype, scale).raw
+        raw = kernels.combine(None, [lhs_raw], beta, [rhs_raw])[0]
+
+        if dtype == "fixed":
+            return instrument.allocated(Vector.from_fixed(self.__rows, raw, scale))
+
+        return Vector(self.__rows, raw, dtype)
+
+    def __add__(self, other: Vector) -> Vector:
+        return self._combine(other, None)
+
+    def __radd__(self, other: Vector) -> Vector:
+        return self._combine(other, None, reflected=True)
+
+    def __sub__(self, other: Vector) -> Vector:
+        return self._combine(other, -1)
+
+    def __rsub__(self, other: Vector) -> Vector:
+        return self._combine(other, -1, reflected=True)
+
+    @config.in_context
+    def __mul__(self, alpha) -> Vector:
+        if not isinstance(alpha, (int, float, Decimal)):
+            return NotImplemented
+
+        if self.__dtype == "fixed":
+            return self.astype("fixed").scale_(alpha)
+
+        raw = kernels.combine(kernels.as_scalar(alpha, self.__dtype), [self.__raw_vec])[0]
+        return Vector(self.__rows, raw, self.__dtype)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> Vector:
+        return self * -1
+
+    def __iadd__(self, other: Vector) -> Vector:
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return self.add_(other)
+
+    def __isub__(self, other: Vector) -> Vector:
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return self.axpy(-1, other)
 
-        for i in range(self_shape[0]):
-            for k in range(rhs.shape[1]):
-                tmp = res.get(i, k)
-                tmp += self.get(i) * rhs.get(0, k)
-                res.set(i, k, tmp)
+    def __imul__(self, alpha) -> Vector:
+        if not isinstance(alpha, (int, float, Decimal)):
+            return NotImplemented
 
-        return res
\ No newline at end of file
+        return self.scale_(alpha)
@@ -0,0 +1,108 @@
+import asyncio
+import pickle
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import matpak
+from matpak import aio
+from matpak.errors import MatrixFileInvalid, MultiplicationDimensionMismatched
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestAsyncIO(unittest.IsolatedAsyncioTestCase):
+    async def test_aimp_mat_file(self):
+        mat = await matpak.aimp_mat_file("tests/test_mat_03.txt")
+        vec = await matpak.aimp_vec_file("tests/test_vec_03.txt", dtype="float64")
+
+        self.assertListEqual(mat.raw, matpak.imp_mat_file("tests/test_mat_03.txt").raw)
+        self.assertListEqual(vec.tolist(), [1.0, 2.0, 3.0, 4.0, 5.0])
+
+    async def test_aimp_mat_files(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            mats = await matpak.aimp_mat_files(["tests/test_mat_03.txt"] * 5, limit=2, executor=executor)
+
+        self.assertEqual(len(mats), 5)
+        self.assertTupleEqual(mats[4].shape, (6, 3))
+
+        with self.assertRaises(MatrixFileInvalid):
+            await matpak.aimp_mat_files(["tests/test_mat_03.txt", "tests/test_mat_02.txt"])
+
+    async def test_amultiply_cooperative(self):
+        mat_01 = matpak.Matrix(5, 3, [[Decimal(i * 3 + j) for j in range(3)] for i in range(5)])
+        mat_02 = matpak.Matrix(3, 2, [[Decimal(i - j) for j in range(2)] for i in range(3)])
+        vec = matpak.Vector(3, [Decimal(1), Decimal(2), Decimal(3)])
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        res = await mat_01.amultiply(mat_02, block_rows=1)
+        task.cancel()
+
+        self.assertListEqual(res.raw, mat_01.multiply(mat_02).raw)
+        self.assertGreater(ticks, 1)
+
+        self.assertListEqual((await matpak.amultiply(mat_01, vec, block_rows=2)).raw, mat_01.multiply(vec).raw)
+        self.assertListEqual((await matpak.amultiply(mat_01.astype("float64"), vec, block_rows=2)).tolist(),
+                             [float(el) for el in mat_01.multiply(vec).raw])
+
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            await matpak.amultiply(mat_02, mat_02)
+
+    async def test_amultiply_strategies(self):
+        rng = random.Random(0)
+        mat = matpak.Matrix(6, 6, [[rng.uniform(-1, 1) for _ in range(6)] for _ in range(6)], "float64")
+        # rhs with a cached transpose
+        cached = mat.astype("float64")
+        cached.T.raw
+
+        events = []
+        hook = matpak.add_hook(lambda event, fields: events.append(fields["algorithm"]), ["multiply"])
+
+        try:
+            for name in ("pure",) if np is None else ("pure", "numpy"):
+                with matpak.use_backend(name):
+                    for rhs in (mat, mat.T, cached):
+                        events.clear()
+                        with matpak.use_instrumentation():
+                            res = await matpak.amultiply(mat, rhs, block_rows=4)
+                            expected = mat.multiply(rhs)
+
+                        self.assertListEqual(res.tolist(), expected.tolist())
+                        self.assertEqual(events[0], events[1])
+        finally:
+            matpak.remove_hook(hook)
+
+    async def test_amultiply_executor(self):
+        mat = matpak.Matrix(2, 2, [[1.0, 2.0], [3.0, 4.0]], dtype="float64")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            aio.set_executor(executor)
+            try:
+                res = await mat.amultiply(mat)
+            finally:
+                aio.set_executor(None)
+
+        self.assertListEqual(res.tolist(), [[7.0, 10.0], [15.0, 22.0]])
+
+    def test_pickle(self):
+        mat = matpak.Matrix(2, 2, [[1.0, 2.0], [3.0, 4.0]], dtype="float64")
+        vec = matpak.Vector.from_buffer(2, mat.buffer[:2])
+
+        self.assertListEqual(pickle.loads(pickle.dumps(mat)).tolist(), mat.tolist())
+        self.assertListEqual(pickle.loads(pickle.dumps(vec)).tolist(), [1.0, 2.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+from decimal import Decimal
+
+import matpak
+from matpak import backend
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestBackend(unittest.TestCase):
+    def tearDown(self):
+        matpak.set_backend("auto")
+
+    def test_backend_select(self):
+        matpak.set_backend("pure")
+        self.assertEqual(matpak.get_backend(), "pure")
+        self.assertEqual(backend.active_backend(), "pure")
+
+        with matpak.use_backend("auto"):
+            self.assertEqual(backend.active_backend(), "numpy" if np is not None else "pure")
+
+        self.assertEqual(matpak.get_backend(), "pure")
+
+        with self.assertRaises(ValueError):
+            matpak.set_backend("cuda")
+
+    @unittest.skipIf(np is not None, "NumPy is installed")
+    def test_backend_numpy_unavailable(self):
+        with self.assertRaises(ImportError):
+            matpak.set_backend("numpy")
+
+    def test_backend_pure_float64_multiply(self):
+        mat = matpak.Matrix(2, 2, [[1.0, 2.0], [3.0, 4.0]], dtype="float64")
+        vec = matpak.Vector(2, [1.0, -1.0], dtype="float64")
+
+        with matpak.use_backend("pure"):
+            self.assertListEqual(mat.multiply(mat).tolist(), [[7.0, 10.0], [15.0, 22.0]])
+            self.assertListEqual(mat.multiply(vec).tolist(), [-1.0, -1.0])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestNumpyBackend(unittest.TestCase):
+    def setUp(self):
+        matpak.set_backend("numpy")
+
+    def tearDown(self):
+        matpak.set_backend("auto")
+
+    def test_numpy_zero_copy(self):
+        mat = matpak.Matrix(2, 3, [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], dtype="float64")
+        arr = mat.to_numpy()
+        arr[1, 2] = 60.0
+
+        self.assertEqual(mat.get(1, 2), 60.0)
+
+        arr = np.arange(6, dtype=np.float64).reshape(2, 3)
+        mat = matpak.Matrix.from_numpy(arr)
+        mat.set(0, 0, 10.0)
+
+        self.assertEqual(arr[0, 0], 10.0)
+        self.assertTupleEqual(mat.shape, (2, 3))
+
+        vec = matpak.Vector.from_numpy(np.array([1.0, 2.0]))
+        self.assertListEqual(vec.tolist(), [1.0, 2.0])
+
+    def test_numpy_multiply(self):
+        mat_01 = matpak.Matrix(2, 2, [[1.0, 2.0], [3.0, 4.0]], dtype="float64")
+        mat_02 = matpak.Matrix(2, 2, [[Decimal(1), Decimal(2)], [Decimal(3), Decimal(4)]])
+        vec = matpak.Vector(2, [1.0, -1.0], dtype="float64")
+
+        self.assertListEqual(mat_01.multiply(mat_01).tolist(), [[7.0, 10.0], [15.0, 22.0]])
+        self.assertListEqual(mat_01.multiply(vec).tolist(), [-1.0, -1.0])
+        self.assertListEqual(vec.multiply(matpak.Matrix(1, 2, [[2.0, 3.0]], dtype="float64")).tolist(),
+                             [[2.0, 3.0], [-2.0, -3.0]])
+
+        out = matpak.Matrix(2, 2, dtype="float64")
+        self.assertIs(mat_01.multiply(mat_01, out=out), out)
+        self.assertListEqual(out.tolist(), [[7.0, 10.0], [15.0, 22.0]])
+        self.assertListEqual(mat_01.imul_(mat_01).tolist(), [[7.0, 10.0], [15.0, 22.0]])
+
+        # decimal operands stay on pure python kernels
+        self.assertListEqual(mat_02.multiply(mat_02).raw, [[Decimal(7), Decimal(10)], [Decimal(15), Decimal(22)]])
+
+    def test_numpy_imp_files(self):
+        mat = matpak.imp_mat_file("tests/test_mat_03.txt", dtype="float64")
+        vec = matpak.imp_vec_file("tests/test_vec_03.txt", dtype="float64")
+
+        self.assertTupleEqual(mat.shape, (6, 3))
+        self.assertEqual(mat.get(5, 2), 19.0)
+        self.assertListEqual(vec.tolist(), [1.0, 2.0, 3.0, 4.0, 5.0])
+
+        with self.assertRaisesRegex(matpak.errors.MatrixFileInvalid, "'a' in line 1, column 5"):
+            matpak.imp_mat_file("tests/test_mat_02.txt", dtype="float64")
+
+        with self.assertRaisesRegex(matpak.errors.VectorFileInvalid, "'v' in line 4, column 1"):
+            matpak.imp_vec_file("tests/test_vec_02.txt", dtype="float64")
+
+        self.assertListEqual(matpak.imp_mat_file("tests/test_mat_04.txt", dtype="float64").tolist(),
+                             [[-1.5, 2.0, -3.25], [4.0, -0.5, 6.0]])
+        self.assertListEqual(matpak.imp_vec_file("tests/test_vec_04.txt", dtype="float64").tolist(), [-1.5, 2.0, -0.25])
+
+
+if __name__ == "__main__":
+    unittest.main()
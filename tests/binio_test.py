@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+import matpak
+from matpak.errors import MatrixFileInvalid, VectorFileInvalid
+
+
+class TestBinIOFuncs(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.tmp_dir.name, "data.mpak")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_mat_bin_decimal_round_trip(self):
+        mat = matpak.imp_mat_file("tests/test_mat_03.txt")
+        mat.set(0, 0, Decimal("-0.000000000000000000000000000001"))
+
+        matpak.save_mat_bin(mat, self.file)
+        loaded = matpak.load_mat_bin(self.file)
+
+        self.assertEqual(loaded.dtype, "decimal")
+        self.assertListEqual(loaded.raw, mat.raw)
+
+    def test_mat_bin_float64_round_trip(self):
+        mat = matpak.imp_mat_file("tests/test_mat_03.txt", dtype="float64")
+        mat.set(2, 1, 0.1)
+
+        matpak.save_mat_bin(mat, self.file)
+
+        for use_mmap in (True, False):
+            loaded = matpak.load_mat_bin(self.file, use_mmap=use_mmap)
+
+            self.assertEqual(loaded.dtype, "float64")
+            self.assertTupleEqual(loaded.shape, (6, 3))
+            self.assertListEqual(loaded.tolist(), mat.tolist())
+
+    def test_mat_bin_mmap_copy_on_write(self):
+        mat = matpak.Matrix(2, 2, [[1.0, 2.0], [3.0, 4.0]], dtype="float64")
+        matpak.save_mat_bin(mat, self.file)
+
+        loaded = matpak.load_mat_bin(self.file)
+        loaded.set(0, 0, 10.0)
+
+        self.assertEqual(loaded.get(0, 0), 10.0)
+        self.assertEqual(matpak.load_mat_bin(self.file).get(0, 0), 1.0)
+
+    def test_mat_bin_invalid(self):
+        with open(self.file, "wb") as f:
+            f.write(b"1.0,2.0\n3.0,4.0\n" * 4)
+
+        with self.assertRaises(MatrixFileInvalid):
+            matpak.load_mat_bin(self.file)
+
+        matpak.save_vec_bin(matpak.Vector(2), self.file)
+
+        with self.assertRaises(MatrixFileInvalid):
+            matpak.load_mat_bin(self.file)
+
+        for dtype in ("decimal", "fixed"):
+            matpak.save_mat_bin(matpak.Matrix(2, 1, [[Decimal("1.5")], [Decimal("2.5")]], dtype), self.file)
+            with open(self.file, "r+b") as f:
+                f.seek(-2, os.SEEK_END)
+                f.write(b"x5")
+
+            with self.assertRaises(MatrixFileInvalid):
+                matpak.load_mat_bin(self.file)
+
+    def test_vec_bin_round_trip(self):
+        vec = matpak.imp_vec_file("tests/test_vec_03.txt")
+
+        matpak.save_vec_bin(vec, self.file)
+        self.assertListEqual(matpak.load_vec_bin(self.file).raw, vec.raw)
+
+        vec = vec.astype("float64")
+
+        matpak.save_vec_bin(vec, self.file)
+        self.assertListEqual(matpak.load_vec_bin(self.file).tolist(), vec.tolist())
+
+        with self.assertRaises(VectorFileInvalid):
+            matpak.save_mat_bin(matpak.Matrix(1, 1), self.file)
+            matpak.load_vec_bin(self.file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+
+import matpak
+
+
+class TestImportCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.tmp_dir.name, "mat.txt")
+        shutil.copy("tests/test_mat_03.txt", self.file)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_cache_memory_tier(self):
+        cache = matpak.ImportCache()
+
+        mat_01 = cache.imp_mat_file(self.file)
+        mat_01.set(0, 0, Decimal(100))
+        mat_02 = cache.imp_mat_file(self.file)
+
+        self.assertEqual(mat_02.get(0, 0), Decimal("1.0"))
+        self.assertListEqual(mat_02.raw, matpak.imp_mat_file(self.file).raw)
+        self.assertEqual(cache.stats["hits"], 1)
+        self.assertEqual(cache.stats["misses"], 1)
+
+        cache.imp_mat_file(self.file, dtype="float64")
+        cache.imp_vec_file("tests/test_vec_03.txt")
+
+        self.assertEqual(cache.stats["misses"], 3)
+        self.assertEqual(cache.stats["entries"], 3)
+
+    def test_cache_invalidation(self):
+        for cache in (matpak.ImportCache(), matpak.ImportCache(hash_content=True)):
+            shutil.copy("tests/test_mat_03.txt", self.file)
+            cache.imp_mat_file(self.file)
+
+            with open(self.file, "a") as f:
+                f.write("\n20.0,21.0,22.0\n")
+
+            self.assertTupleEqual(cache.imp_mat_file(self.file).shape, (7, 3))
+            self.assertEqual(cache.stats["misses"], 2)
+            self.assertEqual(cache.stats["invalidations"], 1)
+            self.assertEqual(cache.stats["entries"], 1)
+
+    def test_cache_eviction(self):
+        cache = matpak.ImportCache(max_bytes=6 * 3 * 8 + 5 * 8)
+
+        cache.imp_mat_file(self.file, dtype="float64")
+        cache.imp_vec_file("tests/test_vec_03.txt", dtype="float64")
+        self.assertEqual(cache.stats["evictions"], 0)
+
+        cache.imp_vec_file("tests/test_vec_03.txt")
+        self.assertEqual(cache.stats["evictions"], 0)
+        self.assertEqual(cache.stats["entries"], 2)
+
+        cache.imp_mat_file(self.file, dtype="float64")
+        self.assertEqual(cache.stats["misses"], 3)
+
+        cache.clear()
+        self.assertEqual(cache.stats["bytes"], 0)
+
+    def test_cache_disk_tier(self):
+        disk_dir = os.path.join(self.tmp_dir.name, "cache")
+
+        matpak.ImportCache(disk_dir=disk_dir).imp_mat_file(self.file, dtype="float64")
+
+        cache = matpak.ImportCache(disk_dir=disk_dir)
+        mat = cache.imp_mat_file(self.file, dtype="float64")
+
+        self.assertEqual(cache.stats["disk_hits"], 1)
+        self.assertEqual(cache.stats["misses"], 0)
+        self.assertListEqual(mat.tolist(), matpak.imp_mat_file(self.file, dtype="float64").tolist())
+
+        # a corrupt cache file is a miss, which replaces it
+        matpak.ImportCache(disk_dir=disk_dir).imp_mat_file(self.file)
+        for name in os.listdir(disk_dir):
+            with open(os.path.join(disk_dir, name), "r+b") as f:
+                f.seek(-1, os.SEEK_END)
+                f.write(b"x")
+
+        cache = matpak.ImportCache(disk_dir=disk_dir)
+        self.assertListEqual(cache.imp_mat_file(self.file).raw, matpak.imp_mat_file(self.file).raw)
+        self.assertEqual(cache.stats["misses"], 1)
+
+        cache = matpak.ImportCache(disk_dir=disk_dir)
+        cache.imp_mat_file(self.file)
+        self.assertEqual(cache.stats["disk_hits"], 1)
+        self.assertTrue(all(name.endswith(".mpak") for name in os.listdir(disk_dir)))
+
+
+if __name__ == "__main__":
+    unittest.main()
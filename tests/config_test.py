@@ -0,0 +1,84 @@
+import asyncio
+import unittest
+from decimal import Decimal, getcontext, ROUND_DOWN, ROUND_HALF_UP
+
+import matpak
+from matpak import Matrix, Vector
+
+
+class TestConfigFuncs(unittest.TestCase):
+    def tearDown(self):
+        matpak.set_precision()
+
+    def test_set_precision(self):
+        self.assertIs(matpak.get_decimal_context(), getcontext())
+
+        matpak.set_precision(4, ROUND_DOWN)
+        ctx = matpak.get_decimal_context()
+        self.assertEqual(ctx.prec, 4)
+        self.assertEqual(ctx.rounding, ROUND_DOWN)
+
+        # caller's decimal context is left as it is
+        self.assertNotEqual(getcontext().prec, 4)
+
+        matpak.set_precision()
+        self.assertIs(matpak.get_decimal_context(), getcontext())
+
+        with self.assertRaises(ValueError):
+            matpak.set_precision(0)
+
+        with self.assertRaises(ValueError):
+            matpak.set_precision(rounding="ROUND_SOMETIMES")
+
+    def test_use_precision(self):
+        mat = Matrix(1, 1, [[Decimal(1)]])
+        vec = Vector(1, [Decimal(2) / Decimal(3)])
+
+        with matpak.use_precision(3) as ctx:
+            self.assertEqual(ctx.prec, 3)
+            self.assertListEqual(mat.multiply(vec).raw, [Decimal("0.667")])
+
+            with matpak.use_precision(rounding=ROUND_DOWN):
+                self.assertListEqual(mat.multiply(vec).raw, [Decimal("0.666")])
+
+            self.assertListEqual(mat.multiply(vec).raw, [Decimal("0.667")])
+
+        self.assertListEqual(mat.multiply(vec).raw, [+vec.raw[0]])
+
+    def test_precision_of_operations(self):
+        mat = Matrix(1, 2, [[Decimal("1.23456"), Decimal("2")]])
+        vec = Vector(2, [Decimal("1"), Decimal("0.5")])
+
+        matpak.set_precision(3, ROUND_HALF_UP)
+
+        self.assertListEqual(mat.multiply(vec).raw, [Decimal("2.23")])
+        self.assertListEqual(mat.multiply_many([vec])[0].raw, [Decimal("2.23")])
+        self.assertListEqual(mat.lazy().multiply(vec).evaluate().raw, [Decimal("2.23")])
+        self.assertListEqual(asyncio.run(matpak.amultiply(mat, vec)).raw, [Decimal("2.23")])
+        self.assertListEqual(mat.scale_(Decimal(1)).raw, [[Decimal("1.23"), Decimal("2")]])
+
+    def test_importers_precision(self):
+        with matpak.use_precision(2):
+            mat = matpak.imp_mat_file("tests/test_mat_04.txt")
+            vec = matpak.imp_vec_file("tests/test_vec_04.txt")
+
+        self.assertListEqual(mat.raw, [[Decimal("-1.5"), Decimal("2.0"), Decimal("-3.2")],
+                                       [Decimal("4.0"), Decimal("-0.50"), Decimal("6.0")]])
+        self.assertListEqual(vec.raw, matpak.imp_vec_file("tests/test_vec_04.txt").raw)
+
+        # importers are exact when nothing is configured
+        self.assertEqual(matpak.imp_mat_file("tests/test_mat_04.txt").get(0, 2), Decimal("-3.25"))
+
+    def test_cache_keeps_precision(self):
+        cache = matpak.ImportCache()
+
+        exact = cache.imp_mat_file("tests/test_mat_04.txt")
+        with matpak.use_precision(2):
+            rounded = cache.imp_mat_file("tests/test_mat_04.txt")
+
+        self.assertEqual(exact.get(0, 2), Decimal("-3.25"))
+        self.assertEqual(rounded.get(0, 2), Decimal("-3.2"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import os
+import tempfile
+import unittest
+from decimal import (Decimal, ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_EVEN,
+                     ROUND_HALF_UP, ROUND_UP)
+
+import matpak
+from matpak import fixed, Matrix, Vector
+
+
+class TestFixedFuncs(unittest.TestCase):
+    def test_round_div(self):
+        # every rounding mode should match Decimal.quantize()
+        for rounding in (ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_EVEN,
+                         ROUND_HALF_UP, ROUND_UP):
+            for n in range(-260, 261):
+                expected = int((Decimal(n) / 10).quantize(Decimal(1), rounding=rounding))
+                self.assertEqual(fixed.round_div(n, 10, rounding), expected, (n, rounding))
+
+    def test_conversions(self):
+        self.assertEqual(fixed.infer_scale([Decimal("1.25"), 0.1, 3, "-2.5"]), 2)
+        self.assertListEqual(fixed.to_fixed_rows([[Decimal("1.25"), 0.1, 3]], 2), [[125, 10, 300]])
+        self.assertEqual(fixed.to_fixed(Decimal("1.005"), 2), 100)
+        self.assertEqual(fixed.from_fixed(-5, 3), Decimal("-0.005"))
+
+        rows = [[125, -135]]
+        fixed.rescale(rows, 2, 1)
+        self.assertListEqual(rows, [[12, -14]])
+        fixed.rescale(rows, 1, 3)
+        self.assertListEqual(rows, [[1200, -1400]])
+
+        with self.assertRaises(ValueError):
+            fixed.scale_of(Decimal("NaN"))
+
+        with self.assertRaises(ValueError):
+            fixed.to_fixed_rows([[1]], -1)
+
+
+class TestFixedMatrix(unittest.TestCase):
+    def setUp(self):
+        self.lhs = Matrix(2, 2, [[Decimal("1.5"), Decimal("2.25")], [Decimal("-3"), Decimal("0.1")]], "fixed")
+        self.rhs = Matrix(2, 2, [[Decimal("0.3"), Decimal("1")], [Decimal("2"), Decimal("-1.05")]], "fixed")
+
+    def test_init(self):
+        self.assertEqual(self.lhs.dtype, "fixed")
+        self.assertEqual(self.lhs.scale, 2)
+        self.assertListEqual(self.lhs.raw, [[150, 225], [-300, 10]])
+        self.assertEqual(self.lhs.get(1, 0), Decimal("-3.00"))
+
+        mat = Matrix(1, 2, [[Decimal("0.125"), Decimal("1")]], "fixed", scale=2)
+        self.assertListEqual(mat.raw, [[12, 100]])
+
+        mat.set(0, 1, Decimal("0.015"))
+        self.assertListEqual(mat.raw, [[12, 2]])
+
+        self.assertEqual(Matrix(2, 2, dtype="fixed").scale, 0)
+        self.assertIs(Matrix(2, 2).scale, None)
+
+    def test_astype(self):
+        self.assertListEqual(self.lhs.astype("decimal").raw, self.lhs.tolist())
+        self.assertListEqual(self.lhs.astype("float64").tolist(), [[1.5, 2.25], [-3.0, 0.1]])
+        self.assertListEqual(self.lhs.astype("fixed", 1).raw, [[15, 22], [-30, 1]])
+        self.assertListEqual(self.lhs.astype("float64").astype("fixed").raw, self.lhs.raw)
+
+    def test_multiply(self):
+        # products are exact and rounded once to the larger scale of operands
+        expected = [[Decimal("4.95"), Decimal("-0.86")], [Decimal("-0.70"), Decimal("-3.10")]]
+
+        for algorithm in ("auto", "blocked", "naive"):
+            res = self.lhs.multiply(self.rhs, algorithm)
+            self.assertEqual(res.dtype, "fixed")
+            self.assertEqual(res.scale, 2)
+            self.assertListEqual(res.tolist(), expected)
+
+        self.assertListEqual(self.lhs.multiply_strassen(self.rhs).tolist(), expected)
+        self.assertListEqual(self.lhs.multiply_col_major(self.rhs).tolist(), expected)
+        self.assertListEqual(self.lhs.multiply(self.rhs.T.T).tolist(), expected)
+        self.assertListEqual(matpak.parallel_multiply(self.lhs, self.rhs, workers=1).tolist(), expected)
+
+        with matpak.use_precision(rounding=ROUND_UP):
+            self.assertEqual(self.lhs.multiply(self.rhs).get(1, 1), Decimal("-3.11"))
+
+        out = Matrix(2, 2, dtype="fixed")
+        self.assertIs(self.lhs.multiply(self.rhs, out=out), out)
+        self.assertEqual(out.scale, 2)
+        self.assertListEqual(out.tolist(), expected)
+
+        # mixed operands are computed as decimal
+        res = self.lhs.multiply(self.rhs.astype("decimal"))
+        self.assertEqual(res.dtype, "decimal")
+        self.assertEqual(res.get(0, 1), Decimal("-0.8625"))
+
+    def test_multiply_vector(self):
+        vec = Vector(2, [Decimal("1.1"), Decimal("2")], "fixed")
+        expected = [Decimal("6.15"), Decimal("-3.10")]
+
+        self.assertListEqual(self.lhs.multiply(vec).tolist(), expected)
+        self.assertListEqual(self.lhs.multiply_col_major(vec).tolist(), expected)
+        self.assertListEqual([res.tolist() for res in self.lhs.multiply_many([vec, vec])], [expected, expected])
+        self.assertListEqual(vec.multiply(Matrix(1, 1, [[Decimal("0.5")]], "fixed")).tolist(),
+                             [[Decimal("0.6")], [Decimal("1.0")]])
+
+        # chain is rounded only once
+        res = self.lhs.lazy().multiply(self.rhs).multiply(vec).evaluate()
+        self.assertListEqual(res.tolist(), [Decimal("3.72"), Decimal("-6.98")])
+
+    def test_in_place(self):
+        mat = self.lhs.astype("fixed")
+        mat.axpy(Decimal("0.5"), self.rhs)
+        self.assertListEqual(mat.tolist(), [[Decimal("1.65"), Decimal("2.75")], [Decimal("-2.00"), Decimal("-0.42")]])
+
+        mat.scale_(Decimal("0.333"))
+        self.assertEqual(mat.scale, 2)
+        self.assertListEqual(mat.tolist(), [[Decimal("0.55"), Decimal("0.92")], [Decimal("-0.67"), Decimal("-0.14")]])
+
+        mat = self.lhs.astype("fixed")
+        mat.imul_(self.rhs)
+        self.assertListEqual(mat.raw, self.lhs.multiply(self.rhs).raw)
+
+        vec = Vector(2, [Decimal("1.1"), Decimal("2")], "fixed")
+        vec.imul_(self.lhs)
+        self.assertListEqual(vec.tolist(), [Decimal("6.2"), Decimal("-3.1")])
+
+        with self.assertRaises(ValueError):
+            mat.add_(self.rhs.astype("decimal"))
+
+        dec = self.lhs.astype("decimal").add_(self.rhs)
+        self.assertEqual(dec.get(1, 1), Decimal("-0.95"))
+
+    def test_importers(self):
+        mat = matpak.imp_mat_file("tests/test_mat_04.txt", dtype="fixed")
+        vec = matpak.imp_vec_file("tests/test_vec_04.txt", dtype="fixed")
+
+        self.assertEqual(mat.scale, 2)
+        self.assertListEqual(mat.raw, [[-150, 200, -325], [400, -50, 600]])
+        self.assertListEqual(vec.tolist(), matpak.imp_vec_file("tests/test_vec_04.txt").raw)
+
+        dec = matpak.imp_mat_file("tests/test_mat_04.txt")
+        self.assertListEqual(mat.multiply(mat.T).raw, dec.multiply(dec.T).astype("fixed", 2).raw)
+
+    def test_bin_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, "data.mpak")
+
+            matpak.save_mat_bin(self.lhs, file)
+            loaded = matpak.load_mat_bin(file)
+            self.assertEqual(loaded.scale, 2)
+            self.assertListEqual(loaded.raw, self.lhs.raw)
+
+            vec = Vector(2, [Decimal("1.125"), Decimal("-2")], "fixed")
+            matpak.save_vec_bin(vec, file)
+            self.assertListEqual(matpak.load_vec_bin(file).tolist(), vec.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
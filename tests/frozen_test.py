@@ -0,0 +1,198 @@
+import pickle
+import random
+import threading
+import unittest
+from decimal import Decimal
+
+import matpak
+from matpak import FrozenMatrix, Matrix, ProductCache, Vector
+
+
+class TestFrozenMatrix(unittest.TestCase):
+    def setUp(self):
+        self.mat = Matrix(2, 2, [[Decimal(1), Decimal(2)], [Decimal(3), Decimal(4)]])
+
+    def test_freeze(self):
+        for dtype in ("decimal", "float64", "fixed"):
+            mat = self.mat.astype(dtype)
+            frozen = mat.freeze()
+
+            self.assertIsInstance(frozen, FrozenMatrix)
+            self.assertIs(frozen.freeze(), frozen)
+            self.assertEqual(frozen.dtype, dtype)
+            self.assertListEqual(frozen.tolist(), mat.tolist())
+
+            # frozen matrix is a copy
+            mat.set(0, 0, Decimal(5))
+            self.assertEqual(frozen.get(0, 0), 1)
+
+            with self.assertRaises(TypeError):
+                frozen.set(0, 0, Decimal(5))
+            with self.assertRaises(TypeError):
+                frozen.scale_(2)
+            with self.assertRaises(TypeError):
+                frozen.raw[0][0] = 5
+            # cached transpose is read by later products
+            with self.assertRaises(TypeError):
+                frozen.T.raw[0][0] = 5
+            expected = self.mat.astype(dtype)
+            self.assertListEqual(frozen.multiply(frozen).tolist(), expected.multiply(expected).tolist())
+            with self.assertRaises(TypeError):
+                mat.multiply(mat, out=frozen)
+
+            thawed = frozen.thaw()
+            self.assertNotIsInstance(thawed, FrozenMatrix)
+            thawed.set(0, 0, Decimal(5))
+            self.assertEqual(frozen.get(0, 0), 1)
+
+        self.assertListEqual(FrozenMatrix(1, 2, [[1.5, 2]], "float64").tolist(), [[1.5, 2.0]])
+
+        for frozen in (FrozenMatrix.from_rows(self.mat.raw), FrozenMatrix.from_flat(1, 2, [1.5, 2], "float64"),
+                       FrozenMatrix.zeros(2, 2, "fixed"), FrozenMatrix.identity(2)):
+            self.assertIsInstance(frozen, FrozenMatrix)
+            with self.assertRaises(TypeError):
+                frozen.raw[0][0] = 5
+        self.assertEqual(FrozenMatrix.identity(2), self.mat.power(0).freeze())
+        self.assertIsInstance(pickle.loads(pickle.dumps(self.mat.freeze())), FrozenMatrix)
+
+    def test_hash(self):
+        frozen = self.mat.freeze()
+
+        self.assertEqual(frozen, self.mat.freeze())
+        self.assertEqual(hash(frozen), hash(self.mat.freeze()))
+        self.assertNotEqual(frozen, self.mat.astype("float64").freeze())
+        self.assertNotEqual(frozen, Matrix(2, 2, [[Decimal("1.0"), Decimal(2)], [Decimal(3), Decimal(4)]]).freeze())
+        self.assertNotEqual(frozen, self.mat)
+
+        self.assertEqual(len({frozen, self.mat.freeze(), self.mat.T.materialize().freeze()}), 2)
+        self.assertEqual(self.mat.astype("float64").freeze(), self.mat.astype("float64").freeze())
+
+    def test_multiply(self):
+        frozen = self.mat.freeze()
+        expected = self.mat.multiply(self.mat).raw
+
+        res = frozen.multiply(frozen)
+        self.assertIsInstance(res, FrozenMatrix)
+        self.assertListEqual(res.tolist(), expected)
+
+        self.assertNotIsInstance(frozen.multiply(self.mat), FrozenMatrix)
+        self.assertListEqual(frozen.multiply(Vector(2, [Decimal(1), Decimal(1)])).raw, [Decimal(3), Decimal(7)])
+        self.assertListEqual(self.mat.multiply(frozen).raw, expected)
+        self.assertListEqual(frozen.lu().solve(Vector(2, [Decimal(3), Decimal(7)])).raw, [Decimal(1), Decimal(1)])
+
+        with self.assertRaises(TypeError):
+            frozen.lu(overwrite=True)
+
+        # product storage is adopted as it is, so it is allocated once
+        events = []
+        hook = matpak.add_hook(lambda event, fields: events.append(fields["kind"]), ["alloc"])
+        try:
+            for dtype in ("decimal", "float64", "fixed"):
+                mat = self.mat.astype(dtype).freeze()
+                with matpak.use_instrumentation():
+                    res = mat @ mat
+                self.assertIsInstance(res, FrozenMatrix)
+        finally:
+            matpak.remove_hook(hook)
+        self.assertListEqual(events, ["Matrix"] * 3)
+
+    def test_inplace(self):
+        frozen = original = self.mat.freeze()
+
+        for other in (self.mat, frozen):
+            res = frozen
+            res += other
+            self.assertIsInstance(res, FrozenMatrix)
+            self.assertListEqual(res.tolist(), [[2, 4], [6, 8]])
+
+        frozen -= self.mat
+        self.assertIsInstance(frozen, FrozenMatrix)
+        frozen *= 2
+        self.assertIsInstance(frozen, FrozenMatrix)
+        frozen @= self.mat.astype("float64")
+        self.assertIsInstance(frozen, FrozenMatrix)
+        self.assertEqual(frozen.dtype, "float64")
+        with self.assertRaises(TypeError):
+            frozen.raw[0][0] = 5
+
+        res = original
+        res @= Vector(2, [Decimal(1), Decimal(1)])
+        self.assertIsInstance(res, Vector)
+        self.assertEqual(original, self.mat.freeze())
+
+
+class TestProductCache(unittest.TestCase):
+    def setUp(self):
+        self.lhs = Matrix(2, 2, [[Decimal(1), Decimal(2)], [Decimal(3), Decimal(4)]]).freeze()
+        self.rhs = Matrix(2, 2, [[Decimal(2), Decimal(0)], [Decimal(1), Decimal(3)]]).freeze()
+
+    def test_cache(self):
+        self.assertIsNone(matpak.get_product_cache())
+        self.assertIsNot(self.lhs.multiply(self.rhs), self.lhs.multiply(self.rhs))
+
+        with matpak.use_product_cache(ProductCache()) as product_cache:
+            res = self.lhs.multiply(self.rhs)
+            self.assertIs(self.lhs.multiply(self.rhs, "naive"), res)
+            # operands are compared by content
+            self.assertIs(self.lhs.thaw().freeze().multiply(self.rhs), res)
+            self.assertIsNot(self.rhs.multiply(self.lhs), res)
+
+            with matpak.use_precision(1):
+                self.assertIsNot(self.lhs.multiply(self.rhs), res)
+
+            stats = product_cache.stats
+            self.assertEqual(stats["hits"], 2)
+            self.assertEqual(stats["misses"], 3)
+            self.assertEqual(stats["entries"], 3)
+
+        self.assertIsNone(matpak.get_product_cache())
+
+        # float64 kernels could differ in last bits, so they are cached separately
+        rng = random.Random(0)
+        mat = Matrix(6, 6, [[rng.uniform(-1, 1) for _ in range(6)] for _ in range(6)], "float64").freeze()
+        with matpak.use_product_cache(ProductCache()):
+            mat.multiply(mat)
+            self.assertListEqual(mat.multiply(mat, "naive").tolist(), mat.thaw().multiply(mat.thaw(), "naive").tolist())
+            self.assertIs(mat.multiply(mat, "blocked"), mat.multiply(mat, "blocked"))
+
+    def test_eviction(self):
+        product_cache = ProductCache(max_bytes=1)
+        with matpak.use_product_cache(product_cache):
+            self.lhs.multiply(self.rhs)
+            self.lhs.multiply(self.rhs)
+
+        self.assertEqual(product_cache.stats["entries"], 0)
+        self.assertEqual(product_cache.stats["hits"], 0)
+
+        lhs, rhs = self.lhs.astype("float64").freeze(), self.rhs.astype("float64").freeze()
+        product_cache = ProductCache(max_bytes=2 * 32)
+        with matpak.use_product_cache(product_cache):
+            lhs.multiply(rhs)
+            rhs.multiply(lhs)
+            lhs.multiply(lhs)
+
+        self.assertEqual(product_cache.stats["entries"], 2)
+        self.assertEqual(product_cache.stats["evictions"], 1)
+
+        with self.assertRaises(ValueError):
+            ProductCache(-1)
+
+    def test_threads(self):
+        results = []
+
+        def work():
+            results.extend(self.lhs.multiply(self.rhs) for _ in range(100))
+
+        with matpak.use_product_cache(ProductCache()):
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(results), 400)
+        self.assertEqual(len(set(results)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
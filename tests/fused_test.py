@@ -0,0 +1,84 @@
+import unittest
+from decimal import Decimal
+
+import matpak
+from matpak import Matrix, Vector
+from matpak.errors import MatrixDimensionInvalid, MultiplicationDimensionMismatched, VectorDimensionInvalid
+
+
+class TestFusedFuncs(unittest.TestCase):
+    def setUp(self):
+        self.a = Matrix(2, 3, [[Decimal(1), Decimal(2), Decimal(3)], [Decimal(4), Decimal(5), Decimal(6)]])
+        self.b = Matrix(3, 2, [[Decimal(1), Decimal(0)], [Decimal(0), Decimal(1)], [Decimal(1), Decimal(1)]])
+        self.c = Matrix(2, 2, [[Decimal(1), Decimal(1)], [Decimal(1), Decimal(1)]])
+        self.x = Vector(3, [Decimal(1), Decimal(1), Decimal(1)])
+        self.y = Vector(2, [Decimal(1), Decimal(-1)])
+
+    def test_gemm(self):
+        expected = (Decimal(2) * self.a.multiply(self.b) + Decimal("0.5") * self.c).raw
+        rows = self.c.raw
+
+        self.assertIs(matpak.gemm(2, self.a, self.b, Decimal("0.5"), self.c), self.c)
+        self.assertIs(self.c.raw, rows)
+        self.assertListEqual(self.c.raw, expected)
+
+        # transposed views and cached transposes are read as they are
+        self.assertListEqual(matpak.gemm(1, self.a, self.b.T.T, 0, self.c).raw, self.a.multiply(self.b).raw)
+        self.assertListEqual(matpak.gemm(1, self.b.T, self.a.T, 0, self.c).raw, self.b.T.multiply(self.a.T).raw)
+        self.b.T.raw
+        expected = (self.c + self.a.multiply(self.b)).raw
+        self.assertListEqual(matpak.gemm(1, self.a, self.b, 1, self.c).raw, expected)
+
+        for dtype in ("float64", "fixed"):
+            c = Matrix(2, 2, [[Decimal(1)] * 2] * 2, dtype)
+            matpak.gemm(2, self.a.astype(dtype), self.b.astype(dtype), -1, c)
+            self.assertListEqual([[float(el) for el in row] for row in c.tolist()], [[7.0, 9.0], [19.0, 21.0]])
+
+        # fixed result is rounded once: 2 * 0.0049 = 0.0098 and 0.0049 + 0.5 * 0.01 = 0.0099
+        a = Matrix(1, 1, [[Decimal("0.07")]], "fixed")
+        c = Matrix(1, 1, [[Decimal("0.01")]], "fixed")
+        self.assertListEqual(matpak.gemm(2, a, a, 0, c).tolist(), [[Decimal("0.01")]])
+        c.set(0, 0, Decimal("0.01"))
+        self.assertListEqual(matpak.gemm(1, a, a.T, Decimal("0.5"), c).tolist(), [[Decimal("0.01")]])
+        self.assertEqual(c.scale, 2)
+
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            matpak.gemm(1, self.a, self.a, 1, self.c)
+
+        with self.assertRaises(MatrixDimensionInvalid):
+            matpak.gemm(1, self.a, self.b, 1, Matrix(3, 3))
+
+        with self.assertRaises(ValueError):
+            matpak.gemm(1, self.c, self.c, 1, self.c)
+
+        with self.assertRaises(ValueError):
+            matpak.gemm(1, self.a.astype("float64"), self.b, 1, self.c)
+
+    def test_gemv(self):
+        self.assertIs(matpak.gemv(Decimal("0.5"), self.a, self.x, 2, self.y), self.y)
+        self.assertListEqual(self.y.raw, [Decimal(5), Decimal("5.5")])
+
+        vec = Vector(2, [Decimal(1), Decimal(2)])
+        matpak.gemv(1, self.c, vec, -1, vec)
+        self.assertListEqual(vec.raw, [Decimal(2), Decimal(1)])
+
+        for dtype in ("float64", "fixed"):
+            y = Vector(2, [Decimal(1), Decimal(-1)], dtype)
+            matpak.gemv(1, self.a.astype(dtype), self.x.astype(dtype), 0, y)
+            self.assertListEqual([float(el) for el in y.tolist()], [6.0, 15.0])
+
+        a = Matrix(1, 1, [[Decimal("0.07")]], "fixed")
+        y = Vector(1, [Decimal("0.01")], "fixed")
+        # 0.5 * 0.0105 = 0.00525 is rounded once
+        self.assertListEqual(matpak.gemv(Decimal("0.5"), a, Vector(1, [Decimal("0.15")], "fixed"), 0, y).tolist(),
+                             [Decimal("0.01")])
+
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            matpak.gemv(1, self.a, self.y, 1, self.y)
+
+        with self.assertRaises(VectorDimensionInvalid):
+            matpak.gemv(1, self.a, self.x, 1, self.x)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import os
+import sys
+import tempfile
+import unittest
+from array import array
+from decimal import Decimal
+
+import matpak
+from matpak import Matrix, Vector
+
+
+class TestInstrumentFuncs(unittest.TestCase):
+    def setUp(self):
+        matpak.reset_stats()
+        self.events = []
+        self.hook = matpak.add_hook(lambda event, fields: self.events.append((event, fields)))
+
+        self.mat = Matrix(2, 3, [[Decimal(1), Decimal(2), Decimal(3)], [Decimal(4), Decimal(5), Decimal(6)]])
+
+    def tearDown(self):
+        matpak.remove_hook(self.hook)
+        matpak.reset_stats()
+
+    def test_disabled(self):
+        self.assertFalse(matpak.get_instrumentation())
+
+        self.mat.multiply(self.mat.T)
+        matpak.imp_mat_file("tests/test_mat_04.txt")
+
+        stats = matpak.stats()
+        self.assertFalse(stats["enabled"])
+        self.assertEqual(stats["multiply"]["count"], 0)
+        self.assertEqual(stats["import"]["count"], 0)
+        self.assertEqual(stats["alloc"]["count"], 0)
+        self.assertListEqual(self.events, [])
+
+    def test_multiply(self):
+        with matpak.use_instrumentation():
+            self.mat.multiply(self.mat.T)
+            self.mat.T.multiply(self.mat, algorithm="naive")
+            self.mat.multiply(Vector(3), out=Vector(2))
+
+        stats = matpak.stats()["multiply"]
+        self.assertEqual(stats["count"], 3)
+        self.assertEqual(stats["flops"], 2 * 2 * 3 * 2 + 2 * 3 * 2 * 3 + 2 * 2 * 3)
+        self.assertDictEqual(stats["algorithms"], {"dot_rows": 1, "naive": 1, "vec": 1})
+        self.assertGreater(stats["elapsed"], 0)
+
+        event, fields = next(e for e in self.events if e[0] == "multiply")
+        self.assertEqual(fields["op"], "Matrix.multiply")
+        self.assertTupleEqual(fields["lhs_shape"], (2, 3))
+        self.assertTupleEqual(fields["rhs_shape"], (3, 2))
+        self.assertEqual(fields["dtype"], "decimal")
+
+    def test_import(self):
+        with matpak.use_instrumentation():
+            mat = matpak.imp_mat_file(file="tests/test_mat_04.txt")
+
+        stats = matpak.stats()
+        self.assertEqual(stats["import"]["count"], 1)
+        self.assertEqual(stats["import"]["rows"], mat.shape[0])
+        self.assertEqual(stats["import"]["bytes"], os.path.getsize("tests/test_mat_04.txt"))
+        self.assertEqual(stats["alloc"]["count"], 1)
+        self.assertEqual(stats["alloc"]["elements"], mat.shape[0] * mat.shape[1])
+
+    def test_alloc(self):
+        pool = matpak.BufferPool()
+        out = pool.acquire(2, 2)
+        pool.release(out)
+
+        with matpak.use_instrumentation():
+            self.mat.multiply(self.mat.T)
+            self.mat.multiply(self.mat.T, out=pool.acquire(2, 2))
+
+        self.assertListEqual([(e, f["kind"], f["shape"]) for e, f in self.events if e == "alloc"],
+                             [("alloc", "Matrix", (2, 2))])
+
+    def test_alloc_results(self):
+        fixed = self.mat.astype("fixed", 1)
+        square = Matrix(2, 2, [[Decimal(1), Decimal(2)], [Decimal(3), Decimal(4)]], "float64")
+
+        with matpak.use_instrumentation():
+            fixed + fixed
+            fixed.astype("fixed", 3)
+            square.multiply(square)
+
+        allocs = [f["dtype"] for e, f in self.events if e == "alloc"]
+        self.assertListEqual(allocs, ["fixed", "fixed", "float64"])
+
+    def test_alloc_bin(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            mat_file, vec_file = os.path.join(tmp_dir, "mat.mpak"), os.path.join(tmp_dir, "vec.mpak")
+            matpak.save_mat_bin(self.mat.astype("float64"), mat_file)
+            matpak.save_vec_bin(Vector(2, [1.0, 2.0], "float64"), vec_file)
+
+            with matpak.use_instrumentation():
+                matpak.load_mat_bin(mat_file)
+                matpak.load_mat_bin(mat_file, use_mmap=False)
+                matpak.load_vec_bin(vec_file)
+                matpak.load_vec_bin(vec_file, use_mmap=False)
+
+            allocs = [f["shape"] for e, f in self.events if e == "alloc"]
+            self.assertListEqual(allocs, [(2, 3), (2, 1)])
+
+            # a payload of non-native byte order is read into memory even if mmap is used
+            with open(mat_file, "r+b") as f:
+                data = array('d', f.read()[32:])
+                data.byteswap()
+                f.seek(7)
+                f.write(b'>' if sys.byteorder == "little" else b'<')
+                f.seek(32)
+                f.write(data.tobytes())
+
+            self.events.clear()
+            with matpak.use_instrumentation():
+                mat = matpak.load_mat_bin(mat_file)
+
+            self.assertListEqual(mat.tolist(), self.mat.tolist())
+            self.assertListEqual([f["shape"] for e, f in self.events if e == "alloc"], [(2, 3)])
+
+    def test_hooks(self):
+        events = []
+        hook = matpak.add_hook(lambda event, fields: events.append(event), ["import"])
+
+        with self.assertRaises(ValueError):
+            matpak.add_hook(hook, ["export"])
+
+        with matpak.use_instrumentation():
+            matpak.imp_vec_file("tests/test_vec_04.txt")
+            matpak.remove_hook(hook)
+            matpak.imp_vec_file("tests/test_vec_04.txt")
+
+        self.assertListEqual(events, ["import"])
+        self.assertEqual(matpak.stats()["import"]["count"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,19 @@
+import os
+import tempfile
 import unittest
 from decimal import Decimal
 
 import matpak
 from matpak import Matrix, Vector
-from matpak.errors import MatrixFileInvalid, VectorFileInvalid
+from matpak.errors import MatrixFileInvalid, VectorFileInvalid, MatrixDimensionInvalid
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# float64 files are parsed by numpy on numpy backend, which should accept the same files as pure parser
+FLOAT64_BACKENDS = ("pure",) if np is None else ("pure", "numpy")
 
 
 class TestMatIOFuncs(unittest.TestCase):
@@ -30,6 +40,85 @@ class TestMatIOFuncs(unittest.TestCase):
             [Decimal("17.0"), Decimal("18.0"), Decimal("19.0")],
         ])
 
+    def test_imp_mat_parse_file_float64(self):
+        with matpak.use_backend("pure"):
+            mat: Matrix = matpak.imp_mat_file("tests/test_mat_03.txt", dtype="float64")
+
+        self.assertEqual(mat.dtype, "float64")
+        self.assertListEqual(mat.tolist()[0], [1.0, 2.0, 3.0])
+        self.assertListEqual(mat.tolist()[5], [17.0, 18.0, 19.0])
+
+    def test_iter_mat_rows(self):
+        rows = list(matpak.iter_mat_rows("tests/test_mat_03.txt"))
+        blocks = list(matpak.iter_mat_rows("tests/test_mat_03.txt", chunk_rows=4))
+
+        self.assertEqual(len(rows), 6)
+        self.assertListEqual(rows[0], [Decimal("1.0"), Decimal("2.0"), Decimal("3.0")])
+        self.assertListEqual([len(b) for b in blocks], [4, 2])
+        self.assertListEqual(blocks[0] + blocks[1], rows)
+
+        with self.assertRaises(MatrixFileInvalid):
+            list(matpak.iter_mat_rows("tests/test_mat_02.txt"))
+
+        with self.assertRaises(MatrixFileInvalid):
+            list(matpak.iter_mat_rows("tests/test_mat_01.txt", chunk_rows=2))
+
+    def test_imp_mat_parse_file_negative(self):
+        mat: Matrix = matpak.imp_mat_file("tests/test_mat_04.txt")
+        self.assertListEqual(mat.raw, [
+            [Decimal("-1.5"), Decimal("2.0"), Decimal("-3.25")],
+            [Decimal("4.0"), Decimal("-0.5"), Decimal("6.0")],
+        ])
+
+        with matpak.use_backend("pure"):
+            mat = matpak.imp_mat_file("tests/test_mat_04.txt", dtype="float64")
+        self.assertListEqual(mat.tolist(), [[-1.5, 2.0, -3.25], [4.0, -0.5, 6.0]])
+
+    def test_imp_mat_file_reports_line_and_col(self):
+        with self.assertRaisesRegex(MatrixFileInvalid, "'a' in line 1, column 5"):
+            matpak.imp_mat_file("tests/test_mat_02.txt")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, "bad.txt")
+            with open(file, "w") as f:
+                f.write("1,2,3\n\n4,5-1,6\n")
+
+            for dtype in ("decimal", "float64"):
+                with self.assertRaisesRegex(MatrixFileInvalid, "'5-1' in line 3, column 3"):
+                    matpak.imp_mat_file(file, dtype=dtype)
+
+            with open(file, "w") as f:
+                f.write("1,2,3\n4,,6\n")
+
+            with self.assertRaisesRegex(MatrixFileInvalid, "'' in line 2, column 3"):
+                matpak.imp_mat_file(file)
+
+    def test_imp_mat_file_same_grammar_on_backends(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, "bad.txt")
+            with open(file, "w") as f:
+                f.write(" 1,2\n3, 4\n")
+
+            for name in FLOAT64_BACKENDS:
+                with matpak.use_backend(name), self.assertRaisesRegex(MatrixFileInvalid, "line 2"):
+                    matpak.imp_mat_file(file, dtype="float64")
+
+            with open(file, "w") as f:
+                f.write(" 1,2 \n3,4\n")
+
+            for name in FLOAT64_BACKENDS:
+                with matpak.use_backend(name):
+                    self.assertListEqual(matpak.imp_mat_file(file, dtype="float64").tolist(), [[1.0, 2.0], [3.0, 4.0]])
+
+    def test_iter_mat_rows_ragged(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, "ragged.txt")
+            with open(file, "w") as f:
+                f.write("1,2,3\n4,5\n")
+
+            with self.assertRaises(MatrixFileInvalid):
+                matpak.imp_mat_file(file)
+
 
 class TestVecIOFuncs(unittest.TestCase):
     def test_imp_vec_file_fail_on_not_existed_file(self):
@@ -48,6 +137,128 @@ class TestVecIOFuncs(unittest.TestCase):
         vec: Vector = matpak.imp_vec_file("tests/test_vec_03.txt")
         self.assertListEqual(vec.raw, [Decimal("1.0"), Decimal("2.0"), Decimal("3.0"), Decimal("4.0"), Decimal("5.0")])
 
+    def test_imp_vec_parse_file_negative(self):
+        vec: Vector = matpak.imp_vec_file("tests/test_vec_04.txt")
+        self.assertListEqual(vec.raw, [Decimal("-1.5"), Decimal("2.0"), Decimal("-.25")])
+
+        with matpak.use_backend("pure"):
+            vec = matpak.imp_vec_file("tests/test_vec_04.txt", dtype="float64")
+        self.assertListEqual(vec.tolist(), [-1.5, 2.0, -0.25])
+
+    def test_imp_vec_file_reports_line_and_col(self):
+        with self.assertRaisesRegex(VectorFileInvalid, "'v' in line 4, column 1"):
+            matpak.imp_vec_file("tests/test_vec_02.txt")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, "bad.txt")
+            with open(file, "w") as f:
+                f.write("1.0\n  2.0.1\n")
+
+            with self.assertRaisesRegex(VectorFileInvalid, "'2.0.1' in line 2, column 3"):
+                matpak.imp_vec_file(file)
+
+    def test_imp_vec_parse_file_float64(self):
+        with matpak.use_backend("pure"):
+            vec: Vector = matpak.imp_vec_file("tests/test_vec_03.txt", dtype="float64")
+
+        self.assertEqual(vec.dtype, "float64")
+        self.assertListEqual(vec.tolist(), [1.0, 2.0, 3.0, 4.0, 5.0])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, "bad.txt")
+            with open(file, "w") as f:
+                f.write(" 1\n2 3\n")
+
+            for name in FLOAT64_BACKENDS:
+                with matpak.use_backend(name), self.assertRaisesRegex(VectorFileInvalid, "line 2"):
+                    matpak.imp_vec_file(file, dtype="float64")
+
+
+class TestExpFuncs(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.tmp_dir.name, "data.txt")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_exp_mat_file_round_trip(self):
+        mat = matpak.imp_mat_file("tests/test_mat_04.txt")
+        mat.set(0, 0, Decimal("1E-30"))
+        mat.set(1, 2, Decimal("2.5E+3"))
+
+        matpak.exp_mat_file(mat, self.file, sep=';')
+        self.assertListEqual(matpak.imp_mat_file(self.file, sep=';').raw, mat.raw)
+
+        with open(self.file) as f:
+            self.assertEqual(f.readline(), "0.000000000000000000000000000001;2.0;-3.25\n")
+
+        matpak.exp_mat_file(mat.T, self.file)
+        self.assertListEqual(matpak.imp_mat_file(self.file).raw, mat.T.tolist())
+
+    def test_exp_mat_file_dtypes(self):
+        mat = Matrix(2, 2, [[1e-7, -2.5], [1e22, 0.1]], "float64")
+        matpak.exp_mat_file(mat, self.file)
+        self.assertListEqual(matpak.imp_mat_file(self.file, dtype="float64").tolist(), mat.tolist())
+
+        mat = matpak.imp_mat_file("tests/test_mat_04.txt", dtype="fixed")
+        matpak.exp_mat_file(mat, self.file)
+        self.assertListEqual(matpak.imp_mat_file(self.file, dtype="fixed").raw, mat.raw)
+
+        with self.assertRaises(ValueError):
+            matpak.exp_mat_file(Matrix(1, 1, [[float("inf")]], "float64"), self.file)
+
+    def test_exp_vec_file_round_trip(self):
+        vec = matpak.imp_vec_file("tests/test_vec_04.txt")
+        matpak.exp_vec_file(vec, self.file)
+        self.assertListEqual(matpak.imp_vec_file(self.file).raw, vec.raw)
+
+        vec = Vector(3, [-0.5, 1e-9, 3.0], "float64")
+        matpak.exp_vec_file(vec, self.file)
+        self.assertListEqual(matpak.imp_vec_file(self.file, dtype="float64").tolist(), vec.tolist())
+
+    def test_writer_is_atomic(self):
+        matpak.exp_vec_file(Vector(1, [Decimal(7)]), self.file)
+
+        with self.assertRaises(RuntimeError):
+            with matpak.MatrixWriter(self.file) as writer:
+                writer.write_rows([[Decimal(1), Decimal(2)]])
+                raise RuntimeError
+
+        with self.assertRaises(MatrixDimensionInvalid):
+            with matpak.MatrixWriter(self.file) as writer:
+                writer.write_rows([[Decimal(1), Decimal(2)], [Decimal(3)]])
+
+        # file is untouched and no temp files are left
+        self.assertListEqual(matpak.imp_vec_file(self.file).raw, [Decimal(7)])
+        self.assertListEqual(os.listdir(self.tmp_dir.name), ["data.txt"])
+
+        with matpak.MatrixWriter(self.file, cols=2) as writer:
+            self.assertEqual(writer.write_rows([[1, 2], [3, 4]]), 2)
+            writer.write_rows([(Decimal("0.5"), 6.25)])
+            self.assertEqual(writer.rows, 3)
+
+        self.assertTrue(writer.closed)
+        self.assertListEqual(matpak.imp_mat_file(self.file).tolist()[2], [Decimal("0.5"), Decimal("6.25")])
+
+        # replaced file gets the default mode of new files, as if it was created by open()
+        ref = os.path.join(self.tmp_dir.name, "ref.txt")
+        open(ref, "w").close()
+        self.assertEqual(os.stat(self.file).st_mode & 0o777, os.stat(ref).st_mode & 0o777)
+
+    def test_exp_mat_product_file(self):
+        mat = matpak.imp_mat_file("tests/test_mat_03.txt")
+
+        matpak.exp_mat_product_file(mat, mat.T, self.file, block_rows=4)
+        self.assertListEqual(matpak.imp_mat_file(self.file).raw, mat.multiply(mat.T).raw)
+
+        blocks = list(mat.iter_multiply_rows(mat.T.materialize(), block_rows=4))
+        self.assertListEqual([len(block) for block in blocks], [4, 2])
+
+        fixed = mat.astype("fixed")
+        matpak.exp_mat_product_file(fixed, fixed.T, self.file)
+        self.assertListEqual(matpak.imp_mat_file(self.file, dtype="fixed").raw, fixed.multiply(fixed.T).raw)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from decimal import Decimal
+
+import matpak
+from matpak.errors import MultiplicationDimensionMismatched
+
+
+def dec_mat(rows: int, cols: int, seed: int) -> matpak.Matrix:
+    return matpak.Matrix(rows, cols, [[Decimal((i * cols + j + seed) % 7 - 3) for j in range(cols)] for i in range(rows)])
+
+
+class TestLazyProduct(unittest.TestCase):
+    def test_lazy_shape_and_plan(self):
+        a, b, c = dec_mat(10, 30, 1), dec_mat(30, 5, 2), dec_mat(5, 60, 3)
+        chain = a.lazy().multiply(b).multiply(c)
+
+        self.assertTupleEqual(chain.shape, (10, 60))
+        self.assertEqual(chain.plan(), "((A0 A1) A2)")
+        self.assertEqual(chain.flops, 10 * 30 * 5 + 10 * 5 * 60)
+
+        vec = matpak.Vector(60, [Decimal(i % 3) for i in range(60)])
+        chain = chain.multiply(vec)
+
+        self.assertTupleEqual(chain.shape, (10, 1))
+        self.assertEqual(chain.plan(), "(A0 (A1 (A2 A3)))")
+
+    def test_lazy_evaluate(self):
+        a, b, c = dec_mat(4, 6, 1), dec_mat(6, 3, 2), dec_mat(3, 5, 3)
+        vec = matpak.Vector(5, [Decimal(i) for i in range(5)])
+
+        self.assertListEqual(a.lazy().multiply(b).multiply(c).evaluate().raw, a.multiply(b).multiply(c).raw)
+        self.assertListEqual(a.lazy().multiply(b.lazy().multiply(c)).multiply(vec).evaluate().raw,
+                             a.multiply(b).multiply(c).multiply(vec).raw)
+        self.assertListEqual(a.lazy().evaluate().raw, a.raw)
+        self.assertIsNot(a.lazy().evaluate().raw, a.raw)
+
+    def test_lazy_evaluate_vector_lhs(self):
+        vec = matpak.Vector(3, [Decimal(1), Decimal(2), Decimal(3)])
+        row = matpak.Matrix(1, 2, [[Decimal(2), Decimal(-1)]], dtype="float64")
+
+        res = vec.lazy().multiply(row).evaluate()
+
+        self.assertIsInstance(res, matpak.Matrix)
+        self.assertListEqual(res.tolist(), [[2.0, -1.0], [4.0, -2.0], [6.0, -3.0]])
+
+    def test_lazy_dim_mismatch(self):
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            dec_mat(2, 3, 0).lazy().multiply(dec_mat(2, 3, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import unittest
+from decimal import Decimal
+
+import matpak
+from matpak import Matrix, Vector
+from matpak.errors import MatrixDimensionInvalid, MatrixNotPositiveDefinite, MatrixSingular, VectorDimensionInvalid
+
+
+def _dec_rows(rows: list) -> list:
+    return [[Decimal(el) for el in row] for row in rows]
+
+
+class TestLUFactorization(unittest.TestCase):
+    def setUp(self):
+        self.rows = [[2, 1, 1], [4, -6, 0], [-2, 7, 2]]
+        self.mat = Matrix(3, 3, _dec_rows(self.rows))
+        self.vec = Vector(3, [Decimal(5), Decimal(-2), Decimal(9)])
+
+    def test_solve(self):
+        lu = self.mat.lu()
+        self.assertEqual(lu.dtype, "decimal")
+        self.assertListEqual(lu.perm, [1, 0, 2])
+        self.assertListEqual(lu.solve(self.vec).raw, [Decimal(1), Decimal(1), Decimal(2)])
+        self.assertListEqual(self.mat.solve(self.vec).raw, [Decimal(1), Decimal(1), Decimal(2)])
+
+        e = Vector(3, [Decimal(1), Decimal(0), Decimal(0)])
+        self.assertListEqual([x.raw for x in lu.solve_many([self.vec, self.mat.multiply(e)])],
+                             [[Decimal(1), Decimal(1), Decimal(2)], e.raw])
+
+        # matrix is not changed unless it is overwritten
+        self.assertListEqual(self.mat.raw, _dec_rows(self.rows))
+
+        with self.assertRaises(VectorDimensionInvalid):
+            lu.solve(Vector(2))
+
+    def test_det_inverse(self):
+        self.assertEqual(self.mat.det(), Decimal(-16))
+        self.assertEqual(Matrix(2, 2, _dec_rows([[1, 2], [2, 4]])).det(), Decimal(0))
+
+        inv = self.mat.inverse()
+        self.assertListEqual(self.mat.multiply(inv).raw, _dec_rows([[1, 0, 0], [0, 1, 0], [0, 0, 1]]))
+
+    def test_float64(self):
+        mat = self.mat.astype("float64")
+        expected = [1.0, 1.0, 2.0]
+
+        for name in ("pure", "numpy") if matpak.backend.np is not None else ("pure",):
+            with matpak.use_backend(name):
+                lu = mat.lu()
+                self.assertEqual(lu.dtype, "float64")
+                for el, expected_el in zip(lu.solve(self.vec).tolist(), expected):
+                    self.assertAlmostEqual(el, expected_el)
+
+                self.assertAlmostEqual(lu.det(), -16.0)
+                for row, expected_row in zip(mat.multiply(lu.inverse()).tolist(), [[1, 0, 0], [0, 1, 0], [0, 0, 1]]):
+                    for el, expected_el in zip(row, expected_row):
+                        self.assertAlmostEqual(el, expected_el)
+
+    def test_overwrite(self):
+        for dtype, name in (("decimal", "pure"), ("float64", "pure"), ("float64", "auto")):
+            with matpak.use_backend(name):
+                mat = self.mat.astype(dtype)
+                buf = mat.buffer
+                lu = mat.lu(overwrite=True)
+
+                # rows of permuted matrix are stored as L below diagonal and U on and above it
+                self.assertListEqual([[float(el) for el in row] for row in mat.tolist()],
+                                     [[4.0, -6.0, 0.0], [0.5, 4.0, 1.0], [-0.5, 1.0, 1.0]])
+                self.assertListEqual([float(el) for el in lu.solve(self.vec).tolist()], [1.0, 1.0, 2.0])
+
+                # float64 factors are written to the matrix buffer itself
+                if buf is not None:
+                    self.assertListEqual(buf.tolist(), [el for row in mat.tolist() for el in row])
+
+        with self.assertRaises(ValueError):
+            self.mat.astype("fixed").lu(overwrite=True)
+
+        # a failed factorization still drops the cached transpose of the partly rewritten matrix
+        for dtype in ("decimal", "float64"):
+            mat = Matrix(3, 3, _dec_rows([[1, 2, 3], [2, 4, 6], [1, 0, 1]]), dtype)
+            self.assertListEqual(list(mat.T.raw[0]), [1, 2, 1])
+
+            with self.assertRaises(MatrixSingular):
+                mat.lu(overwrite=True)
+            self.assertListEqual(list(mat.T.raw[0]), [row[0] for row in mat.tolist()])
+
+    def test_fixed(self):
+        lu = self.mat.astype("fixed").lu()
+        self.assertEqual(lu.dtype, "decimal")
+        self.assertListEqual(lu.solve(self.vec.astype("fixed")).raw, [Decimal(1), Decimal(1), Decimal(2)])
+
+    def test_precision(self):
+        mat = Matrix(2, 2, _dec_rows([[3, 0], [0, 1]]))
+
+        with matpak.use_precision(4):
+            self.assertListEqual(mat.solve(Vector(2, [Decimal(1), Decimal(1)])).raw, [Decimal("0.3333"), Decimal(1)])
+
+    def test_invalid(self):
+        with self.assertRaises(MatrixDimensionInvalid):
+            Matrix(2, 3).lu()
+
+        with self.assertRaises(MatrixSingular):
+            Matrix(2, 2, _dec_rows([[1, 2], [2, 4]])).lu()
+
+
+class TestCholeskyFactorization(unittest.TestCase):
+    def setUp(self):
+        self.mat = Matrix(3, 3, _dec_rows([[4, 12, -16], [12, 37, -43], [-16, -43, 98]]))
+        self.vec = Vector(3, [Decimal(0), Decimal(6), Decimal(39)])
+
+    def test_solve(self):
+        chol = self.mat.cholesky()
+        self.assertListEqual(chol.solve(self.vec).raw, [Decimal(1), Decimal(1), Decimal(1)])
+        self.assertEqual(chol.det(), Decimal(36))
+
+        # square roots are rounded to matpak precision
+        self.assertListEqual([[round(el, 20) for el in row] for row in self.mat.multiply(chol.inverse()).raw],
+                             _dec_rows([[1, 0, 0], [0, 1, 0], [0, 0, 1]]))
+
+    def test_float64(self):
+        mat = self.mat.astype("float64")
+
+        for name in ("pure", "numpy") if matpak.backend.np is not None else ("pure",):
+            with matpak.use_backend(name):
+                chol = mat.cholesky()
+                for el in chol.solve(self.vec).tolist():
+                    self.assertAlmostEqual(el, 1.0)
+                self.assertAlmostEqual(chol.det(), 36.0)
+
+    def test_overwrite(self):
+        for dtype, name in (("decimal", "pure"), ("float64", "pure"), ("float64", "auto")):
+            with matpak.use_backend(name):
+                mat = self.mat.astype(dtype)
+                chol = mat.cholesky(overwrite=True)
+
+                # L is stored in lower triangle and upper triangle is kept
+                self.assertListEqual([[float(el) for el in row] for row in mat.tolist()],
+                                     [[2.0, 12.0, -16.0], [6.0, 1.0, -43.0], [-8.0, 5.0, 3.0]])
+                for el in chol.solve(self.vec).tolist():
+                    self.assertAlmostEqual(float(el), 1.0)
+
+    def test_invalid(self):
+        with self.assertRaises(MatrixNotPositiveDefinite):
+            Matrix(2, 2, _dec_rows([[1, 2], [2, 1]])).cholesky()
+
+        with self.assertRaises(MatrixDimensionInvalid):
+            Matrix(3, 2).cholesky()
+
+
+if __name__ == '__main__':
+    unittest.main()
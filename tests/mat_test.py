@@ -1,8 +1,9 @@
 import unittest
+from array import array
 from decimal import Decimal
 
 import matpak
-from matpak.errors import MatrixDimensionInvalid
+from matpak.errors import MatrixDimensionInvalid, MultiplicationDimensionMismatched
 
 
 class TestMatrix(unittest.TestCase):
@@ -104,6 +105,299 @@ class TestMatrix(unittest.TestCase):
         self.assertEqual(vec_02.raw, [Decimal(68.0), Decimal(167.0), Decimal(266.0)])
         self.assertEqual(vec_03.raw, [Decimal(68.0), Decimal(167.0), Decimal(266.0)])
 
+    def test_mat_multiply_algorithms(self):
+        mat_01 = matpak.Matrix(5, 7, [[Decimal(i * 7 + j) / Decimal(3) for j in range(7)] for i in range(5)])
+        mat_02 = matpak.Matrix(7, 4, [[Decimal(j - i * 4) / Decimal(7) for j in range(4)] for i in range(7)])
+
+        expected = mat_01.multiply(mat_02, algorithm="naive").raw
+
+        self.assertListEqual(mat_01.multiply(mat_02).raw, expected)
+        self.assertListEqual(mat_01.multiply(mat_02, algorithm="dot").raw, expected)
+        self.assertListEqual(mat_01.multiply(mat_02, algorithm="blocked", block_size=2).raw, expected)
+        self.assertListEqual(mat_01.multiply(mat_02, algorithm="blocked", block_size=3).raw, expected)
+        self.assertListEqual(mat_01.multiply_col_major(mat_02).raw, expected)
+
+        with self.assertRaises(ValueError):
+            mat_01.multiply(mat_02, algorithm="unknown")
+
+    def test_mat_multiply_non_square_vector(self):
+        mat = matpak.Matrix(2, 3, [
+            [Decimal(1.0), Decimal(2.0), Decimal(3.0)],
+            [Decimal(4.0), Decimal(5.0), Decimal(6.0)],
+        ])
+        vec = matpak.Vector(3, [Decimal(1.0), Decimal(0.0), Decimal(-1.0)])
+
+        self.assertListEqual(mat.multiply(vec).raw, [Decimal(-2.0), Decimal(-2.0)])
+        self.assertListEqual(mat.multiply_col_major(vec).raw, [Decimal(-2.0), Decimal(-2.0)])
+
+    def test_mat_multiply_strassen(self):
+        mat_01 = matpak.Matrix(9, 11, [[Decimal(i * 11 - j) / Decimal(8) for j in range(11)] for i in range(9)])
+        mat_02 = matpak.Matrix(11, 6, [[Decimal(j * 3 - i) / Decimal(4) for j in range(6)] for i in range(11)])
+
+        expected = mat_01.multiply(mat_02).raw
+
+        self.assertListEqual(mat_01.multiply_strassen(mat_02, crossover=2).raw, expected)
+        self.assertListEqual(mat_01.multiply_strassen(mat_02, crossover=3, exact=False).raw, expected)
+        self.assertListEqual(mat_01.multiply_strassen(mat_02, crossover=64).raw, expected)
+
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            mat_02.multiply_strassen(mat_02)
+
+    def test_mat_float64(self):
+        mat_01 = matpak.Matrix(2, 3, [
+            [Decimal(1.0), Decimal(2.0), Decimal(3.0)],
+            [Decimal(4.0), Decimal(5.0), Decimal(6.0)],
+        ], dtype="float64")
+        mat_02 = matpak.Matrix(3, 2, [[1.5, 0.0], [0.0, 1.0], [2.0, -1.0]], dtype="float64")
+
+        self.assertEqual(mat_01.dtype, "float64")
+        self.assertTupleEqual(mat_01.shape, (2, 3))
+        self.assertEqual(mat_01.buffer.nbytes, 2 * 3 * 8)
+
+        mat_01.set(1, 2, Decimal(7.5))
+        self.assertEqual(mat_01.get(1, 2), 7.5)
+        self.assertListEqual(mat_01.tolist(), [[1.0, 2.0, 3.0], [4.0, 5.0, 7.5]])
+
+        expected = [[7.5, -1.0], [21.0, -2.5]]
+        self.assertListEqual(mat_01.multiply(mat_02).tolist(), expected)
+        self.assertListEqual(mat_01.multiply(mat_02, algorithm="blocked", block_size=2).tolist(), expected)
+        self.assertListEqual(mat_01.multiply(mat_02, algorithm="naive").tolist(), expected)
+        self.assertListEqual(mat_01.multiply_col_major(mat_02).tolist(), expected)
+        self.assertListEqual(mat_01.multiply_strassen(mat_02, crossover=1).tolist(), expected)
+
+        vec = matpak.Vector(3, [1.0, 0.0, 2.0], dtype="float64")
+        self.assertListEqual(mat_01.multiply(vec).tolist(), [7.0, 19.0])
+
+        with self.assertRaises(ValueError):
+            matpak.Matrix(2, 2, dtype="float32")
+
+    def test_mat_mixed_dtype_multiply(self):
+        mat_01 = matpak.Matrix(2, 2, [[Decimal("0.5"), Decimal(2)], [Decimal(1), Decimal(-1)]])
+        mat_02 = matpak.Matrix(2, 2, [[2.0, 0.0], [0.0, 4.0]], dtype="float64")
+
+        res = mat_01.multiply(mat_02)
+
+        self.assertEqual(res.dtype, "float64")
+        self.assertListEqual(res.tolist(), [[1.0, 8.0], [2.0, -4.0]])
+        self.assertListEqual(res.astype("decimal").raw, [[Decimal(1), Decimal(8)], [Decimal(2), Decimal(-4)]])
+
+    def test_mat_from_buffer(self):
+        buf = array('d', [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        mat = matpak.Matrix.from_buffer(2, 3, buf)
+        mat.set(0, 0, 10.0)
+
+        self.assertEqual(buf[0], 10.0)
+        self.assertListEqual(mat.tolist(), [[10.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+        with self.assertRaises(MatrixDimensionInvalid):
+            matpak.Matrix.from_buffer(4, 2, buf)
+
+    def test_mat_multiply_many(self):
+        mat = matpak.Matrix(2, 3, [
+            [Decimal(1.0), Decimal(2.0), Decimal(3.0)],
+            [Decimal(4.0), Decimal(5.0), Decimal(6.0)],
+        ])
+        vectors = [matpak.Vector(3, [Decimal(i), Decimal(1), Decimal(-i)]) for i in range(5)]
+
+        expected = [mat.multiply(vec).raw for vec in vectors]
+
+        self.assertListEqual([res.raw for res in mat.multiply_many(vectors)], expected)
+        self.assertListEqual([res.raw for res in mat.iter_multiply_many(iter(vectors), chunk_size=2)], expected)
+        self.assertListEqual(mat.multiply_many(vec.astype("float64") for vec in vectors)[4].tolist(), [-6.0, -3.0])
+
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            mat.multiply_many([matpak.Vector(2)])
+
+    def test_mat_multiply_out(self):
+        mat_01 = matpak.Matrix(3, 2, [[Decimal(i * 2 + j) for j in range(2)] for i in range(3)])
+        mat_02 = matpak.Matrix(2, 2, [[Decimal(1), Decimal(-1)], [Decimal(2), Decimal(3)]])
+        expected = mat_01.multiply(mat_02).raw
+
+        out = matpak.Matrix(3, 2)
+        for algorithm in ("auto", "blocked", "naive"):
+            res = mat_01.multiply(mat_02, algorithm=algorithm, out=out)
+            self.assertIs(res, out)
+            self.assertListEqual(out.raw, expected)
+
+        vec_out = matpak.Vector(3)
+        self.assertIs(mat_01.multiply(matpak.Vector(2, [Decimal(1), Decimal(1)]), out=vec_out), vec_out)
+        self.assertListEqual(vec_out.raw, [Decimal(1), Decimal(5), Decimal(9)])
+
+        with self.assertRaises(MatrixDimensionInvalid):
+            mat_01.multiply(mat_02, out=matpak.Matrix(2, 2))
+
+        with self.assertRaises(ValueError):
+            mat_01.multiply(mat_02, out=matpak.Matrix(3, 2, dtype="float64"))
+
+        with self.assertRaises(ValueError):
+            mat_02.multiply(mat_02, out=mat_02)
+
+        with self.assertRaises(ValueError):
+            mat_02.multiply(mat_02.T, out=mat_02)
+
+        with matpak.use_backend("pure"):
+            lhs = mat_01.astype("float64")
+            out = matpak.Matrix(3, 2, dtype="float64")
+            lhs.multiply(mat_02.astype("float64"), out=out)
+            self.assertListEqual(out.tolist(), [[float(el) for el in row] for row in expected])
+
+    def test_mat_inplace(self):
+        mat = matpak.Matrix(2, 2, [[Decimal(1), Decimal(2)], [Decimal(3), Decimal(4)]])
+        rows = mat.raw
+        expected = mat.multiply(mat).raw
+
+        self.assertIs(mat.imul_(mat), mat)
+        self.assertIs(mat.raw, rows)
+        self.assertListEqual(mat.raw, expected)
+
+        mat.add_(matpak.Matrix(2, 2, [[Decimal(1)] * 2] * 2))
+        self.assertListEqual(mat.raw, [[Decimal(8), Decimal(11)], [Decimal(16), Decimal(23)]])
+
+        mat.axpy(Decimal(-2), matpak.Matrix(2, 2, [[Decimal(1), Decimal(0)], [Decimal(0), Decimal(1)]]))
+        mat.scale_(0.5)
+        self.assertListEqual(mat.raw, [[Decimal(3), Decimal("5.5")], [Decimal(8), Decimal("10.5")]])
+
+        # in-place changes drop cached transpose
+        mat.T.raw
+        mat.scale_(2)
+        self.assertListEqual(mat.T.raw, [[Decimal(6), Decimal(16)], [Decimal(11), Decimal(21)]])
+
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            mat.imul_(matpak.Matrix(2, 3))
+
+        with self.assertRaises(MatrixDimensionInvalid):
+            mat.add_(matpak.Matrix(3, 2))
+
+        with self.assertRaises(ValueError):
+            mat.add_(matpak.Matrix(2, 2, dtype="float64"))
+
+        with matpak.use_backend("pure"):
+            mat = matpak.Matrix(2, 2, [[1.0, 2.0], [3.0, 4.0]], dtype="float64")
+            mat.imul_(mat.T).axpy(1, matpak.Matrix(2, 2, [[Decimal(1)] * 2] * 2)).scale_(2)
+            self.assertListEqual(mat.tolist(), [[12.0, 24.0], [24.0, 52.0]])
+
+    def test_mat_power(self):
+        mat = matpak.Matrix(2, 2, [[Decimal(1), Decimal(1)], [Decimal(1), Decimal(0)]])
+        vec = matpak.Vector(2, [Decimal(1), Decimal(0)])
+
+        # powers of fibonacci matrix hold fibonacci numbers
+        self.assertListEqual(mat.power(0).raw, [[Decimal(1), Decimal(0)], [Decimal(0), Decimal(1)]])
+        self.assertListEqual(mat.power(1).raw, mat.raw)
+        self.assertListEqual(mat.power(10).raw, [[Decimal(89), Decimal(55)], [Decimal(55), Decimal(34)]])
+
+        expected = mat
+        for k in range(2, 12):
+            expected = expected.multiply(mat)
+            self.assertListEqual(mat.power(k).raw, expected.raw)
+            self.assertListEqual(mat.power_apply(k, vec).raw, expected.multiply(vec).raw)
+
+        # large powers are taken by squaring
+        self.assertListEqual(mat.power_apply(90, vec).raw, [Decimal(4660046610375530309), Decimal(2880067194370816120)])
+        self.assertListEqual(mat.power_apply(0, vec).raw, vec.raw)
+
+        for dtype in ("float64", "fixed"):
+            self.assertListEqual(mat.astype(dtype).power(10).tolist(), [[89, 55], [55, 34]])
+            self.assertListEqual(mat.astype(dtype).power_apply(10, vec).tolist(), [89, 55])
+
+        with self.assertRaises(MatrixDimensionInvalid):
+            matpak.Matrix(2, 3).power(2)
+
+        with self.assertRaises(ValueError):
+            mat.power(-1)
+
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            mat.power_apply(2, matpak.Vector(3))
+
+    def test_mat_factories(self):
+        rows = [[Decimal(1), Decimal("2.5")], [Decimal(3), Decimal(4)]]
+
+        mat = matpak.Matrix.from_rows(rows)
+        self.assertTupleEqual(mat.shape, (2, 2))
+        self.assertIs(mat.raw, rows)
+        self.assertListEqual(matpak.Matrix.from_rows(rows, "float64", validate=False).tolist(),
+                             [[1.0, 2.5], [3.0, 4.0]])
+        self.assertListEqual(matpak.Matrix.from_rows(rows, "fixed").raw, [[10, 25], [30, 40]])
+
+        flat = (el for row in rows for el in row)
+        self.assertListEqual(matpak.Matrix.from_flat(2, 2, flat).raw, rows)
+        self.assertListEqual(matpak.Matrix.from_flat(1, 4, [1, 2, 3, 4], "float64").tolist(), [[1.0, 2.0, 3.0, 4.0]])
+        self.assertEqual(matpak.Matrix.from_flat(2, 2, [Decimal("0.25")] * 4, "fixed").scale, 2)
+
+        self.assertListEqual(matpak.Matrix.zeros(2, 3).raw, matpak.Matrix(2, 3).raw)
+        self.assertListEqual(matpak.Matrix.zeros(2, 2, "float64").tolist(), [[0.0, 0.0], [0.0, 0.0]])
+        self.assertListEqual(matpak.Matrix.identity(2).raw, [[Decimal(1), Decimal(0)], [Decimal(0), Decimal(1)]])
+        self.assertListEqual(matpak.Matrix.identity(2, "fixed", 2).raw, [[100, 0], [0, 100]])
+        self.assertListEqual(matpak.Matrix.identity(3, "float64").tolist(), [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+        # matrices keep no per-instance dict
+        with self.assertRaises(AttributeError):
+            mat.extra = 1
+
+        with self.assertRaises(MatrixDimensionInvalid):
+            matpak.Matrix.from_rows([[Decimal(1)], [Decimal(1), Decimal(2)]])
+        with self.assertRaises(MatrixDimensionInvalid):
+            matpak.Matrix.from_rows([])
+        with self.assertRaises(MatrixDimensionInvalid):
+            matpak.Matrix.from_flat(2, 2, [Decimal(1)] * 3)
+        with self.assertRaises(MatrixDimensionInvalid):
+            matpak.Matrix.zeros(0, 2)
+        with self.assertRaises(ValueError):
+            matpak.Matrix.identity(2, "int")
+
+    def test_mat_multiply_small(self):
+        # products with 2 to 4 terms per element take unrolled kernels, which sum in the same order
+        for n in (2, 3, 4, 5):
+            lhs = matpak.Matrix.from_flat(n, n, [Decimal(i) / 7 for i in range(n * n)])
+            rhs = matpak.Matrix.from_flat(n, n, [Decimal("5E+2")] * (n * n))
+            for a, b in ((lhs, rhs), (lhs.astype("fixed", 3), rhs.astype("fixed"))):
+                self.assertListEqual([[str(el) for el in row] for row in a.multiply(b).tolist()],
+                                     [[str(el) for el in row] for row in a.multiply(b, algorithm="naive").tolist()])
+
+    def test_mat_operators(self):
+        mat = matpak.Matrix(2, 2, [[Decimal(1), Decimal(2)], [Decimal(3), Decimal(4)]])
+        other = matpak.Matrix(2, 2, [[Decimal("0.5"), Decimal(0)], [Decimal(-1), Decimal(1)]])
+        vec = matpak.Vector(2, [Decimal(1), Decimal(1)])
+
+        self.assertListEqual((mat @ other).raw, mat.multiply(other).raw)
+        self.assertListEqual((mat @ vec).raw, [Decimal(3), Decimal(7)])
+        self.assertListEqual((mat.T @ vec).raw, [Decimal(4), Decimal(6)])
+        self.assertListEqual((mat + other).raw, [[Decimal("1.5"), Decimal(2)], [Decimal(2), Decimal(5)]])
+        self.assertListEqual((mat - other).raw, [[Decimal("0.5"), Decimal(2)], [Decimal(4), Decimal(3)]])
+        self.assertListEqual((mat - mat.T).raw, [[Decimal(0), Decimal(-1)], [Decimal(1), Decimal(0)]])
+        self.assertListEqual((mat.T - mat).raw, [[Decimal(0), Decimal(1)], [Decimal(-1), Decimal(0)]])
+        self.assertListEqual((Decimal("0.5") * mat).raw, [[Decimal("0.5"), Decimal(1)], [Decimal("1.5"), Decimal(2)]])
+        self.assertListEqual((-mat.T).raw, [[Decimal(-1), Decimal(-3)], [Decimal(-2), Decimal(-4)]])
+        self.assertListEqual((mat @ vec + vec).raw, [Decimal(4), Decimal(8)])
+
+        # mixed dtypes are computed in their common dtype
+        self.assertListEqual((mat.astype("float64") + other).tolist(), [[1.5, 2.0], [2.0, 5.0]])
+        res = mat.astype("fixed") - other.astype("fixed")
+        self.assertEqual(res.scale, 1)
+        self.assertListEqual(res.raw, [[5, 20], [40, 30]])
+        self.assertListEqual((mat.astype("fixed") * Decimal("0.25")).tolist(),
+                             [[Decimal("0"), Decimal("0")], [Decimal("1"), Decimal("1")]])
+
+        rows = mat.raw
+        mat += other
+        mat -= other
+        mat *= 2
+        mat @= other
+        self.assertIs(mat.raw, rows)
+        self.assertListEqual(mat.raw, [[Decimal(-3), Decimal(4)], [Decimal(-5), Decimal(8)]])
+
+        frozen = other.freeze()
+        frozen += other
+        self.assertIsInstance(frozen, matpak.FrozenMatrix)
+
+        with self.assertRaises(MatrixDimensionInvalid):
+            mat + matpak.Matrix(2, 3)
+
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            mat @ matpak.Matrix(3, 2)
+
+        with self.assertRaises(TypeError):
+            mat * mat
+
 
 if __name__ == "__main__":
     unittest.main()
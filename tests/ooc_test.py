@@ -0,0 +1,105 @@
+import os
+import random
+import tempfile
+import unittest
+from decimal import Decimal
+
+import matpak
+from matpak import DiskMatrix, Matrix
+from matpak.errors import MatrixFileInvalid, MultiplicationDimensionMismatched
+
+
+def _random_matrix(rows: int, cols: int) -> Matrix:
+    rnd = random.Random(rows * 31 + cols)
+    return Matrix(rows, cols, [[rnd.uniform(-10, 10) for _ in range(cols)] for _ in range(rows)], "float64")
+
+
+class TestDiskMatrix(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.tmp_dir.name, "mat.mpak")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_tiles(self):
+        mat = _random_matrix(5, 7)
+        matpak.save_mat_bin(mat, self.file)
+
+        with DiskMatrix(self.file) as disk:
+            self.assertTupleEqual(disk.shape, (5, 7))
+            self.assertEqual(disk.dtype, "float64")
+            self.assertListEqual(disk.load().tolist(), mat.tolist())
+            self.assertListEqual(disk.read_tile(1, 2, 3, 4).tolist(), [row[2:6] for row in mat.tolist()[1:4]])
+            self.assertListEqual(disk.read_tile(3, 0, 2, 7).tolist(), mat.tolist()[3:])
+
+            with self.assertRaises(ValueError):
+                disk.read_tile(4, 0, 2, 7)
+
+        with DiskMatrix.create(self.file, 3, 3) as disk:
+            disk.write_tile(1, 1, Matrix(2, 2, [[1.0, 2.0], [3.0, 4.0]], "float64"))
+            self.assertListEqual(disk.load().tolist(), [[0.0, 0.0, 0.0], [0.0, 1.0, 2.0], [0.0, 3.0, 4.0]])
+
+    def test_from_text(self):
+        with DiskMatrix.from_text("tests/test_mat_04.txt", self.file) as disk:
+            self.assertListEqual(disk.load().tolist(),
+                                 matpak.imp_mat_file("tests/test_mat_04.txt", dtype="float64").tolist())
+
+    def test_invalid_file(self):
+        matpak.save_mat_bin(Matrix(1, 1, [[Decimal(1)]]), self.file)
+        with self.assertRaises(MatrixFileInvalid):
+            DiskMatrix(self.file)
+
+        with self.assertRaises(MatrixFileInvalid):
+            DiskMatrix("tests/test_mat_04.txt")
+
+
+class TestOocMultiply(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.lhs, self.rhs = _random_matrix(11, 9), _random_matrix(9, 13)
+        self.lhs_file, self.rhs_file, self.out_file = (os.path.join(self.tmp_dir.name, name)
+                                                       for name in ("lhs.mpak", "rhs.mpak", "out.mpak"))
+
+        matpak.save_mat_bin(self.lhs, self.lhs_file)
+        matpak.save_mat_bin(self.rhs, self.rhs_file)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_multiply(self):
+        with matpak.use_backend("pure"):
+            expected = self.lhs.multiply(self.rhs, "blocked").tolist()
+
+            # pure tiles are accumulated in order, so result is exact
+            for tile in (1, 4, 9, 20):
+                for prefetch in (True, False):
+                    with matpak.ooc_multiply(self.lhs_file, self.rhs_file, self.out_file, tile=tile,
+                                             prefetch=prefetch) as res:
+                        self.assertTupleEqual(res.shape, (11, 13))
+                        self.assertListEqual(res.load().tolist(), expected)
+
+            with DiskMatrix(self.lhs_file) as lhs, DiskMatrix(self.rhs_file) as rhs:
+                with matpak.ooc_multiply(lhs, rhs, self.out_file, memory_budget=5 * 32 * 16) as res:
+                    self.assertListEqual(res.load().tolist(), expected)
+
+        with matpak.ooc_multiply(self.lhs_file, self.rhs_file, self.out_file, tile=4) as res:
+            for row, expected_row in zip(res.load().tolist(), expected):
+                for el, expected_el in zip(row, expected_row):
+                    self.assertAlmostEqual(el, expected_el)
+
+        # no temp files are left behind
+        self.assertListEqual(sorted(os.listdir(self.tmp_dir.name)), ["lhs.mpak", "out.mpak", "rhs.mpak"])
+
+    def test_invalid_multiply(self):
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            matpak.ooc_multiply(self.lhs_file, self.lhs_file, self.out_file)
+
+        with self.assertRaises(ValueError):
+            matpak.ooc_multiply(self.lhs_file, self.rhs_file, self.out_file, memory_budget=16)
+
+        self.assertFalse(os.path.exists(self.out_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from decimal import Decimal, localcontext
+
+import matpak
+from matpak.errors import MultiplicationDimensionMismatched
+
+
+class TestParallelMultiply(unittest.TestCase):
+    def test_parallel_multiply_decimal(self):
+        mat_01 = matpak.Matrix(7, 5, [[Decimal(i * 5 + j) / Decimal(3) for j in range(5)] for i in range(7)])
+        mat_02 = matpak.Matrix(5, 4, [[Decimal(j - i) / Decimal(7) for j in range(4)] for i in range(5)])
+
+        self.assertListEqual(matpak.parallel_multiply(mat_01, mat_02, workers=2, block_rows=3).raw,
+                             mat_01.multiply(mat_02).raw)
+
+        with localcontext(prec=6):
+            self.assertListEqual(matpak.parallel_multiply(mat_01, mat_02, workers=2).raw,
+                                 mat_01.multiply(mat_02).raw)
+
+    def test_parallel_multiply_float64(self):
+        mat_01 = matpak.Matrix(6, 3, [[(i + 1) / (j + 3) for j in range(3)] for i in range(6)], dtype="float64")
+        mat_02 = matpak.Matrix(3, 5, [[(i - j) / 7 for j in range(5)] for i in range(3)], dtype="float64")
+
+        res = matpak.parallel_multiply(mat_01, mat_02, workers=3, block_rows=1)
+
+        self.assertEqual(res.dtype, "float64")
+        with matpak.use_backend("pure"):
+            self.assertListEqual(res.tolist(), mat_01.multiply(mat_02).tolist())
+
+    def test_parallel_multiply_dim_mismatch(self):
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            matpak.parallel_multiply(matpak.Matrix(2, 3), matpak.Matrix(2, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
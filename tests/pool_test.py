@@ -0,0 +1,53 @@
+import unittest
+from decimal import Decimal
+
+from matpak import BufferPool, Matrix, Vector
+
+
+class TestBufferPool(unittest.TestCase):
+    def test_acquire_release(self):
+        pool = BufferPool(max_per_shape=1)
+
+        mat = pool.acquire(2, 3)
+        vec = pool.acquire(3, dtype="float64")
+
+        self.assertIsInstance(mat, Matrix)
+        self.assertTupleEqual(mat.shape, (2, 3))
+        self.assertIsInstance(vec, Vector)
+        self.assertEqual(vec.dtype, "float64")
+
+        pool.release(mat)
+        pool.release(vec)
+
+        with self.assertRaises(ValueError):
+            pool.release(mat)
+
+        self.assertIs(pool.acquire(2, 3), mat)
+        self.assertIsNot(pool.acquire(2, 3), mat)
+        self.assertIsNot(pool.acquire(3, 2), mat)
+        self.assertDictEqual(pool.stats, {"hits": 1, "misses": 4, "pooled": 1})
+
+        pool.clear()
+        self.assertEqual(pool.stats["pooled"], 0)
+
+    def test_temporary_as_out(self):
+        pool = BufferPool()
+        mat = Matrix(2, 2, [[Decimal(1), Decimal(2)], [Decimal(3), Decimal(4)]])
+
+        with pool.temporary(2, 2) as tmp:
+            mat.multiply(mat, out=tmp)
+            self.assertListEqual(tmp.raw, [[Decimal(7), Decimal(10)], [Decimal(15), Decimal(22)]])
+
+        with pool.temporary(2, 2, zero=True) as tmp_02:
+            self.assertIs(tmp_02, tmp)
+            self.assertListEqual(tmp_02.raw, [[Decimal(0), Decimal(0)], [Decimal(0), Decimal(0)]])
+
+        with pool.temporary(2, dtype="float64") as vec:
+            vec.set(0, 1.0)
+
+        with pool.temporary(2, dtype="float64", zero=True) as vec:
+            self.assertListEqual(vec.tolist(), [0.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
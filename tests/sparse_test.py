@@ -0,0 +1,94 @@
+import unittest
+from decimal import Decimal
+
+import matpak
+from matpak.errors import MatrixDimensionInvalid, MultiplicationDimensionMismatched
+
+
+class TestSparseMatrix(unittest.TestCase):
+    def setUp(self):
+        self.dense = matpak.Matrix(3, 4, [
+            [Decimal(0), Decimal(2), Decimal(0), Decimal(0)],
+            [Decimal(0), Decimal(0), Decimal(0), Decimal(0)],
+            [Decimal(1), Decimal(0), Decimal(0), Decimal(-3)],
+        ])
+
+    def test_sparse_invalid_dim(self):
+        with self.assertRaises(MatrixDimensionInvalid):
+            matpak.SparseMatrix(0, 3)
+
+        with self.assertRaises(ValueError):
+            matpak.SparseMatrix(2, 2, [(2, 0, Decimal(1))])
+
+    def test_sparse_coo_construction(self):
+        mat = matpak.SparseMatrix(3, 4, [
+            (2, 3, Decimal(-3)), (0, 1, Decimal(1)), (2, 0, Decimal(1)), (0, 1, Decimal(1)), (1, 1, Decimal(0)),
+        ])
+
+        self.assertTupleEqual(mat.shape, (3, 4))
+        self.assertEqual(mat.nnz, 3)
+        self.assertListEqual(list(mat.coo()), [(0, 1, Decimal(2)), (2, 0, Decimal(1)), (2, 3, Decimal(-3))])
+        self.assertTupleEqual(mat.csr, ([0, 1, 1, 3], [1, 0, 3], [Decimal(2), Decimal(1), Decimal(-3)]))
+        self.assertListEqual(mat.to_dense().raw, self.dense.raw)
+
+    def test_sparse_dense_conversion(self):
+        mat = matpak.SparseMatrix.from_dense(self.dense)
+
+        self.assertEqual(mat.nnz, 3)
+        self.assertListEqual(mat.to_dense().raw, self.dense.raw)
+        self.assertListEqual(mat.to_dense("float64").tolist(), [[0.0, 2.0, 0.0, 0.0], [0.0] * 4, [1.0, 0.0, 0.0, -3.0]])
+
+        # float64 elements are stored as Decimal, so products with decimal operands are computed as decimal
+        mat = matpak.SparseMatrix.from_dense(matpak.Matrix(1, 2, [[0.1, 0.0]], "float64"))
+        self.assertListEqual(list(mat.coo()), [(0, 0, Decimal("0.1"))])
+        self.assertListEqual(mat.multiply(matpak.Vector(2, [Decimal(3), Decimal(1)])).raw, [Decimal("0.3")])
+        self.assertListEqual(mat.multiply(matpak.Matrix(2, 1, [[Decimal(3)], [Decimal(1)]])).raw, [[Decimal("0.3")]])
+
+    def test_sparse_set_get(self):
+        mat = matpak.SparseMatrix(3, 3)
+
+        mat.set(1, 2, Decimal(5))
+        mat.set(1, 0, Decimal(4))
+        mat.set(0, 0, Decimal(1))
+        mat.set(1, 2, Decimal(6))
+        mat.set(0, 0, Decimal(0))
+
+        self.assertEqual(mat.nnz, 2)
+        self.assertEqual(mat.get(1, 2), Decimal(6))
+        self.assertEqual(mat.get(1, 0), Decimal(4))
+        self.assertEqual(mat.get(0, 0), Decimal(0))
+        self.assertListEqual(mat.csr[0], [0, 0, 2, 2])
+
+        with self.assertRaises(ValueError):
+            mat.get(3, 0)
+
+    def test_sparse_multiply(self):
+        lhs = matpak.SparseMatrix.from_dense(self.dense)
+        rhs = matpak.Matrix(4, 2, [[Decimal(i * 2 + j) for j in range(2)] for i in range(4)])
+        vec = matpak.Vector(4, [Decimal(1), Decimal(2), Decimal(3), Decimal(4)])
+
+        expected = self.dense.multiply(rhs).raw
+
+        self.assertListEqual(lhs.multiply(rhs).raw, expected)
+        self.assertListEqual(lhs.multiply(matpak.SparseMatrix.from_dense(rhs)).to_dense().raw, expected)
+        self.assertListEqual(lhs.multiply(vec).raw, self.dense.multiply(vec).raw)
+        self.assertListEqual(lhs.multiply(rhs.astype("float64")).tolist(), [[float(el) for el in row] for row in expected])
+
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            lhs.multiply(lhs)
+
+    def test_imp_sparse_mat_file(self):
+        mat = matpak.imp_sparse_mat_file("tests/test_sparse_mat_01.txt")
+
+        self.assertTupleEqual(mat.shape, (3, 4))
+        self.assertListEqual(list(mat.coo()), [(0, 1, Decimal("3.0")), (1, 0, Decimal(4)), (2, 3, Decimal("-1.0"))])
+
+        with self.assertRaises(matpak.errors.MatrixFileInvalid):
+            matpak.imp_sparse_mat_file("tests/test_sparse_mat_02.txt")
+
+        with self.assertRaises(matpak.errors.MatrixFileInvalid):
+            matpak.imp_sparse_mat_file("tests/test_mat_01.txt")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from decimal import Decimal
+
+import matpak
+from matpak import Matrix, TransposedMatrix
+from matpak.errors import MultiplicationDimensionMismatched
+
+
+class TestTransposedMatrix(unittest.TestCase):
+    def setUp(self):
+        self.mat_01 = Matrix(3, 4, [[Decimal(i * 4 + j) / Decimal(8) for j in range(4)] for i in range(3)])
+        self.mat_02 = Matrix(5, 4, [[Decimal(j - i * 2) / Decimal(4) for j in range(4)] for i in range(5)])
+
+    def test_view(self):
+        t = self.mat_01.T
+
+        self.assertIsInstance(t, TransposedMatrix)
+        self.assertTupleEqual(t.shape, (4, 3))
+        self.assertIs(t.T, self.mat_01)
+        self.assertEqual(t.get(3, 1), self.mat_01.get(1, 3))
+        self.assertListEqual(t.raw, [list(col) for col in zip(*self.mat_01.raw)])
+        self.assertListEqual(t.tolist(), t.raw)
+
+        t.set(3, 1, Decimal(100))
+        self.assertEqual(self.mat_01.get(1, 3), Decimal(100))
+
+        copy = t.materialize()
+        copy.set(0, 0, Decimal(-1))
+        self.assertNotEqual(self.mat_01.get(0, 0), Decimal(-1))
+
+    def test_cached_transpose_invalidation(self):
+        t = self.mat_01.T
+        rows = t.raw
+
+        self.assertIs(self.mat_01.T.raw, rows)
+
+        self.mat_01.set(0, 2, Decimal(7))
+        self.assertIsNot(t.raw, rows)
+        self.assertEqual(t.raw[2][0], Decimal(7))
+
+    def test_plan_multiply(self):
+        vec = matpak.Vector(4, [Decimal(1)] * 4)
+
+        self.assertEqual(self.mat_01.plan_multiply(self.mat_02.T), "dot_rows")
+        self.assertEqual(self.mat_01.plan_multiply(vec), "vec")
+        self.assertEqual(self.mat_01.plan_multiply(self.mat_02.T, "blocked"), "blocked")
+
+        square = Matrix(4, 4, [[Decimal(i + j) for j in range(4)] for i in range(4)])
+        self.assertEqual(self.mat_01.plan_multiply(square), "dot")
+
+        square.T.raw
+        self.assertEqual(self.mat_01.plan_multiply(square), "dot_cached")
+
+        square.set(0, 0, Decimal(1))
+        self.assertEqual(self.mat_01.plan_multiply(square), "dot")
+
+        with self.assertRaises(ValueError):
+            self.mat_01.plan_multiply(square, "unknown")
+
+    def test_multiply(self):
+        expected = self.mat_01.multiply(self.mat_02.T.materialize(), algorithm="naive").raw
+
+        self.assertListEqual(self.mat_01.multiply(self.mat_02.T).raw, expected)
+        self.assertListEqual(self.mat_01.multiply(self.mat_02.T, algorithm="blocked", block_size=2).raw, expected)
+
+        # lhs view: (A^T)^T . B^T
+        self.assertListEqual(self.mat_01.T.T.multiply(self.mat_02.T).raw, expected)
+
+        gram = self.mat_01.T.multiply(self.mat_01)
+        self.assertListEqual(gram.raw, self.mat_01.T.materialize().multiply(self.mat_01, algorithm="naive").raw)
+        self.assertEqual(self.mat_01.T.plan_multiply(self.mat_01), "dot_cached")
+
+        with self.assertRaises(MultiplicationDimensionMismatched):
+            self.mat_01.multiply(self.mat_02)
+
+    def test_multiply_float64(self):
+        lhs = Matrix(2, 3, [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], dtype="float64")
+        rhs = Matrix(2, 3, [[1.0, 0.0, -1.0], [0.5, 0.5, 0.5]], dtype="float64")
+
+        with matpak.use_backend("pure"):
+            self.assertEqual(lhs.plan_multiply(rhs.T), "dot_rows")
+            self.assertListEqual(lhs.multiply(rhs.T).tolist(), [[-2.0, 3.0], [-2.0, 7.5]])
+            self.assertListEqual(rhs.T.tolist(), [[1.0, 0.5], [0.0, 0.5], [-1.0, 0.5]])
+
+            # mixed dtypes are promoted to float64
+            self.assertListEqual(self.mat_01.T.multiply(Matrix(3, 1, [[1.0], [0.0], [0.0]], dtype="float64")).tolist(),
+                                 [[0.0], [0.125], [0.25], [0.375]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,10 @@ class TestVector(unittest.TestCase):
         with self.assertRaises(VectorDimensionInvalid):
             matpak.Vector(0)
 
+        for dtype in ("decimal", "float64", "fixed"):
+            with self.assertRaises(VectorDimensionInvalid):
+                matpak.Vector(3, [Decimal(1)], dtype)
+
     def test_vec_shape(self):
         # vector with initial vector values
         vec_01: matpak.Vector = matpak.Vector(3, [Decimal(1.0), Decimal(2.0), Decimal(3.0)])
@@ -67,6 +71,95 @@ class TestVector(unittest.TestCase):
             [Decimal(30.0), Decimal(33.0), Decimal(36.0)],
         ])
 
+    def test_vec_float64(self):
+        vec_01 = matpak.Vector(3, [Decimal(1.0), Decimal(2.0), Decimal(3.0)], dtype="float64")
+        mat_01 = matpak.Matrix(1, 2, [[2.0, 0.5]], dtype="float64")
+
+        self.assertEqual(vec_01.dtype, "float64")
+        self.assertEqual(vec_01.raw.itemsize, 8)
+
+        vec_01.set(2, 4.0)
+        self.assertEqual(vec_01.get(2), 4.0)
+        self.assertListEqual(vec_01.multiply(mat_01).tolist(), [[2.0, 0.5], [4.0, 1.0], [8.0, 2.0]])
+        self.assertListEqual(vec_01.astype("decimal").raw, [Decimal(1), Decimal(2), Decimal(4)])
+
+    def test_vec_multiply_out(self):
+        vec = matpak.Vector(2, [Decimal(1), Decimal(-2)])
+        out = matpak.Matrix(2, 2)
+
+        self.assertIs(vec.multiply(matpak.Matrix(1, 2, [[Decimal(3), Decimal(4)]]), out=out), out)
+        self.assertListEqual(out.raw, [[Decimal(3), Decimal(4)], [Decimal(-6), Decimal(-8)]])
+
+        with self.assertRaises(matpak.errors.MatrixDimensionInvalid):
+            vec.multiply(matpak.Matrix(1, 2), out=matpak.Matrix(2, 3))
+
+    def test_vec_inplace(self):
+        vec = matpak.Vector(2, [Decimal(1), Decimal(2)])
+        raw = vec.raw
+
+        self.assertIs(vec.imul_(matpak.Matrix(2, 2, [[Decimal(0), Decimal(1)], [Decimal(1), Decimal(1)]])), vec)
+        self.assertIs(vec.raw, raw)
+        self.assertListEqual(vec.raw, [Decimal(2), Decimal(3)])
+
+        vec.add_(matpak.Vector(2, [Decimal(1), Decimal(1)])).axpy(3, matpak.Vector(2, [Decimal(1), Decimal(0)]))
+        vec.scale_(Decimal("0.5"))
+        self.assertListEqual(vec.raw, [Decimal(3), Decimal(2)])
+
+        with self.assertRaises(matpak.errors.VectorDimensionInvalid):
+            vec.add_(matpak.Vector(3))
+
+        with self.assertRaises(ValueError):
+            vec.add_(matpak.Vector(2, dtype="float64"))
+
+        with matpak.use_backend("pure"):
+            vec = matpak.Vector(2, [1.0, 2.0], dtype="float64")
+            vec.imul_(matpak.Matrix(2, 2, [[2.0, 0.0], [1.0, 1.0]], dtype="float64")).axpy(0.5, vec).scale_(2)
+            self.assertListEqual(vec.tolist(), [6.0, 9.0])
+
+    def test_vec_from_iterable(self):
+        vec = matpak.Vector.from_iterable(Decimal(i) / 4 for i in range(3))
+        self.assertTupleEqual(vec.shape, (3, 1))
+        self.assertListEqual(vec.raw, [Decimal(0), Decimal("0.25"), Decimal("0.5")])
+
+        self.assertListEqual(matpak.Vector.from_iterable(range(3), "float64").tolist(), [0.0, 1.0, 2.0])
+        fixed = matpak.Vector.from_iterable(vec.raw, "fixed")
+        self.assertEqual(fixed.scale, 2)
+        self.assertListEqual(fixed.raw, [0, 25, 50])
+
+        # vectors keep no per-instance dict
+        with self.assertRaises(AttributeError):
+            vec.extra = 1
+
+        with self.assertRaises(VectorDimensionInvalid):
+            matpak.Vector.from_iterable([])
+
+    def test_vec_operators(self):
+        vec = matpak.Vector(2, [Decimal(1), Decimal(2)])
+        other = matpak.Vector(2, [Decimal("0.5"), Decimal(-1)])
+
+        self.assertListEqual((vec + other).raw, [Decimal("1.5"), Decimal(1)])
+        self.assertListEqual((vec - other).raw, [Decimal("0.5"), Decimal(3)])
+        self.assertListEqual((2 * vec).raw, [Decimal(2), Decimal(4)])
+        self.assertListEqual((-vec).raw, [Decimal(-1), Decimal(-2)])
+        self.assertListEqual((vec @ matpak.Matrix(1, 1, [[Decimal(3)]])).raw, [[Decimal(3)], [Decimal(6)]])
+        self.assertListEqual(vec.raw, [Decimal(1), Decimal(2)])
+
+        # mixed dtypes are computed in their common dtype
+        self.assertListEqual((vec.astype("float64") - other).tolist(), [0.5, 3.0])
+        self.assertListEqual((vec.astype("fixed") + other.astype("fixed")).raw, [15, 10])
+
+        raw = vec.raw
+        vec += other
+        vec *= 2
+        self.assertIs(vec.raw, raw)
+        self.assertListEqual(vec.raw, [Decimal(3), Decimal(2)])
+
+        with self.assertRaises(VectorDimensionInvalid):
+            vec + matpak.Vector(3)
+
+        with self.assertRaises(TypeError):
+            vec * vec
+
 
 if __name__ == "__main__":
     unittest.main()